@@ -8,12 +8,28 @@ import warnings
 warnings.filterwarnings('ignore')
 
 from helper import load_env
-from src import ProjectPlannerCrew, ProjectPlan
+from src import CrewPool, PlanCache, StageCache
+from src.frame import PlanFrame
+from src.gantt import (
+    MAX_GANTT_ROWS,
+    chart_height,
+    downsample_rows,
+    milestone_rows,
+    milestone_task_rows,
+    task_rows,
+)
+from src.routing import EndpointRouter
+from src.jobs import FAILED, JobQueue
+from src.store import PlanStore
+from src.retrieval import SimilarPlanIndex
+from src.views import PlanViews, ViewCache, plan_hash
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from datetime import datetime, timedelta
-import json
+from datetime import datetime
+from typing import Optional
+import os
+import time
 
 # Load environment variables
 load_env()
@@ -69,74 +85,215 @@ def initialize_session_state():
     """Initialize session state variables"""
     if 'planning_result' not in st.session_state:
         st.session_state.planning_result = None
-    if 'crew' not in st.session_state:
-        st.session_state.crew = None
+    if 'usage_metrics' not in st.session_state:
+        st.session_state.usage_metrics = None
     if 'planning_complete' not in st.session_state:
         st.session_state.planning_complete = False
+    if 'plan_hash' not in st.session_state:
+        st.session_state.plan_hash = None
+    if 'job_id' not in st.session_state:
+        # A reloaded page picks its running job back up from the URL
+        st.session_state.job_id = st.query_params.get('job')
+
+
+@st.cache_resource
+def get_plan_cache() -> PlanCache:
+    """Shared plan cache for all Streamlit sessions"""
+    return PlanCache()
+
+
+@st.cache_resource
+def get_stage_cache() -> StageCache:
+    """Shared cache of intermediate stage outputs for incremental re-planning"""
+    return StageCache()
+
+
+@st.cache_resource
+def get_llm_router() -> Optional[EndpointRouter]:
+    """Shared router over OPENAI_API_BASES, or None for a single endpoint"""
+    router = EndpointRouter.from_env()
+    return router.start() if router is not None else None
+
+
+@st.cache_resource
+def get_crew_pool() -> CrewPool:
+    """Shared pool of warm crews for all Streamlit sessions"""
+    pool_size = int(os.getenv('PLANNER_POOL_SIZE', '2'))
+    router = get_llm_router()
+    return CrewPool(
+        size=pool_size,
+        verbose=False,
+        cache=get_plan_cache(),
+        stage_cache=get_stage_cache(),
+        llm_factory=router.llm_factory() if router else None,
+        similar_plans=get_similar_plans(),
+        plan_retries=int(os.getenv('PLANNER_PLAN_RETRIES', '1'))
+    )
+
+
+@st.cache_resource
+def get_view_cache() -> ViewCache:
+    """Derived views (tables, figures, exports) of recently shown plans"""
+    return ViewCache(max_entries=int(os.getenv('PLANNER_VIEW_CACHE_SIZE', '16')))
+
+
+def current_views() -> PlanViews:
+    """Memoized views of the session's plan, shared across reruns"""
+    if st.session_state.plan_hash is None:
+        st.session_state.plan_hash = plan_hash(st.session_state.planning_result)
+    return get_view_cache().views(st.session_state.planning_result, st.session_state.plan_hash)
+
+
+@st.cache_resource
+def get_plan_store() -> PlanStore:
+    """Shared history of every generated plan"""
+    return PlanStore()
+
+
+@st.cache_resource
+def get_similar_plans() -> SimilarPlanIndex:
+    """Shared index of earlier plans, used to reuse or seed similar requests"""
+    return SimilarPlanIndex.from_store(get_plan_store())
+
+
+@st.cache_resource
+def get_job_queue() -> JobQueue:
+    """Shared background planning queue, so runs outlive the script thread"""
+    return JobQueue(get_crew_pool(), store=get_plan_store())
+
+
+def clear_job():
+    """Forget the session's planning job"""
+    st.session_state.job_id = None
+    st.query_params.pop('job', None)
 
 
-def create_gantt_chart(tasks_df: pd.DataFrame):
+def show_job_progress(job_id: str):
     """
-    Create a Gantt chart from tasks dataframe
-    
+    Poll a background planning job and render its progress
+
+    Reruns the script every second until the job has finished, then
+    moves its plan into the session or clears the failed job.
+
     Args:
-        tasks_df: DataFrame with tasks information
+        job_id: ID returned by JobQueue.submit
     """
-    # Calculate start and end dates
-    start_date = datetime.now()
-    
-    gantt_data = []
-    current_date = start_date
-    
-    for _, task in tasks_df.iterrows():
-        end_date = current_date + timedelta(hours=task['estimated_time_hours'])
-        gantt_data.append({
-            'Task': task['task_name'],
-            'Start': current_date,
-            'Finish': end_date,
-            'Resources': ', '.join(task['required_resources']) if isinstance(task['required_resources'], list) else task['required_resources']
-        })
-        current_date = end_date
-    
-    gantt_df = pd.DataFrame(gantt_data)
+    job = get_job_queue().get(job_id)
+    if job is None:
+        st.warning("⚠️ This planning job is no longer available.")
+        clear_job()
+        return
+
+    if job.finished:
+        clear_job()
+        if job.status == FAILED:
+            st.error(f"❌ An error occurred: {job.error}")
+            return
+        st.session_state.planning_result = job.plan
+        st.session_state.plan_hash = None
+        st.session_state.usage_metrics = job.usage
+        st.session_state.planning_complete = True
+        st.success("🎉 Project plan generated successfully!")
+        st.balloons()
+        st.rerun()
+
+    st.info("🤖 AI agents are planning your project... This may take 2-5 minutes. "
+            "You can close this page and come back with the same link.")
+    st.progress(int(job.progress * 100))
+    st.text(job.message or "⏳ Waiting for a free planner...")
+    time.sleep(1)
+    st.rerun()
+
+
+def create_gantt_chart(rows: pd.DataFrame, label: str = 'Task', title: str = 'Project Timeline (Gantt Chart)'):
+    """
+    Create a Gantt chart from timeline rows
     
+    Args:
+        rows: Rows from src.gantt (task_rows, milestone_rows, ...)
+        label: Column naming each bar ('Task' or 'Milestone')
+        title: Chart title
+    """
+    hover = [column for column in ('Resources', 'Tasks', 'Hours', 'Slack (h)', 'Critical') if column in rows]
     fig = px.timeline(
-        gantt_df,
+        rows,
         x_start='Start',
         x_end='Finish',
-        y='Task',
-        title='Project Timeline (Gantt Chart)',
-        color='Resources',
-        hover_data=['Resources']
+        y=label,
+        title=title,
+        color='Resources' if label == 'Task' else 'Critical',
+        hover_data=hover
     )
     
     fig.update_yaxes(autorange="reversed")
     fig.update_layout(
-        height=max(400, len(gantt_df) * 40),
+        height=chart_height(len(rows)),
         xaxis_title="Timeline",
-        yaxis_title="Tasks",
-        showlegend=True
+        yaxis_title=f"{label}s",
+        showlegend=label == 'Task' and len(rows) <= MAX_GANTT_ROWS
     )
     
     return fig
 
 
-def create_resource_chart(tasks_df: pd.DataFrame):
+def show_gantt(views: PlanViews):
     """
-    Create resource allocation pie chart
+    Render the Gantt chart, collapsing large plans into milestone bars
     
     Args:
-        tasks_df: DataFrame with tasks information
+        views: Memoized views of the plan
     """
-    # Flatten resources list and count
-    all_resources = []
-    for resources in tasks_df['required_resources']:
-        if isinstance(resources, list):
-            all_resources.extend(resources)
-        else:
-            all_resources.append(resources)
+    schedule, frame, start = views.schedule, views.frame, views.start_date
+    large = len(frame) > MAX_GANTT_ROWS
+    view = st.radio(
+        "Gantt view",
+        ["Tasks", "Milestones"],
+        index=1 if large and frame.milestone_names else 0,
+        horizontal=True,
+        label_visibility="collapsed"
+    )
+    
+    if view == "Milestones":
+        bars = views.get('milestone_rows', lambda: milestone_rows(schedule, frame, start))
+        st.plotly_chart(
+            views.get('milestone_gantt', lambda: create_gantt_chart(bars, label='Milestone', title='Milestone Timeline')),
+            use_container_width=True
+        )
+        if bars.empty:
+            return
+        choice = st.selectbox(
+            "🔍 Drill into milestone",
+            range(len(bars)),
+            format_func=lambda i: f"{bars['Milestone'].iloc[i]} ({bars['Tasks'].iloc[i]} tasks)"
+        )
+        milestone_index = int(bars['milestone_index'].iloc[choice])
+        key = ('task_gantt', milestone_index)
+        rows = lambda: milestone_task_rows(schedule, frame, milestone_index, start)
+        title = f"{bars['Milestone'].iloc[choice]} Tasks"
+    else:
+        key = ('task_gantt', None)
+        rows = lambda: task_rows(schedule, start)
+        title = 'Project Timeline (Gantt Chart)'
     
-    resource_counts = pd.Series(all_resources).value_counts()
+    def build():
+        kept, hidden = downsample_rows(rows())
+        return create_gantt_chart(kept, title=title), len(kept), hidden
+    
+    fig, shown, hidden = views.get(key, build)
+    st.plotly_chart(fig, use_container_width=True)
+    if hidden:
+        st.caption(f"Showing {shown} tasks (all critical ones first); {hidden} more are hidden. "
+                   "Switch to the milestone view to see every task grouped.")
+
+
+def create_resource_chart(frame: PlanFrame):
+    """
+    Create resource allocation pie chart
+    
+    Args:
+        frame: Columnar view of the project plan
+    """
+    resource_counts = frame.resource_counts()
     
     fig = px.pie(
         values=resource_counts.values,
@@ -175,16 +332,6 @@ def create_time_distribution_chart(tasks_df: pd.DataFrame):
     return fig
 
 
-def export_to_json(result: ProjectPlan):
-    """Export results to JSON format"""
-    return json.dumps(result.dict(), indent=2, ensure_ascii=False)
-
-
-def export_to_csv(tasks_df: pd.DataFrame):
-    """Export tasks to CSV format"""
-    return tasks_df.to_csv(index=False).encode('utf-8')
-
-
 def main():
     """Main Streamlit application"""
     
@@ -201,6 +348,56 @@ def main():
         
         st.info("💡 **Using Ollama (qwen3:1.7b)**\n\nFree local AI model for project planning")
         
+        use_cache = st.checkbox(
+            "⚡ Reuse cached plans",
+            value=True,
+            help="Return a stored plan instantly when the same inputs were planned before"
+        )
+        compact_context = st.checkbox(
+            "🗜️ Compact stage context",
+            value=False,
+            help="Pass a compact task table between agents instead of their full output, "
+                 "which cuts prompt tokens on small local models"
+        )
+        estimation_chunk_size = st.number_input(
+            "🧩 Estimation chunk size",
+            min_value=0,
+            max_value=50,
+            value=0,
+            help="Estimate tasks in parallel chunks of this many tasks (0 estimates all at once)"
+        )
+        requirement_cluster_size = st.number_input(
+            "🧱 Requirement group size",
+            min_value=0,
+            max_value=200,
+            value=0,
+            help="Plan long requirement lists in parallel groups of at most this many "
+                 "requirements and merge them (0 plans all requirements at once)"
+        )
+        reuse_similar = st.checkbox(
+            "🔁 Reuse near-identical plans",
+            value=False,
+            help="Return an earlier plan whose inputs are at least 90% similar instead of "
+                 "planning again (less similar plans are still shown to the agents as an example)"
+        )
+        cache_stats = get_plan_cache().stats()
+        st.caption(
+            f"Cache: {cache_stats['entries']} plans · "
+            f"{cache_stats['hits']} hits · {cache_stats['misses']} misses"
+        )
+        st.caption(f"History: {get_plan_store().count()} stored plans")
+        router = get_llm_router()
+        if router is not None:
+            with st.expander("🔀 LLM endpoints"):
+                for stats in router.stats():
+                    latency = stats['latency']
+                    st.caption(
+                        f"{'🟢' if stats['healthy'] else '🔴'} {stats['base_url']} · "
+                        f"{stats['outstanding']} in flight · {stats['requests']} requests · "
+                        f"{stats['failures']} failures"
+                        + (f" · p50 {latency['p50']:.2f}s" if latency else "")
+                    )
+        
         st.divider()
         
         st.markdown("### 📊 About")
@@ -218,13 +415,19 @@ def main():
         st.divider()
         
         if st.button("🔄 Reset Application"):
+            clear_job()
+            get_view_cache().discard(st.session_state.plan_hash)
+            st.session_state.plan_hash = None
             st.session_state.planning_result = None
-            st.session_state.crew = None
+            st.session_state.usage_metrics = None
             st.session_state.planning_complete = False
             st.rerun()
     
     # Main content
-    if not st.session_state.planning_complete:
+    if not st.session_state.planning_complete and st.session_state.job_id:
+        show_job_progress(st.session_state.job_id)
+
+    if not st.session_state.planning_complete and not st.session_state.job_id:
         # Input Form
         st.markdown("### 📝 Project Information")
         
@@ -333,67 +536,40 @@ def main():
                     st.warning("💡 All fields marked with * are required")
                     return
                 
-                # Show planning in progress
-                with st.spinner("🤖 AI agents are planning your project... This may take 2-5 minutes."):
-                    progress_bar = st.progress(0)
-                    status_text = st.empty()
-                    
-                    try:
-                        # Simulate progress
-                        status_text.text("🔍 Analyzing project requirements...")
-                        progress_bar.progress(20)
-                        
-                        # Create crew
-                        crew = ProjectPlannerCrew(verbose=False)
-                        st.session_state.crew = crew
-                        
-                        status_text.text("🤖 AI agents are working together...")
-                        progress_bar.progress(40)
-                        
-                        # Prepare inputs
-                        inputs = {
-                            'project_type': project_type,
-                            'project_objectives': project_objectives,
-                            'industry': industry,
-                            'team_members': team_members,
-                            'project_requirements': project_requirements
-                        }
-                        
-                        status_text.text("📋 Breaking down tasks...")
-                        progress_bar.progress(60)
-                        
-                        # Plan project
-                        result = crew.plan_project(inputs)
-                        
-                        status_text.text("⏱️ Estimating time and resources...")
-                        progress_bar.progress(80)
-                        
-                        st.session_state.planning_result = result
-                        st.session_state.planning_complete = True
-                        
-                        progress_bar.progress(100)
-                        status_text.text("✅ Planning complete!")
-                        
-                        st.success("🎉 Project plan generated successfully!")
-                        st.balloons()
-                        st.rerun()
-                        
-                    except Exception as e:
-                        st.error(f"❌ An error occurred: {str(e)}")
-                        st.exception(e)
-                        progress_bar.empty()
-                        status_text.empty()
+                # Prepare inputs
+                inputs = {
+                    'project_type': project_type,
+                    'project_objectives': project_objectives,
+                    'industry': industry,
+                    'team_members': team_members,
+                    'project_requirements': project_requirements
+                }
+                
+                # Plan in the background; reruns poll the job until it finishes
+                job_id = get_job_queue().submit(
+                    inputs,
+                    use_cache=use_cache,
+                    compact_context=compact_context,
+                    estimation_chunk_size=estimation_chunk_size or None,
+                    requirement_cluster_size=requirement_cluster_size or None,
+                    reuse_threshold=0.9 if reuse_similar else None
+                )
+                st.session_state.job_id = job_id
+                st.query_params['job'] = job_id
+                st.rerun()
     
     else:
         # Display Results
         result = st.session_state.planning_result
-        crew = st.session_state.crew
         
         st.markdown("### 🎉 Project Plan Generated Successfully!")
         
-        # Metrics
-        total_hours = sum(task.estimated_time_hours for task in result.tasks)
-        total_days = total_hours / 8
+        # Metrics (duration follows the dependency/resource schedule)
+        views = current_views()
+        schedule = views.schedule
+        frame = views.frame
+        total_hours = frame.total_hours
+        total_days = schedule.makespan_hours / 8
         
         col1, col2, col3, col4 = st.columns(4)
         
@@ -402,7 +578,11 @@ def main():
         with col2:
             st.metric("⏰ Total Hours", f"{total_hours:.1f}")
         with col3:
-            st.metric("📅 Estimated Days", f"{total_days:.1f}")
+            st.metric(
+                "📅 Estimated Days",
+                f"{total_days:.1f}",
+                help="Calendar duration with parallel work, based on task dependencies and team availability"
+            )
         with col4:
             st.metric("🎯 Milestones", len(result.milestones))
         
@@ -414,16 +594,7 @@ def main():
         with tab1:
             st.markdown("### 📋 Task Breakdown")
             
-            # Convert to DataFrame
-            tasks_data = []
-            for task in result.tasks:
-                tasks_data.append({
-                    'task_name': task.task_name,
-                    'estimated_time_hours': task.estimated_time_hours,
-                    'required_resources': ', '.join(task.required_resources) if isinstance(task.required_resources, list) else task.required_resources
-                })
-            
-            tasks_df = pd.DataFrame(tasks_data)
+            tasks_df = frame.tasks
             
             # Display as interactive table
             st.dataframe(
@@ -452,14 +623,22 @@ def main():
         with tab2:
             st.markdown("### 🎯 Project Milestones")
             
+            milestone_hours = frame.milestone_hours()
+            indexed = views.indexed
+            
             for i, milestone in enumerate(result.milestones, 1):
                 with st.container():
                     st.markdown(f"#### {i}. {milestone.milestone_name}")
                     
                     st.markdown(f"**📌 Tasks in this milestone:** {len(milestone.tasks)}")
+                    st.markdown(f"**⏱️ Hours:** {milestone_hours.iloc[i - 1]:.1f}")
                     
-                    for task in milestone.tasks:
-                        st.markdown(f"- {task}")
+                    for name in milestone.tasks:
+                        task = indexed.task(name)
+                        if task is None:
+                            st.markdown(f"- {name} ⚠️ *not in the task list*")
+                        else:
+                            st.markdown(f"- {name} ({task.estimated_time_hours:g} h)")
                     
                     st.divider()
         
@@ -467,63 +646,90 @@ def main():
             st.markdown("### 📊 Project Visualizations")
             
             # Time Distribution Chart
-            st.plotly_chart(create_time_distribution_chart(tasks_df), use_container_width=True)
+            st.plotly_chart(
+                views.get('time_chart', lambda: create_time_distribution_chart(tasks_df)),
+                use_container_width=True
+            )
+            
+            percentiles = frame.percentiles((50, 90))
+            st.caption(
+                f"⏱️ Median task: {percentiles[50]:.1f} h · "
+                f"90th percentile: {percentiles[90]:.1f} h"
+            )
             
             col1, col2 = st.columns(2)
             
             with col1:
                 # Resource Allocation Chart
-                st.plotly_chart(create_resource_chart(tasks_df), use_container_width=True)
+                st.plotly_chart(
+                    views.get('resource_chart', lambda: create_resource_chart(frame)),
+                    use_container_width=True
+                )
             
             with col2:
                 # Gantt Chart
-                st.plotly_chart(create_gantt_chart(tasks_df), use_container_width=True)
+                show_gantt(views)
+                if schedule.critical_path:
+                    st.caption("🔴 Critical path: " + " → ".join(schedule.critical_path))
         
         with tab4:
             st.markdown("### 💾 Export Options")
             
-            col1, col2 = st.columns(2)
+            col1, col2, col3 = st.columns(3)
             
             with col1:
                 st.markdown("#### 📄 Export to JSON")
-                json_data = export_to_json(result)
                 st.download_button(
                     label="⬇️ Download JSON",
-                    data=json_data,
+                    data=views.json_bytes,
                     file_name=f"project_plan_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
                     mime="application/json"
                 )
                 
                 with st.expander("👁️ Preview JSON"):
-                    st.json(result.dict())
+                    st.json(views.plan_dict)
             
             with col2:
                 st.markdown("#### 📊 Export to CSV")
-                csv_data = export_to_csv(tasks_df)
                 st.download_button(
                     label="⬇️ Download CSV",
-                    data=csv_data,
+                    data=views.csv_bytes,
                     file_name=f"project_tasks_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
                     mime="text/csv"
                 )
                 
                 with st.expander("👁️ Preview CSV"):
                     st.dataframe(tasks_df)
+            
+            with col3:
+                st.markdown("#### 📗 Export to Excel")
+                st.download_button(
+                    label="⬇️ Download XLSX",
+                    data=views.xlsx_bytes,
+                    file_name=f"project_plan_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+                )
+                st.caption("Tasks, milestones and resources sheets")
         
         # Usage Metrics (if available)
-        if crew:
-            metrics = crew.get_usage_metrics()
-            if metrics:
-                with st.expander("📊 Usage Metrics & Performance"):
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        st.metric("Total Tokens", f"{metrics['total_tokens']:,}")
-                    with col2:
-                        st.metric("Prompt Tokens", f"{metrics['prompt_tokens']:,}")
-                    with col3:
-                        st.metric("Completion Tokens", f"{metrics['completion_tokens']:,}")
-                    
-                    st.info("💡 Using Ollama - Completely Free! No API costs.")
+        metrics = st.session_state.usage_metrics
+        if metrics:
+            with st.expander("📊 Usage Metrics & Performance"):
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Total Tokens", f"{metrics['total_tokens']:,}")
+                with col2:
+                    st.metric("Prompt Tokens", f"{metrics['prompt_tokens']:,}")
+                with col3:
+                    st.metric("Completion Tokens", f"{metrics['completion_tokens']:,}")
+                
+                if metrics.get('context_tokens_saved'):
+                    st.caption(
+                        f"🗜️ Context compaction saved about "
+                        f"{metrics['context_tokens_saved']:,} prompt tokens"
+                    )
+                
+                st.info("💡 Using Ollama - Completely Free! No API costs.")
 
 
 if __name__ == "__main__":
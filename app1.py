@@ -9,6 +9,7 @@ warnings.filterwarnings('ignore')
 
 from helper import load_env
 from src import ProjectPlannerCrew, ProjectPlan
+from src.frame import PlanFrame
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
@@ -121,22 +122,14 @@ def create_gantt_chart(tasks_df: pd.DataFrame):
     return fig
 
 
-def create_resource_chart(tasks_df: pd.DataFrame):
+def create_resource_chart(frame: PlanFrame):
     """
     Create resource allocation pie chart
     
     Args:
-        tasks_df: DataFrame with tasks information
+        frame: Columnar view of the project plan
     """
-    # Flatten resources list and count
-    all_resources = []
-    for resources in tasks_df['required_resources']:
-        if isinstance(resources, list):
-            all_resources.extend(resources)
-        else:
-            all_resources.append(resources)
-    
-    resource_counts = pd.Series(all_resources).value_counts()
+    resource_counts = frame.resource_counts()
     
     fig = px.pie(
         values=resource_counts.values,
@@ -324,7 +317,8 @@ def main():
         st.markdown("### 🎉 Project Plan Generated Successfully!")
         
         # Metrics
-        total_hours = sum(task.estimated_time_hours for task in result.tasks)
+        frame = PlanFrame(result)
+        total_hours = frame.total_hours
         total_days = total_hours / 8
         
         col1, col2, col3, col4 = st.columns(4)
@@ -346,16 +340,7 @@ def main():
         with tab1:
             st.markdown("### 📋 Task Breakdown")
             
-            # Convert to DataFrame
-            tasks_data = []
-            for task in result.tasks:
-                tasks_data.append({
-                    'task_name': task.task_name,
-                    'estimated_time_hours': task.estimated_time_hours,
-                    'required_resources': ', '.join(task.required_resources) if isinstance(task.required_resources, list) else task.required_resources
-                })
-            
-            tasks_df = pd.DataFrame(tasks_data)
+            tasks_df = frame.tasks
             
             # Display as interactive table
             st.dataframe(
@@ -384,11 +369,14 @@ def main():
         with tab2:
             st.markdown("### 🎯 Project Milestones")
             
+            milestone_hours = frame.milestone_hours()
+            
             for i, milestone in enumerate(result.milestones, 1):
                 with st.container():
                     st.markdown(f"#### {i}. {milestone.milestone_name}")
                     
                     st.markdown(f"**📌 Tasks in this milestone:** {len(milestone.tasks)}")
+                    st.markdown(f"**⏱️ Hours:** {milestone_hours.iloc[i - 1]:.1f}")
                     
                     for task in milestone.tasks:
                         st.markdown(f"- {task}")
@@ -405,7 +393,7 @@ def main():
             
             with col1:
                 # Resource Allocation Chart
-                st.plotly_chart(create_resource_chart(tasks_df), use_container_width=True)
+                st.plotly_chart(create_resource_chart(frame), use_container_width=True)
             
             with col2:
                 # Gantt Chart
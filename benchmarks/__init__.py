@@ -0,0 +1,4 @@
+"""
+Benchmarks for the AI Project Planner.
+Times the planning pipeline against a local OpenAI-compatible stub server.
+"""
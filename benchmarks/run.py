@@ -0,0 +1,302 @@
+"""
+Benchmark suite for the AI Project Planner.
+Runs the real crew against the local stub LLM server and records crew
+construction time, end-to-end planning latency, concurrent throughput
+and peak memory as JSON that can be compared between commits.
+
+Usage:
+    python -m benchmarks.run --latency 0.05 --runs 5 --concurrency 1 2 4
+    python -m benchmarks.run --compare outputs/benchmarks/<old>.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from .stub_server import StubLLMServer
+
+
+BENCHMARK_INPUTS = {
+    'project_type': "Website",
+    'project_objectives': "Create a modern, responsive website for a small business",
+    'industry': "Technology",
+    'team_members': "John Doe (Project Manager), Jane Smith (Full-stack Developer)",
+    'project_requirements': "Responsive design, contact form, blog, SEO optimization",
+}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _summarize(samples: Sequence[float]) -> Dict[str, float]:
+    """Mean, median, p95, min and max of a list of timings"""
+    ordered = sorted(samples)
+    p95_index = min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))
+    return {
+        'mean': statistics.fmean(ordered),
+        'p50': statistics.median(ordered),
+        'p95': ordered[p95_index],
+        'min': ordered[0],
+        'max': ordered[-1],
+    }
+
+
+def _inputs(index: int) -> Dict[str, Any]:
+    # Distinct inputs so no cache layer can short-circuit a run
+    return {**BENCHMARK_INPUTS, 'project_requirements': f"{BENCHMARK_INPUTS['project_requirements']} #{index}"}
+
+
+def bench_construction(runs: int) -> Dict[str, Any]:
+    """Time building ProjectPlannerCrew instances (first build is cold)"""
+    from src.crew import ProjectPlannerCrew
+
+    samples = []
+    for _ in range(runs + 1):
+        started = time.perf_counter()
+        ProjectPlannerCrew(verbose=False)
+        samples.append(time.perf_counter() - started)
+    return {'cold_seconds': samples[0], 'warm_seconds': _summarize(samples[1:])}
+
+
+def bench_latency(server: StubLLMServer, runs: int) -> Dict[str, Any]:
+    """Time sequential plan_project calls on one crew"""
+    from src.crew import ProjectPlannerCrew
+
+    crew = ProjectPlannerCrew(verbose=False)
+    samples = []
+    requests_before = server.requests
+    for index in range(runs):
+        crew.reset()
+        started = time.perf_counter()
+        crew.plan_project(_inputs(index), use_cache=False)
+        samples.append(time.perf_counter() - started)
+
+    requests_per_run = (server.requests - requests_before) / runs
+    model_seconds = requests_per_run * server.latency
+    summary = _summarize(samples)
+    return {
+        'seconds': summary,
+        'llm_requests_per_run': requests_per_run,
+        'model_seconds_per_run': model_seconds,
+        'overhead_seconds': summary['mean'] - model_seconds,
+        'tokens_per_run': crew.get_usage_metrics(),
+    }
+
+
+def bench_throughput(concurrency_levels: Sequence[int], plans_per_worker: int) -> Dict[str, Any]:
+    """Measure plans per second with plan_many_async at each concurrency level"""
+    from src.crew import ProjectPlannerCrew
+
+    crew = ProjectPlannerCrew(verbose=False)
+    results = {}
+    offset = 10_000
+    for level in concurrency_levels:
+        count = level * plans_per_worker
+        inputs_list = [_inputs(offset + index) for index in range(count)]
+        offset += count
+        started = time.perf_counter()
+        plans = asyncio.run(crew.plan_many_async(
+            inputs_list, max_concurrency=level, use_cache=False, return_exceptions=True
+        ))
+        elapsed = time.perf_counter() - started
+        failures = sum(isinstance(plan, BaseException) for plan in plans)
+        results[str(level)] = {
+            'plans': count,
+            'failures': failures,
+            'seconds': elapsed,
+            'plans_per_second': (count - failures) / elapsed if elapsed else 0.0,
+        }
+    return results
+
+
+def bench_memory() -> Dict[str, Any]:
+    """Peak Python allocations of one build-and-plan cycle, plus process RSS where available"""
+    from src.crew import ProjectPlannerCrew
+
+    tracemalloc.start()
+    try:
+        crew = ProjectPlannerCrew(verbose=False)
+        crew.plan_project(_inputs(-1), use_cache=False)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    memory = {'traced_peak_mb': peak / 2**20}
+    try:
+        import resource
+    except ImportError:
+        # Not available on Windows; comparisons skip metrics one side lacks
+        return memory
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is bytes on macOS and kilobytes elsewhere
+    rss_bytes = max_rss if sys.platform == "darwin" else max_rss * 1024
+    memory['max_rss_mb'] = rss_bytes / 2**20
+    return memory
+
+
+def run_benchmarks(
+    latency: float = 0.05,
+    runs: int = 5,
+    concurrency: Sequence[int] = (1, 2, 4),
+    plans_per_worker: int = 2,
+    base_url: str = "http://127.0.0.1:0/v1"
+) -> Dict[str, Any]:
+    """
+    Run every benchmark against a fresh stub server
+
+    OPENAI_API_BASE, OPENAI_API_KEY and OPENAI_MODEL_NAME are pointed at
+    the stub for the duration of the run and restored afterwards.
+
+    Args:
+        latency: Simulated model latency per LLM request, in seconds
+        runs: Number of timed runs for construction and latency
+        concurrency: Concurrency levels for the throughput benchmark
+        plans_per_worker: Plans per concurrent worker in throughput runs
+        base_url: Address for the stub server (port 0 picks a free port)
+
+    Returns:
+        Machine-readable results dictionary
+    """
+    if runs < 1:
+        raise ValueError("runs must be at least 1")
+
+    saved_env = {key: os.environ.get(key) for key in ('OPENAI_API_BASE', 'OPENAI_API_KEY', 'OPENAI_MODEL_NAME')}
+    with StubLLMServer(base_url=base_url, latency=latency) as server:
+        os.environ['OPENAI_API_BASE'] = server.base_url
+        os.environ['OPENAI_API_KEY'] = 'stub'
+        os.environ['OPENAI_MODEL_NAME'] = 'stub-model'
+        try:
+            results = {
+                'construction': bench_construction(runs),
+                'latency': bench_latency(server, runs),
+                'throughput': bench_throughput(concurrency, plans_per_worker),
+                'memory': bench_memory(),
+            }
+        finally:
+            for key, value in saved_env.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+    try:
+        from importlib.metadata import version
+        crewai_version = version("crewai")
+    except Exception:
+        crewai_version = None
+
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'crewai': crewai_version,
+        'parameters': {
+            'latency': latency,
+            'runs': runs,
+            'concurrency': list(concurrency),
+            'plans_per_worker': plans_per_worker,
+        },
+        'results': results,
+    }
+
+
+def _flatten(data: Dict[str, Any], prefix: str = "") -> Dict[str, float]:
+    flat = {}
+    for key, value in data.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            flat.update(_flatten(value, f"{name}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[name] = float(value)
+    return flat
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Compare two result files metric by metric
+
+    Args:
+        baseline: Earlier output of run_benchmarks
+        current: Newer output of run_benchmarks
+
+    Returns:
+        One row per shared metric with both values and the relative change
+    """
+    old = _flatten(baseline['results'])
+    new = _flatten(current['results'])
+    rows = []
+    for name in sorted(old.keys() & new.keys()):
+        change = (new[name] - old[name]) / old[name] if old[name] else None
+        rows.append({'metric': name, 'baseline': old[name], 'current': new[name], 'change': change})
+    return rows
+
+
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="AI Project Planner benchmarks")
+    parser.add_argument("--latency", type=float, default=0.05,
+                        help="Simulated model latency per LLM request in seconds")
+    parser.add_argument("--runs", type=int, default=5,
+                        help="Timed runs for construction and latency benchmarks")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4],
+                        help="Concurrency levels for the throughput benchmark")
+    parser.add_argument("--plans-per-worker", type=int, default=2,
+                        help="Plans per concurrent worker in throughput runs")
+    parser.add_argument("--base-url", default="http://127.0.0.1:0/v1",
+                        help="Address for the stub LLM server (port 0 picks a free port)")
+    parser.add_argument("--output", default=None,
+                        help="Result file (default: outputs/benchmarks/<commit>-<timestamp>.json)")
+    parser.add_argument("--compare", metavar="BASELINE_JSON",
+                        help="Print the change against an earlier result file")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+
+    report = run_benchmarks(
+        latency=args.latency,
+        runs=args.runs,
+        concurrency=args.concurrency,
+        plans_per_worker=args.plans_per_worker,
+        base_url=args.base_url
+    )
+
+    output = Path(args.output or (
+        f"outputs/benchmarks/{report['commit'] or 'nogit'}-"
+        f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    ))
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding='utf-8')
+
+    latency = report['results']['latency']
+    print(f"\n⏱️  Plan latency p50: {latency['seconds']['p50']:.3f}s "
+          f"(overhead {latency['overhead_seconds']:.3f}s per run)")
+    for level, stats in report['results']['throughput'].items():
+        print(f"🚀 Concurrency {level}: {stats['plans_per_second']:.2f} plans/s")
+    print(f"🧠 Peak traced memory: {report['results']['memory']['traced_peak_mb']:.1f} MB")
+    print(f"💾 Results written to: {output}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text(encoding='utf-8'))
+        print(f"\n📊 Compared with {baseline.get('commit')} ({args.compare}):")
+        for row in compare_results(baseline, report):
+            change = f"{row['change']:+.1%}" if row['change'] is not None else "n/a"
+            print(f"  {row['metric']:<45} {row['baseline']:>12.4f} → {row['current']:>12.4f}  {change}")
@@ -0,0 +1,186 @@
+"""
+OpenAI-compatible stub LLM server for benchmarking the AI Project Planner.
+Answers every chat completion with a canned response after a configurable
+delay, so planning runs can be timed without a real model.
+"""
+
+import json
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional
+from urllib.parse import urlparse
+
+from src.models import ProjectPlan
+
+
+def canned_plan(task_count: int = 12, milestone_count: int = 3) -> ProjectPlan:
+    """
+    Build a valid ProjectPlan of a given size
+
+    Args:
+        task_count: Number of tasks in the plan
+        milestone_count: Number of milestones the tasks are spread over
+
+    Returns:
+        Deterministic ProjectPlan
+    """
+    roles = ["Frontend Developer", "Backend Developer", "UI Designer", "QA Engineer"]
+    tasks = [
+        {
+            'task_name': f"Task {index + 1}",
+            'estimated_time_hours': float(4 + index % 5 * 2),
+            'required_resources': [roles[index % len(roles)]],
+            'dependencies': [f"Task {index}"] if index else [],
+            'assignees': [roles[index % len(roles)]],
+        }
+        for index in range(task_count)
+    ]
+    milestone_count = max(1, min(milestone_count, task_count or 1))
+    milestones = [
+        {
+            'milestone_name': f"Milestone {number + 1}",
+            'tasks': [task['task_name'] for task in tasks[number::milestone_count]],
+        }
+        for number in range(milestone_count)
+    ]
+    return ProjectPlan.model_validate({'tasks': tasks, 'milestones': milestones})
+
+
+class StubLLMServer:
+    """Threaded HTTP server implementing /v1/chat/completions and /v1/models"""
+
+    def __init__(
+        self,
+        base_url: str = "http://127.0.0.1:0/v1",
+        latency: float = 0.0,
+        response: Optional[str] = None,
+        structured_response: Optional[str] = None,
+        completion_tokens: int = 200,
+        responder: Optional[Callable[[Dict[str, Any]], Optional[str]]] = None
+    ):
+        """
+        Initialize the stub server (call start() or use it as a context manager)
+
+        Args:
+            base_url: URL to serve at; port 0 picks a free port
+            latency: Seconds to wait before answering each completion
+            response: Content returned by plain completions (defaults to a
+                final answer containing a valid ProjectPlan)
+            structured_response: Content returned when the request asks for
+                a response_format (defaults to the ProjectPlan JSON)
+            completion_tokens: Completion token count reported in usage
+            responder: Called with each request body; a non-None return
+                value is used as the content instead of the canned one
+        """
+        parsed = urlparse(base_url)
+        self.host = parsed.hostname or "127.0.0.1"
+        self.port = parsed.port or 0
+        self.path_prefix = parsed.path.rstrip('/')
+        self.latency = latency
+        plan_json = canned_plan().model_dump_json()
+        self.response = response or f"Thought: I now know the final answer\nFinal Answer: {plan_json}"
+        self.structured_response = structured_response or plan_json
+        self.completion_tokens = completion_tokens
+        self.responder = responder
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """URL clients should use as OPENAI_API_BASE"""
+        return f"http://{self.host}:{self.port}{self.path_prefix}"
+
+    def start(self) -> "StubLLMServer":
+        """Bind the socket and serve requests on a background thread"""
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.rstrip('/').endswith('/models'):
+                    self._send(200, {'object': 'list', 'data': [{'id': 'stub', 'object': 'model'}]})
+                else:
+                    self._send(404, {'error': {'message': 'not found'}})
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length') or 0)
+                try:
+                    body = json.loads(self.rfile.read(length) or b'{}')
+                except json.JSONDecodeError:
+                    self._send(400, {'error': {'message': 'invalid JSON'}})
+                    return
+                if not self.path.rstrip('/').endswith('/chat/completions'):
+                    self._send(404, {'error': {'message': 'not found'}})
+                    return
+                self._send(200, stub._complete(body))
+
+            def _send(self, status: int, payload: Dict[str, Any]):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Shut the server down"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StubLLMServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _complete(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        """Build a chat completion response for a request body"""
+        with self._lock:
+            self.requests += 1
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.latency:
+                time.sleep(self.latency)
+            content = self.responder(body) if self.responder else None
+        finally:
+            with self._lock:
+                self.in_flight -= 1
+
+        if content is None:
+            content = self.structured_response if body.get('response_format') else self.response
+        prompt_chars = sum(len(str(m.get('content') or '')) for m in body.get('messages', []))
+        prompt_tokens = prompt_chars // 4
+        return {
+            'id': f"chatcmpl-{uuid.uuid4().hex}",
+            'object': 'chat.completion',
+            'created': int(time.time()),
+            'model': body.get('model', 'stub'),
+            'choices': [{
+                'index': 0,
+                'message': {'role': 'assistant', 'content': content},
+                'finish_reason': 'stop',
+            }],
+            'usage': {
+                'prompt_tokens': prompt_tokens,
+                'completion_tokens': self.completion_tokens,
+                'total_tokens': prompt_tokens + self.completion_tokens,
+            },
+        }
@@ -1,10 +1,19 @@
 import os
 from dotenv import load_dotenv
 
+from src.routing import parse_endpoints
+
 def load_env():
     """Load environment variables from .env file"""
     load_dotenv()
     
+    # OPENAI_API_BASES lists several endpoints; the first is the default
+    endpoints = parse_endpoints(os.getenv('OPENAI_API_BASES'))
+    if endpoints and not os.getenv('OPENAI_API_BASE'):
+        os.environ['OPENAI_API_BASE'] = endpoints[0]
+        os.environ.setdefault('OPENAI_MODEL_NAME', 'qwen3:1.7b')
+        os.environ.setdefault('OPENAI_API_KEY', 'ollama')
+    
     # Set Ollama as default if not configured
     if not os.getenv('OPENAI_API_BASE'):
         os.environ['OPENAI_API_BASE'] = 'http://localhost:11434/v1'
@@ -12,4 +21,6 @@ def load_env():
         os.environ['OPENAI_API_KEY'] = 'ollama'
         print("Ollama (qwen3:1.7b) configured successfully!")
     
-    print(f" Using model: {os.getenv('OPENAI_MODEL_NAME')}")
\ No newline at end of file
+    print(f" Using model: {os.getenv('OPENAI_MODEL_NAME')}")
+    if len(endpoints) > 1:
+        print(f" Routing across {len(endpoints)} endpoints: {', '.join(endpoints)}")
\ No newline at end of file
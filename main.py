@@ -7,9 +7,19 @@ import warnings
 warnings.filterwarnings('ignore')
 
 from helper import load_env
-from src import ProjectPlannerCrew, ProjectPlan
-import json
-from pathlib import Path
+from src import ProjectPlannerCrew, ProjectPlan, PlanCache, StageCache
+from src.batch import run_batch
+from src.cassette import Cassette
+from src.events import PlanningEvent, format_event
+from src.export import TABLES, export_plans, iter_batch_plans
+from src.repair import repair_stats
+from src.validation import plan_repair_stats
+from src.routing import EndpointRouter
+from src.scheduler import schedule_plan
+from src.retrieval import SimilarPlanIndex
+from src.store import PlanStore
+import argparse
+from datetime import datetime
 
 # Load environment variables
 load_env()
@@ -25,25 +35,79 @@ def print_separator(title: str = ""):
         print(f"\n{'='*60}\n")
 
 
-def save_results(result: ProjectPlan, output_dir: str = "outputs"):
+def print_event(event: PlanningEvent):
+    """Print a live progress event from the planning crew"""
+    print(format_event(event))
+
+
+def save_results(
+    result: ProjectPlan,
+    inputs: dict,
+    store_path: str = "outputs/plans.db",
+    cached: bool = False
+):
     """
-    Save planning results to JSON file
+    Save planning results to the plan store
     
     Args:
         result: ProjectPlan object
-        output_dir: Directory to save results
+        inputs: Planning inputs the plan was made from
+        store_path: SQLite plan store file
+        cached: The plan came from the cache or reused a stored plan, so
+            it is already in the store and is not added again
     """
-    # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(exist_ok=True)
+    if cached:
+        print(f"💾 Plan was cached or reused; not stored again in {store_path}")
+        return
+    
+    with PlanStore(store_path) as store:
+        plan_id = store.add(result, inputs)
+        total = store.count()
     
-    # Convert to dict and save
-    result_dict = result.dict()
-    output_file = Path(output_dir) / "project_plan.json"
+    print(f"💾 Plan #{plan_id} saved to: {store_path} ({total} plans stored)")
+
+
+def print_history(store_path: str = "outputs/plans.db", limit: int = 20):
+    """
+    Display the most recently stored plans
+    
+    Args:
+        store_path: SQLite plan store file
+        limit: Number of plans to list
+    """
+    print_separator("🗂️ PLAN HISTORY")
+    with PlanStore(store_path) as store:
+        rows = store.query(limit=limit)
+        total = store.count()
     
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(result_dict, f, indent=2, ensure_ascii=False)
+    for row in rows:
+        created = datetime.fromtimestamp(row.created_at).strftime("%Y-%m-%d %H:%M")
+        print(f"#{row.plan_id:<5} {created}  {row.project_type} · {row.industry} · "
+              f"{row.task_count} tasks · {row.total_hours:g} hours")
+    print(f"\nShowing {len(rows)} of {total} stored plans")
+
+
+def export_history(path: str, source=None, table: str = 'tasks', store_path: str = "outputs/plans.db"):
+    """
+    Stream stored or batch-planned plans to an export file
     
-    print(f"💾 Results saved to: {output_file}")
+    Args:
+        path: Output file; the format follows its extension
+            (.jsonl, .csv, .xlsx or .parquet)
+        source: Batch results JSONL to export instead of the plan store
+        table: Table written by the single-table CSV and Parquet formats
+        store_path: SQLite plan store file
+    """
+    print_separator(f"💾 EXPORT: {path}")
+    options = {'table': table} if path.lower().endswith(('.csv', '.parquet')) else {}
+    if source:
+        count = export_plans(iter_batch_plans(source), path, **options)
+    else:
+        with PlanStore(store_path) as store:
+            records = ((str(plan_id), plan) for plan_id, plan in store.iter_plans())
+            count = export_plans(records, path, **options)
+    unit = f"{table} rows" if options else "plans"
+    print(f"✅ Exported {count} {unit} from {source or store_path}")
 
 
 def display_results(result: ProjectPlan):
@@ -67,7 +131,14 @@ def display_results(result: ProjectPlan):
         print()
         total_hours += task.estimated_time_hours
     
-    print(f"⏰ Total Estimated Time: {total_hours} hours ({total_hours/8:.1f} days)\n")
+    print(f"⏰ Total Estimated Time: {total_hours} hours ({total_hours/8:.1f} days)")
+    
+    schedule = schedule_plan(result)
+    print(f"📅 Scheduled Duration: {schedule.makespan_hours:.1f} hours "
+          f"({schedule.makespan_hours/8:.1f} days with parallel work)")
+    if schedule.critical_path:
+        print(f"🔴 Critical Path: {' → '.join(schedule.critical_path)}")
+    print()
     
     print_separator("🎯 MILESTONES")
     
@@ -79,7 +150,17 @@ def display_results(result: ProjectPlan):
         print()
 
 
-def example_website_project():
+def example_website_project(
+    use_cache: bool = True,
+    compact_context: bool = False,
+    llm_factory=None,
+    estimation_chunk_size=None,
+    estimation_workers: int = 4,
+    requirement_cluster_size=None,
+    similar_plans=None,
+    reuse_threshold=None,
+    plan_retries: int = 1
+):
     """Example: Website project planning"""
     
     print_separator("🚀 WEBSITE PROJECT PLANNING")
@@ -116,7 +197,19 @@ def example_website_project():
     print(f"\n👥 Team Members:{team_members}")
     
     # Create crew and plan project
-    crew = ProjectPlannerCrew(verbose=True)
+    crew = ProjectPlannerCrew(
+        verbose=True,
+        cache=PlanCache(),
+        stage_cache=StageCache(),
+        compact_context=compact_context,
+        llm_factory=llm_factory,
+        estimation_chunk_size=estimation_chunk_size,
+        estimation_workers=estimation_workers,
+        requirement_cluster_size=requirement_cluster_size,
+        similar_plans=similar_plans,
+        reuse_threshold=reuse_threshold,
+        plan_retries=plan_retries
+    )
     
     inputs = {
         'project_type': project_type,
@@ -127,22 +220,38 @@ def example_website_project():
     }
     
     try:
-        result = crew.plan_project(inputs)
+        result = crew.plan_project(inputs, use_cache=use_cache, on_event=print_event)
         
         # Display results
         display_results(result)
         
         # Save results
-        save_results(result)
+        save_results(result, inputs, cached=crew.last_result_cached)
         
         # Display metrics if available
         metrics = crew.get_usage_metrics()
-        if metrics:
+        if metrics and not crew.last_result_cached:
             print_separator("📊 USAGE METRICS")
             print(f"Total Tokens: {metrics['total_tokens']:,}")
             print(f"Prompt Tokens: {metrics['prompt_tokens']:,}")
             print(f"Completion Tokens: {metrics['completion_tokens']:,}")
             print(f"Successful Requests: {metrics['successful_requests']}")
+            if metrics['context_tokens_saved']:
+                print(f"Context Tokens Saved (est.): {metrics['context_tokens_saved']:,}")
+            repairs = repair_stats.snapshot()
+            if repairs.get('repaired') or repairs.get('failed'):
+                fired = ", ".join(
+                    f"{name.split('.', 1)[1]} ×{count}"
+                    for name, count in sorted(repairs.items()) if name.startswith('repair.')
+                )
+                print(f"Plan Output Repairs: {fired or 'none'} (failed: {repairs.get('failed', 0)})")
+            fixes = plan_repair_stats.snapshot()
+            if fixes.get('repaired') or fixes.get('failed'):
+                fired = ", ".join(
+                    f"{name.split('.', 1)[1]} ×{count}"
+                    for name, count in sorted(fixes.items()) if name.startswith('repair.')
+                )
+                print(f"Plan Reference Repairs: {fired or 'none'} (unrepairable: {fixes.get('failed', 0)})")
             
             # Calculate cost (for Ollama it's free, but show for reference)
             cost = crew.calculate_cost()
@@ -158,7 +267,17 @@ def example_website_project():
         raise
 
 
-def example_mobile_app_project():
+def example_mobile_app_project(
+    use_cache: bool = True,
+    compact_context: bool = False,
+    llm_factory=None,
+    estimation_chunk_size=None,
+    estimation_workers: int = 4,
+    requirement_cluster_size=None,
+    similar_plans=None,
+    reuse_threshold=None,
+    plan_retries: int = 1
+):
     """Example: Mobile app project planning"""
     
     print_separator("📱 MOBILE APP PROJECT PLANNING")
@@ -188,16 +307,190 @@ def example_mobile_app_project():
         """
     }
     
-    crew = ProjectPlannerCrew(verbose=True)
-    result = crew.plan_project(inputs)
+    crew = ProjectPlannerCrew(
+        verbose=True,
+        cache=PlanCache(),
+        stage_cache=StageCache(),
+        compact_context=compact_context,
+        llm_factory=llm_factory,
+        estimation_chunk_size=estimation_chunk_size,
+        estimation_workers=estimation_workers,
+        requirement_cluster_size=requirement_cluster_size,
+        similar_plans=similar_plans,
+        reuse_threshold=reuse_threshold,
+        plan_retries=plan_retries
+    )
+    result = crew.plan_project(inputs, use_cache=use_cache, on_event=print_event)
     
     display_results(result)
-    save_results(result, output_dir="outputs/mobile_app")
+    save_results(result, inputs, cached=crew.last_result_cached)
     
     return result
 
 
+def parse_args():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="AI Project Planner demo")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Bypass the plan cache and always run the crew"
+    )
+    parser.add_argument(
+        "--compact-context",
+        action="store_true",
+        help="Pass a compact task table between stages instead of full agent output"
+    )
+    parser.add_argument(
+        "--estimation-chunk-size",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Estimate the task breakdown in parallel chunks of N tasks"
+    )
+    parser.add_argument(
+        "--estimation-workers",
+        type=int,
+        default=4,
+        help="Maximum concurrent estimation calls with --estimation-chunk-size"
+    )
+    parser.add_argument(
+        "--requirement-cluster-size",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Plan long requirement lists in parallel groups of at most N requirements"
+    )
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument(
+        "--record-cassette",
+        metavar="PATH",
+        help="Record every LLM request/response of the run into a cassette file"
+    )
+    cassette.add_argument(
+        "--replay-cassette",
+        metavar="PATH",
+        help="Answer LLM requests from a recorded cassette instead of the model"
+    )
+    parser.add_argument(
+        "--reuse-similar",
+        type=float,
+        nargs="?",
+        const=0.9,
+        default=None,
+        metavar="SCORE",
+        help="Return a stored plan whose inputs are at least this similar (default 0.9) instead of planning"
+    )
+    parser.add_argument(
+        "--plan-retries",
+        type=int,
+        default=1,
+        help="Final-stage re-runs for plans that local repair cannot fix"
+    )
+    parser.add_argument(
+        "--history",
+        action="store_true",
+        help="List the most recently stored plans and exit"
+    )
+    parser.add_argument(
+        "--export",
+        metavar="PATH",
+        help="Export the plan store (or --export-from results) to .jsonl, .csv, .xlsx or .parquet and exit"
+    )
+    parser.add_argument(
+        "--export-from",
+        metavar="BATCH_JSONL",
+        help="Export the successful plans of a batch results file instead of the plan store"
+    )
+    parser.add_argument(
+        "--export-table",
+        choices=list(TABLES),
+        default="tasks",
+        help="Table written by the CSV and Parquet exports"
+    )
+    parser.add_argument(
+        "--batch",
+        metavar="INPUT_JSONL",
+        help="Plan every request in a JSONL file instead of running the demo"
+    )
+    parser.add_argument(
+        "--output",
+        default="outputs/batch_results.jsonl",
+        help="JSONL file for batch results; existing successful IDs are skipped"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Number of concurrent planning runs in batch mode"
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=None,
+        help="Per-request timeout in seconds for batch mode"
+    )
+    return parser.parse_args()
+
+
+def print_endpoint_stats(router):
+    """Display per-endpoint routing and latency stats"""
+    print_separator("🔀 LLM ENDPOINTS")
+    for stats in router.stats():
+        status = "✅" if stats['healthy'] else "❌"
+        latency = stats['latency']
+        timing = f"p50 {latency['p50']:.2f}s, p95 {latency['p95']:.2f}s" if latency else "no requests"
+        print(f"{status} {stats['base_url']}: {stats['requests']} requests, "
+              f"{stats['failures']} failures, {timing}")
+
+
+def run_batch_mode(args, router=None):
+    """Non-interactive batch planning from a JSONL file"""
+    print_separator(f"📦 BATCH PLANNING: {args.batch}")
+    
+    summary = run_batch(
+        args.batch,
+        args.output,
+        workers=args.workers,
+        timeout=args.timeout,
+        cache=PlanCache(),
+        use_cache=not args.no_cache,
+        compact_context=args.compact_context,
+        llm_factory=router.llm_factory() if router else None
+    )
+    
+    print_separator("📊 BATCH SUMMARY")
+    print(f"Total requests: {summary['total']}")
+    print(f"Skipped (already done): {summary['skipped']}")
+    print(f"Succeeded: {summary['succeeded']}")
+    print(f"Failed: {summary['failed']}")
+    print(f"\n💾 Results written to: {args.output}")
+    
+    return summary
+
+
 if __name__ == "__main__":
+    args = parse_args()
+    
+    if args.history:
+        print_history()
+        raise SystemExit(0)
+    
+    if args.export:
+        export_history(args.export, args.export_from, args.export_table)
+        raise SystemExit(0)
+    
+    # Spread traffic over OPENAI_API_BASES when several endpoints are configured
+    router = EndpointRouter.from_env()
+    if router is not None:
+        router.start()
+    
+    if args.batch:
+        run_batch_mode(args, router)
+        if router is not None:
+            print_endpoint_stats(router)
+        raise SystemExit(0)
+    
     print("""
     ╔═══════════════════════════════════════════════════════════╗
     ║                                                           ║
@@ -216,11 +509,38 @@ if __name__ == "__main__":
     
     choice = input("Enter choice (1 or 2, press Enter for default): ").strip()
     
+    cassette = None
+    if args.record_cassette:
+        cassette = Cassette(args.record_cassette, mode="record")
+    elif args.replay_cassette:
+        cassette = Cassette(args.replay_cassette, mode="replay")
+    options = {
+        'use_cache': not args.no_cache,
+        'compact_context': args.compact_context,
+        'llm_factory': router.llm_factory() if router else None,
+        'estimation_chunk_size': args.estimation_chunk_size,
+        'estimation_workers': args.estimation_workers,
+        'requirement_cluster_size': args.requirement_cluster_size,
+        'reuse_threshold': args.reuse_similar,
+        'plan_retries': args.plan_retries,
+    }
+    
+    if cassette is not None:
+        options['llm_factory'] = cassette.llm_factory(options['llm_factory'])
+    else:
+        # Reference examples change the prompts, so cassette runs plan without them
+        options['similar_plans'] = SimilarPlanIndex.from_store(PlanStore())
+    
     try:
         if choice == "2":
-            result = example_mobile_app_project()
+            result = example_mobile_app_project(**options)
         else:
-            result = example_website_project()
+            result = example_website_project(**options)
+        
+        if cassette is not None and cassette.mode == "record":
+            cassette.save()
+        if router is not None:
+            print_endpoint_stats(router)
         
         print("\n✨ Demo completed successfully!")
         
@@ -9,6 +9,13 @@ Main Components:
     - Tasks: Configurable tasks for the agents to perform
     - Models: Pydantic models for structured output
     - Crew: Orchestration layer that coordinates agents and tasks
+    - Cache: Persistent cache for finished project plans
+    - Pool: Warm, reusable crews for concurrent planning requests
+    - Jobs: Background planning queue with persisted job status
+    - Store: Indexed SQLite history of every finished plan
+    - Retrieval: Similar-plan index to reuse or seed planning
+    - Events: Structured progress events emitted during a planning run
+    - Cassette: Record/replay of LLM calls for model-free pipeline runs
 
 Usage:
     from src import ProjectPlannerCrew, plan_project
@@ -25,22 +32,73 @@ Usage:
     # Detailed control
     crew = ProjectPlannerCrew(verbose=True)
     result = crew.plan_project(inputs)
+    
+    # Many projects concurrently (inside an event loop)
+    results = await crew.plan_many_async(inputs_list, max_concurrency=4)
 """
 
 __version__ = "0.1.0"
 __author__ = "AI Project Planner Team"
 
-# Import main classes and functions for easy access
-from .agents import ProjectAgents, create_agents
-from .tasks import ProjectTasks, create_tasks
+import importlib
+from typing import TYPE_CHECKING
+
+# Lightweight modules (no CrewAI dependency) are imported eagerly
 from .models import TaskEstimate, Milestone, ProjectPlan
-from .crew import ProjectPlannerCrew, plan_project
+from .cache import PlanCache, StageCache, compute_cache_key
+from .events import PlanningEvent, format_event
+
+# Symbols that pull in CrewAI are loaded on first attribute access, so
+# importing the package (or just src.models) stays fast
+_LAZY_IMPORTS = {
+    "ProjectPlannerCrew": ".crew",
+    "plan_project": ".crew",
+    "CrewPool": ".pool",
+    "JobQueue": ".jobs",
+    "PlanStore": ".store",
+    "SimilarPlanIndex": ".retrieval",
+    "ProjectAgents": ".agents",
+    "create_agents": ".agents",
+    "ProjectTasks": ".tasks",
+    "create_tasks": ".tasks",
+    "Cassette": ".cassette",
+}
+
+if TYPE_CHECKING:
+    from .agents import ProjectAgents, create_agents
+    from .tasks import ProjectTasks, create_tasks
+    from .crew import ProjectPlannerCrew, plan_project
+    from .pool import CrewPool
+    from .jobs import JobQueue
+    from .store import PlanStore
+    from .retrieval import SimilarPlanIndex
+    from .cassette import Cassette
+
+
+def __getattr__(name: str):
+    """Import heavy symbols lazily on first access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 # Define what gets imported with "from src import *"
 __all__ = [
     # Main orchestration
     "ProjectPlannerCrew",
     "plan_project",
+    "CrewPool",
+    "JobQueue",
+    
+    # LLM record/replay
+    "Cassette",
     
     # Agent management
     "ProjectAgents",
@@ -55,10 +113,20 @@ __all__ = [
     "Milestone",
     "ProjectPlan",
     
+    # Progress events
+    "PlanningEvent",
+    "format_event",
+    
+    # Result caching
+    "PlanCache",
+    "StageCache",
+    "compute_cache_key",
+    
+    # Plan history
+    "PlanStore",
+    "SimilarPlanIndex",
+    
     # Package metadata
     "__version__",
     "__author__",
 ]
-
-# Package initialization message
-print(f"🤖 AI Project Planner v{__version__} loaded successfully!")
\ No newline at end of file
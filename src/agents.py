@@ -3,37 +3,44 @@ Agent definitions for the AI Project Planner.
 This module creates and configures AI agents for project planning tasks.
 """
 
-import yaml
 from crewai import Agent
 from pathlib import Path
+from typing import Any, Callable, Optional
+
+from .config import load_agents_config
 
 
 class ProjectAgents:
     """Factory class for creating project planning agents"""
     
-    def __init__(self, config_path: str = "config/agents.yaml"):
+    def __init__(
+        self,
+        config_path: str = "config/agents.yaml",
+        llm_factory: Optional[Callable[[str], Any]] = None
+    ):
         """
         Initialize agents factory with configuration
         
         Args:
             config_path: Path to agents configuration YAML file
+            llm_factory: Optional callable returning the LLM for an agent
+                key (e.g. 'estimation_agent'); agents use CrewAI's
+                environment-configured LLM when omitted
         """
         self.config_path = Path(config_path)
+        self.llm_factory = llm_factory
         self.agents_config = self._load_config()
     
     def _load_config(self) -> dict:
-        """Load agents configuration from YAML file"""
-        try:
-            with open(self.config_path, 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
-                print(f"✅ Agents config loaded from {self.config_path}")
-                return config
-        except FileNotFoundError:
-            print(f"❌ Error: Config file not found at {self.config_path}")
-            raise
-        except yaml.YAMLError as e:
-            print(f"❌ Error parsing YAML file: {e}")
-            raise
+        """Load agents configuration through the shared config registry"""
+        return load_agents_config(str(self.config_path))
+    
+    def _build_agent(self, agent_key: str) -> Agent:
+        """Create an agent from its config entry, with a custom LLM if configured"""
+        options = {'config': self.agents_config[agent_key]}
+        if self.llm_factory is not None:
+            options['llm'] = self.llm_factory(agent_key)
+        return Agent(**options)
     
     def create_project_planning_agent(self) -> Agent:
         """
@@ -42,9 +49,7 @@ class ProjectAgents:
         Returns:
             Agent configured for project planning tasks
         """
-        return Agent(
-            config=self.agents_config['project_planning_agent']
-        )
+        return self._build_agent('project_planning_agent')
     
     def create_estimation_agent(self) -> Agent:
         """
@@ -53,9 +58,7 @@ class ProjectAgents:
         Returns:
             Agent configured for time and resource estimation
         """
-        return Agent(
-            config=self.agents_config['estimation_agent']
-        )
+        return self._build_agent('estimation_agent')
     
     def create_resource_allocation_agent(self) -> Agent:
         """
@@ -64,9 +67,7 @@ class ProjectAgents:
         Returns:
             Agent configured for resource allocation and milestone planning
         """
-        return Agent(
-            config=self.agents_config['resource_allocation_agent']
-        )
+        return self._build_agent('resource_allocation_agent')
     
     def get_all_agents(self) -> list[Agent]:
         """
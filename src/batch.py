@@ -0,0 +1,167 @@
+"""
+Batch planning for the AI Project Planner.
+Reads planning inputs from a JSONL file, plans them concurrently and
+streams each finished ProjectPlan to an output JSONL file.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Set, Tuple
+
+from .cache import INPUT_KEYS, PlanCache
+from .crew import ProjectPlannerCrew
+
+
+def read_batch_inputs(input_path: str) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """
+    Read planning requests from a JSONL file
+
+    Each line is a JSON object with a ``request_id`` (or ``id``) and the
+    five planning fields, either at the top level or under ``inputs``.
+    Lines without an ID are numbered by their line position.
+
+    Args:
+        input_path: Path to the JSONL input file
+
+    Yields:
+        (request_id, inputs) tuples
+    """
+    with open(input_path, 'r', encoding='utf-8') as file:
+        for line_number, line in enumerate(file, 1):
+            line = line.strip()
+            if not line:
+                continue
+            record = json.loads(line)
+            request_id = str(record.get('request_id') or record.get('id') or f"line-{line_number}")
+            source = record.get('inputs', record)
+            inputs = {key: source[key] for key in INPUT_KEYS if key in source}
+            yield request_id, inputs
+
+
+def load_completed_ids(output_path: str) -> Set[str]:
+    """
+    Collect IDs that already have a successful result in the output file
+
+    Args:
+        output_path: Path to the JSONL output file
+
+    Returns:
+        Set of request IDs to skip on resume
+    """
+    completed = set()
+    path = Path(output_path)
+    if not path.exists():
+        return completed
+
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A partially written last line from an interrupted run
+                continue
+            if record.get('status') == 'ok':
+                completed.add(record['request_id'])
+    return completed
+
+
+async def run_batch_async(
+    input_path: str,
+    output_path: str,
+    workers: int = 4,
+    timeout: Optional[float] = None,
+    cache: Optional[PlanCache] = None,
+    use_cache: bool = True,
+    verbose: bool = False,
+    compact_context: bool = False,
+    llm_factory: Optional[Callable[[str], Any]] = None
+) -> Dict[str, int]:
+    """
+    Plan every request in a JSONL file and append results as they finish
+
+    Args:
+        input_path: JSONL file of planning requests
+        output_path: JSONL file receiving one result line per request
+        workers: Maximum number of concurrent planning runs
+        timeout: Per-request timeout in seconds (None waits forever)
+        cache: Optional PlanCache shared by all workers
+        use_cache: Look up and store results in the plan cache
+        verbose: Enable verbose crew output
+        compact_context: Compact each stage output before the next stage
+        llm_factory: Optional callable returning the LLM for each agent,
+            e.g. EndpointRouter.llm_factory() to spread the batch over
+            several endpoints
+
+    Returns:
+        Summary counts: total, skipped, succeeded, failed
+    """
+    completed = load_completed_ids(output_path)
+    pending = [
+        (request_id, inputs)
+        for request_id, inputs in read_batch_inputs(input_path)
+        if request_id not in completed
+    ]
+    summary = {
+        'total': len(pending) + len(completed),
+        'skipped': len(completed),
+        'succeeded': 0,
+        'failed': 0,
+    }
+    if not pending:
+        return summary
+
+    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+    crew = ProjectPlannerCrew(
+        verbose=verbose,
+        cache=cache,
+        compact_context=compact_context,
+        llm_factory=llm_factory
+    )
+
+    with open(output_path, 'a', encoding='utf-8') as output:
+        async for index, result in crew.plan_as_completed(
+            [inputs for _, inputs in pending],
+            max_concurrency=workers,
+            timeout=timeout,
+            use_cache=use_cache
+        ):
+            request_id = pending[index][0]
+            if result is None:
+                # The final stage produced no parsable ProjectPlan
+                result = ValueError("Planner returned no structured plan")
+            if isinstance(result, BaseException):
+                record = {
+                    'request_id': request_id,
+                    'status': 'error',
+                    'error': f"{type(result).__name__}: {result}",
+                }
+                summary['failed'] += 1
+                print(f"❌ {request_id}: {record['error']}")
+            else:
+                record = {
+                    'request_id': request_id,
+                    'status': 'ok',
+                    'plan': result.model_dump(),
+                }
+                summary['succeeded'] += 1
+                print(f"✅ {request_id}: {len(result.tasks)} tasks")
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+
+    return summary
+
+
+def run_batch(input_path: str, output_path: str, **kwargs) -> Dict[str, int]:
+    """
+    Blocking wrapper around run_batch_async
+
+    Args:
+        input_path: JSONL file of planning requests
+        output_path: JSONL file receiving one result line per request
+        **kwargs: Forwarded to run_batch_async
+
+    Returns:
+        Summary counts: total, skipped, succeeded, failed
+    """
+    return asyncio.run(run_batch_async(input_path, output_path, **kwargs))
@@ -0,0 +1,274 @@
+"""
+Persistent result cache for the AI Project Planner.
+Stores finished ProjectPlan results on disk so identical planning
+requests can be answered without running the crew again.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Sequence
+
+from .models import ProjectPlan
+
+
+# Input fields that take part in the cache key
+INPUT_KEYS = (
+    'project_type',
+    'project_objectives',
+    'industry',
+    'team_members',
+    'project_requirements',
+)
+
+
+def _file_digest(path: Path) -> str:
+    """Return the SHA-256 of a file's contents, or a marker if it is missing"""
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return "missing"
+
+
+def compute_cache_key(
+    inputs: Dict[str, Any],
+    agents_config: str = "config/agents.yaml",
+    tasks_config: str = "config/tasks.yaml",
+    model_name: Optional[str] = None
+) -> str:
+    """
+    Build a content-addressed cache key for a planning request
+
+    Args:
+        inputs: Planning inputs (only the five known fields are used)
+        agents_config: Path to agents configuration
+        tasks_config: Path to tasks configuration
+        model_name: LLM model name (defaults to OPENAI_MODEL_NAME)
+
+    Returns:
+        Hex digest identifying the request
+    """
+    payload = {
+        'inputs': {key: str(inputs.get(key, '')) for key in INPUT_KEYS},
+        'agents_config': _file_digest(Path(agents_config)),
+        'tasks_config': _file_digest(Path(tasks_config)),
+        'model': model_name or os.getenv('OPENAI_MODEL_NAME', ''),
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+def compute_stage_key(
+    stage: str,
+    stage_config: Dict[str, Any],
+    inputs: Dict[str, Any],
+    input_fields: Iterable[str],
+    upstream_outputs: Sequence[str],
+    agents_config: str = "config/agents.yaml",
+    model_name: Optional[str] = None,
+    compact_context: bool = False
+) -> str:
+    """
+    Build a cache key for the output of a single planning stage
+
+    Only the input fields the stage actually reads take part, together
+    with the outputs of the stages before it, so a stage keeps its key
+    when unrelated inputs change.
+
+    Args:
+        stage: Stage name (tasks.yaml key)
+        stage_config: The stage's tasks.yaml entry
+        inputs: Planning inputs
+        input_fields: Input fields referenced by the stage
+        upstream_outputs: Raw outputs of the earlier stages, in order
+        agents_config: Path to agents configuration
+        model_name: LLM model name (defaults to OPENAI_MODEL_NAME)
+        compact_context: Whether stage outputs are compacted
+
+    Returns:
+        Hex digest identifying the stage run
+    """
+    payload = {
+        'stage': stage,
+        'config': stage_config,
+        'inputs': {key: str(inputs.get(key, '')) for key in sorted(input_fields)},
+        'upstream': [hashlib.sha256(raw.encode('utf-8')).hexdigest() for raw in upstream_outputs],
+        'agents_config': _file_digest(Path(agents_config)),
+        'model': model_name or os.getenv('OPENAI_MODEL_NAME', ''),
+        'compact_context': compact_context,
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class PlanCache:
+    """Disk-backed ProjectPlan cache with TTL and size-based eviction"""
+
+    # Name of the field holding the cached value in each entry file
+    entry_field = 'plan'
+
+    def __init__(
+        self,
+        cache_dir: str = "outputs/.plan_cache",
+        max_entries: int = 256,
+        ttl_seconds: Optional[float] = 7 * 24 * 3600
+    ):
+        """
+        Initialize the plan cache
+
+        Args:
+            cache_dir: Directory where cached plans are stored
+            max_entries: Maximum number of plans kept before evicting the
+                least recently used ones
+            ttl_seconds: Age after which an entry expires (None disables TTL)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[ProjectPlan]:
+        """
+        Look up a cached plan
+
+        Args:
+            key: Cache key from compute_cache_key
+
+        Returns:
+            Cached ProjectPlan, or None on a miss
+        """
+        path = self._entry_path(key)
+        with self._lock:
+            try:
+                with open(path, 'r', encoding='utf-8') as file:
+                    entry = json.load(file)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self.misses += 1
+                return None
+
+            if self._is_expired(entry.get('created_at', 0)):
+                path.unlink(missing_ok=True)
+                self.evictions += 1
+                self.misses += 1
+                return None
+
+            try:
+                value = self._deserialize(entry[self.entry_field])
+            except (KeyError, TypeError, ValueError):
+                path.unlink(missing_ok=True)
+                self.misses += 1
+                return None
+
+            # Touch the entry so size-based eviction is least-recently-used
+            os.utime(path, None)
+            self.hits += 1
+            return value
+
+    def put(self, key: str, plan: ProjectPlan) -> None:
+        """
+        Store a plan in the cache
+
+        Args:
+            key: Cache key from compute_cache_key
+            plan: ProjectPlan to store
+        """
+        entry = {
+            'created_at': time.time(),
+            self.entry_field: self._serialize(plan),
+        }
+        with self._lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            path = self._entry_path(key)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as file:
+                json.dump(entry, file, ensure_ascii=False)
+            os.replace(tmp_path, path)
+            self._evict()
+
+    def clear(self) -> None:
+        """Remove every cached plan"""
+        with self._lock:
+            for path in self.cache_dir.glob("*.json"):
+                path.unlink(missing_ok=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with hit/miss/eviction counters and entry count
+        """
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / total if total else 0.0,
+            'entries': len(list(self.cache_dir.glob("*.json"))) if self.cache_dir.exists() else 0,
+        }
+
+    def _serialize(self, value: ProjectPlan) -> Any:
+        return value.model_dump()
+
+    def _deserialize(self, data: Any) -> ProjectPlan:
+        return ProjectPlan.model_validate(data)
+
+    def _is_expired(self, created_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time() - created_at > self.ttl_seconds
+
+    def _evict(self) -> None:
+        """Drop the least recently used entries beyond max_entries"""
+        entries = []
+        for path in self.cache_dir.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime, path))
+            except FileNotFoundError:
+                continue
+
+        # Expired entries are removed lazily in get()
+        overflow = len(entries) - self.max_entries
+        if overflow > 0:
+            entries.sort()
+            for _, path in entries[:overflow]:
+                path.unlink(missing_ok=True)
+                self.evictions += 1
+
+
+class StageCache(PlanCache):
+    """Disk-backed cache of intermediate stage outputs (raw agent text)"""
+
+    entry_field = 'output'
+
+    def __init__(
+        self,
+        cache_dir: str = "outputs/.stage_cache",
+        max_entries: int = 512,
+        ttl_seconds: Optional[float] = 7 * 24 * 3600
+    ):
+        """
+        Initialize the stage cache
+
+        Args:
+            cache_dir: Directory where stage outputs are stored
+            max_entries: Maximum number of outputs kept before evicting the
+                least recently used ones
+            ttl_seconds: Age after which an entry expires (None disables TTL)
+        """
+        super().__init__(cache_dir, max_entries, ttl_seconds)
+
+    def _serialize(self, value: str) -> Any:
+        return value
+
+    def _deserialize(self, data: Any) -> str:
+        if not isinstance(data, str):
+            raise TypeError("Stage output must be a string")
+        return data
@@ -0,0 +1,247 @@
+"""
+LLM record/replay for the AI Project Planner.
+Captures every LLM request/response of a planning run into a compact
+cassette file and serves them back later without a model, so the whole
+pipeline can run deterministically in tests and profiling sessions.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from .llms import USAGE_KEYS, DelegatingLLM, usage_of
+
+
+RECORD = "record"
+REPLAY = "replay"
+
+CASSETTE_VERSION = 1
+
+
+class CassetteMiss(LookupError):
+    """Raised in replay mode when a request was never recorded"""
+
+
+def request_fingerprint(
+    messages: Any,
+    tools: Optional[List[dict]] = None,
+    response_model: Optional[type] = None
+) -> str:
+    """
+    Stable identifier of an LLM request
+
+    Only the parts that determine the answer take part: message roles and
+    contents, tool names and the structured response model.
+
+    Args:
+        messages: Prompt string or list of chat messages
+        tools: Tool schemas offered to the model
+        response_model: Pydantic model requested as structured output
+
+    Returns:
+        Hex digest of the request
+    """
+    if isinstance(messages, str):
+        messages = [{'role': 'user', 'content': messages}]
+    payload = {
+        'messages': [
+            {'role': message.get('role'), 'content': message.get('content')}
+            for message in messages
+        ],
+        'tools': sorted(
+            str(tool.get('function', tool).get('name', '')) if isinstance(tool, dict) else str(tool)
+            for tool in tools or []
+        ),
+        'response_model': response_model.__name__ if response_model else None,
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+class Cassette:
+    """Recorded LLM interactions, keyed by request fingerprint"""
+
+    def __init__(self, path: str, mode: str = REPLAY):
+        """
+        Open a cassette file
+
+        Args:
+            path: Cassette file (``.json`` or gzip-compressed ``.json.gz``)
+            mode: ``"record"`` to call the real model and capture its
+                answers, ``"replay"`` to answer from the file only
+        """
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Cassette mode must be '{RECORD}' or '{REPLAY}', got '{mode}'")
+
+        self.path = Path(path)
+        self.mode = mode
+        self.interactions: Dict[str, List[Dict[str, Any]]] = {}
+        self.recorded = 0
+        self.replayed = 0
+        self._cursor: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+        if mode == REPLAY:
+            self._load()
+
+    def _load(self) -> None:
+        opener = gzip.open if self.path.suffix == '.gz' else open
+        try:
+            with opener(self.path, 'rt', encoding='utf-8') as file:
+                data = json.load(file)
+        except FileNotFoundError:
+            print(f"❌ Error: Cassette not found at {self.path}")
+            raise
+        if data.get('version') != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version: {data.get('version')}")
+        for interaction in data['interactions']:
+            self.interactions.setdefault(interaction['key'], []).append(interaction)
+
+    def save(self) -> None:
+        """Write the recorded interactions to the cassette file"""
+        with self._lock:
+            interactions = [
+                interaction
+                for entries in self.interactions.values()
+                for interaction in entries
+            ]
+            data = {'version': CASSETTE_VERSION, 'interactions': interactions}
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_name(f".{self.path.name}.{os.getpid()}.tmp")
+            opener = gzip.open if self.path.suffix == '.gz' else open
+            with opener(tmp_path, 'wt', encoding='utf-8') as file:
+                json.dump(data, file, ensure_ascii=False, separators=(',', ':'))
+            os.replace(tmp_path, self.path)
+        print(f"📼 Cassette saved to {self.path} ({len(interactions)} interactions)")
+
+    def record(self, key: str, agent: Optional[str], result: Any, usage: Dict[str, int]) -> None:
+        """
+        Store one interaction
+
+        Args:
+            key: Request fingerprint
+            agent: Role of the calling agent, kept for readability
+            result: Text or Pydantic object returned by the model
+            usage: Token usage of the call
+        """
+        structured = isinstance(result, BaseModel)
+        interaction = {
+            'key': key,
+            'agent': agent,
+            'structured': structured,
+            'response': result.model_dump(mode='json') if structured else result,
+            'usage': usage,
+        }
+        with self._lock:
+            self.interactions.setdefault(key, []).append(interaction)
+            self.recorded += 1
+
+    def replay(self, key: str) -> Dict[str, Any]:
+        """
+        Return the recorded interaction for a request
+
+        Identical requests are answered in the order they were recorded;
+        once exhausted, the last answer is repeated.
+
+        Args:
+            key: Request fingerprint
+
+        Returns:
+            Recorded interaction
+
+        Raises:
+            CassetteMiss: If the request is not on the cassette
+        """
+        with self._lock:
+            entries = self.interactions.get(key)
+            if not entries:
+                raise CassetteMiss(
+                    f"No recorded LLM response for request {key[:12]} in {self.path}; "
+                    "record the cassette again"
+                )
+            position = self._cursor.get(key, 0)
+            self._cursor[key] = position + 1
+            self.replayed += 1
+            return entries[min(position, len(entries) - 1)]
+
+    def llm_factory(self, inner_factory: Optional[Callable[[str], Any]] = None) -> Callable[[str], "CassetteLLM"]:
+        """
+        Build a factory giving each agent its own cassette-backed LLM
+
+        Args:
+            inner_factory: Creates the real LLM for an agent when recording
+                (defaults to CrewAI's environment-configured LLM)
+
+        Returns:
+            Callable taking an agent key and returning a CassetteLLM
+        """
+        def factory(agent_key: str) -> CassetteLLM:
+            inner = None
+            if self.mode == RECORD:
+                if inner_factory is not None:
+                    inner = inner_factory(agent_key)
+                else:
+                    from crewai.utilities.llm_utils import create_llm
+                    inner = create_llm(None)
+            model = getattr(inner, 'model', None) or os.getenv('OPENAI_MODEL_NAME') or 'cassette'
+            return CassetteLLM(model=model, cassette=self, inner=inner)
+
+        return factory
+
+    def __enter__(self) -> "Cassette":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if self.mode == RECORD:
+            self.save()
+
+
+class CassetteLLM(DelegatingLLM):
+    """LLM that records through, or replays from, a Cassette"""
+
+    llm_type: str = "cassette"
+    cassette: Any = None
+
+    def call(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+        response_model=None
+    ):
+        """Answer a request from the cassette, or from the real LLM while recording"""
+        key = request_fingerprint(messages, tools, response_model)
+        agent = getattr(from_agent, 'role', None)
+
+        if self.cassette.mode == REPLAY:
+            interaction = self.cassette.replay(key)
+            self._track_token_usage_internal(interaction.get('usage') or {})
+            response = interaction['response']
+            if interaction.get('structured') and response_model is not None:
+                return response_model.model_validate(response)
+            return response
+
+        before = usage_of(self)
+        result = self._call_inner(
+            self.inner,
+            messages,
+            tools=tools,
+            callbacks=callbacks,
+            available_functions=available_functions,
+            from_task=from_task,
+            from_agent=from_agent,
+            response_model=response_model
+        )
+        after = usage_of(self)
+        usage = {key_: after[key_] - before[key_] for key_ in USAGE_KEYS}
+        self.cassette.record(key, agent.strip() if agent else None, result, usage)
+        return result
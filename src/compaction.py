@@ -0,0 +1,294 @@
+"""
+Inter-stage context compaction for the AI Project Planner.
+Reduces the free-text output of a planning stage to one compact line per
+task before it is passed to the next agent as context.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+
+# Column order of the compact form
+COMPACT_FIELDS = ('id', 'name', 'category', 'depends_on', 'hours', 'resources')
+
+# Field labels used by the agents, normalized to compact field names
+_FIELD_ALIASES = {
+    'id': 'id',
+    'task id': 'id',
+    'task identifier': 'id',
+    'identifier': 'id',
+    'unique task identifier': 'id',
+    'name': 'name',
+    'task': 'name',
+    'task name': 'name',
+    'title': 'name',
+    'task title': 'name',
+    'description': 'description',
+    'task description': 'description',
+    'category': 'category',
+    'task category': 'category',
+    'type': 'category',
+    'dependencies': 'depends_on',
+    'dependency': 'depends_on',
+    'depends on': 'depends_on',
+    'prerequisites': 'depends_on',
+    'hours': 'hours',
+    'estimated hours': 'hours',
+    'estimated time': 'hours',
+    'estimated time hours': 'hours',
+    'estimated time in hours': 'hours',
+    'estimate': 'hours',
+    'time estimate': 'hours',
+    'estimated hours for completion': 'hours',
+    'required resources': 'resources',
+    'resources': 'resources',
+    'resources required': 'resources',
+}
+
+_EMPTY_VALUES = {'', 'none', 'n/a', 'na', '-', 'nil', 'null'}
+
+# List markers and headings: "1. ", "- ", "### "
+_MARKER = re.compile(r'^(?:#{1,6}|\d+[.)]|[-*+])\s+')
+_FIELD = re.compile(r'^(?:\*\*|__)?(?P<key>[A-Za-z][A-Za-z ()/_-]{0,40}?)(?:\*\*|__)?\s*[:=]\s*(?P<value>.*)$')
+_TASK_HEADER = re.compile(r'^(?:task\s*)?(?P<id>[A-Za-z]{0,4}-?\d+(?:\.\d+)*)\s*[:.)-]\s*(?P<name>.+)$', re.IGNORECASE)
+_NUMBER = re.compile(r'\d+(?:\.\d+)?')
+
+
+@dataclass
+class CompactionResult:
+    """Outcome of compacting one stage output"""
+
+    text: str
+    original_tokens: int
+    compact_tokens: int
+    task_count: int
+    compacted: bool = field(default=False)
+
+    @property
+    def tokens_saved(self) -> int:
+        """Estimated prompt tokens saved each time the text is reused"""
+        return max(self.original_tokens - self.compact_tokens, 0)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count of a piece of text
+
+    Uses the common four-characters-per-token approximation so savings
+    can be reported without a model-specific tokenizer.
+
+    Args:
+        text: Text to measure
+
+    Returns:
+        Estimated number of tokens
+    """
+    return (len(text) + 3) // 4 if text else 0
+
+
+def _clean(value: str) -> str:
+    value = re.sub(r'[*_`]+', '', value).strip().strip('.,;')
+    return re.sub(r'\s+', ' ', value)
+
+
+def _normalize_key(key: str) -> Optional[str]:
+    key = re.sub(r'[()_/-]+', ' ', key.lower())
+    return _FIELD_ALIASES.get(re.sub(r'\s+', ' ', key).strip())
+
+
+def _split_list(value) -> List[str]:
+    if isinstance(value, (list, tuple)):
+        items = [str(item) for item in value]
+    else:
+        items = re.split(r'[,;]|\band\b', str(value))
+    items = [_clean(item) for item in items]
+    return [item for item in items if item.lower() not in _EMPTY_VALUES]
+
+
+def _parse_hours(value) -> Optional[float]:
+    if isinstance(value, (int, float)):
+        return float(value)
+    numbers = [float(n) for n in _NUMBER.findall(str(value))]
+    if not numbers:
+        return None
+    # "8-12 hours" is reported as the upper bound of the range
+    return max(numbers)
+
+
+def _record_from_mapping(item: Dict) -> Dict[str, object]:
+    record: Dict[str, object] = {}
+    for key, value in item.items():
+        name = _normalize_key(str(key))
+        if name is None or value in (None, ''):
+            continue
+        record.setdefault(name, value)
+    return record
+
+
+def _json_items(text: str) -> List[Dict]:
+    match = re.search(r'[\[{].*[\]}]', text, re.DOTALL)
+    if not match:
+        return []
+    try:
+        data = json.loads(match.group(0))
+    except json.JSONDecodeError:
+        return []
+    if isinstance(data, dict):
+        data = data.get('tasks', [])
+    if not isinstance(data, list):
+        return []
+    return [item for item in data if isinstance(item, dict)]
+
+
+def _parse_json_records(text: str) -> List[Dict[str, object]]:
+    return [_record_from_mapping(item) for item in _json_items(text)]
+
+
+def _parse_text_blocks(text: str) -> List[Tuple[Dict[str, object], List[str]]]:
+    """Task records of markdown text, each with the lines it was read from"""
+    blocks: List[Tuple[Dict[str, object], List[str]]] = []
+    current: Optional[Dict[str, object]] = None
+
+    for line in text.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            continue
+        # A top-level list item or heading may start a new task block
+        block_start = line == line.lstrip() and bool(_MARKER.match(stripped))
+        body = _MARKER.sub('', stripped)
+
+        field_match = _FIELD.match(body)
+        key = _normalize_key(field_match.group('key')) if field_match else None
+        value = _clean(field_match.group('value')) if key else ''
+
+        # A listed task ID opens a new task even under a bare heading
+        opens_task = block_start and key == 'id'
+        if key and current is not None and key not in current and not opens_task:
+            current[key] = value
+            blocks[-1][1].append(line)
+            continue
+        if not (block_start or key == 'id'):
+            if blocks:
+                blocks[-1][1].append(line)
+            continue
+
+        current = {}
+        blocks.append((current, [line]))
+        task_header = _TASK_HEADER.match(value if key == 'id' else _clean(body))
+        if task_header:
+            current['id'] = task_header.group('id')
+            current['name'] = _clean(task_header.group('name'))
+        elif key:
+            current[key] = value
+        else:
+            current['name'] = _clean(body)
+
+    # Drop section headings that carry no task fields
+    if any(set(record) - {'id', 'name'} for record, _ in blocks):
+        blocks = [(record, lines) for record, lines in blocks if set(record) - {'id', 'name'}]
+    return blocks
+
+
+def _parse_text_records(text: str) -> List[Dict[str, object]]:
+    return [record for record, _ in _parse_text_blocks(text)]
+
+
+def _format_record(record: Dict[str, object], index: int) -> str:
+    name = _clean(str(record.get('name') or record.get('description') or ''))
+    hours = _parse_hours(record['hours']) if 'hours' in record else None
+    values = {
+        'id': _clean(str(record.get('id') or f"T{index}")),
+        'name': name,
+        'category': _clean(str(record.get('category', ''))).lower(),
+        'depends_on': ','.join(_split_list(record.get('depends_on', ''))),
+        'hours': f"{hours:g}" if hours is not None else '',
+        'resources': ','.join(_split_list(record.get('resources', ''))),
+    }
+    return ' | '.join(values[column].replace('|', '/') for column in COMPACT_FIELDS)
+
+
+def compact_stage_output(text: str) -> CompactionResult:
+    """
+    Reduce a stage output to one line per task
+
+    Recognizes JSON task lists as well as the numbered / bulleted
+    markdown the agents usually produce. Risk notes, mitigation text and
+    other prose are dropped; only task id, name, category, dependencies,
+    hours and required resources are kept. If no tasks can be found, or
+    the compact form would not be shorter, the original text is returned.
+
+    Args:
+        text: Raw output of a planning stage
+
+    Returns:
+        CompactionResult with the text to pass on and token estimates
+    """
+    original_tokens = estimate_tokens(text)
+    unchanged = CompactionResult(
+        text=text,
+        original_tokens=original_tokens,
+        compact_tokens=original_tokens,
+        task_count=0
+    )
+    if not text or not text.strip():
+        return unchanged
+
+    records = _parse_json_records(text) or _parse_text_records(text)
+    records = [record for record in records if record.get('name') or record.get('description')]
+    if not records:
+        return unchanged
+
+    lines = [' | '.join(COMPACT_FIELDS)]
+    lines.extend(_format_record(record, index) for index, record in enumerate(records, 1))
+    compact = "\n".join(lines)
+    compact_tokens = estimate_tokens(compact)
+    if compact_tokens >= original_tokens:
+        return unchanged
+
+    return CompactionResult(
+        text=compact,
+        original_tokens=original_tokens,
+        compact_tokens=compact_tokens,
+        task_count=len(records),
+        compacted=True
+    )
+
+
+def parse_task_blocks(text: str) -> List[Tuple[Dict[str, object], str]]:
+    """
+    Split a task breakdown into tasks, keeping each task's original text
+
+    Uses the same task detection as compact_stage_output. JSON tasks are
+    re-serialized one object per block; preamble and section headings
+    are dropped.
+
+    Args:
+        text: Raw output of the task breakdown stage
+
+    Returns:
+        (fields, text block) per task in original order; fields use the
+        compact field names (empty list if no tasks were found)
+    """
+    if not text or not text.strip():
+        return []
+    items = _json_items(text)
+    if items:
+        blocks = [(_record_from_mapping(item), json.dumps(item, ensure_ascii=False)) for item in items]
+    else:
+        blocks = [(record, "\n".join(lines)) for record, lines in _parse_text_blocks(text)]
+    return [(record, block) for record, block in blocks if record.get('name') or record.get('description')]
+
+
+def split_task_blocks(text: str) -> List[str]:
+    """
+    Split a task breakdown into one text block per task
+
+    Args:
+        text: Raw output of the task breakdown stage
+
+    Returns:
+        Task blocks in their original order (empty if no tasks were found)
+    """
+    return [block for _, block in parse_task_blocks(text)]
@@ -0,0 +1,165 @@
+"""
+Configuration registry for the AI Project Planner.
+Parses agents.yaml and tasks.yaml once per process, validates their
+structure at load time and reloads them when the files change on disk.
+"""
+
+import copy
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+import yaml
+
+
+# Entries each config file must define, and the fields every entry needs
+AGENTS_SCHEMA: Mapping[str, Tuple[str, ...]] = {
+    'project_planning_agent': ('role', 'goal', 'backstory'),
+    'estimation_agent': ('role', 'goal', 'backstory'),
+    'resource_allocation_agent': ('role', 'goal', 'backstory'),
+}
+
+TASKS_SCHEMA: Mapping[str, Tuple[str, ...]] = {
+    'task_breakdown': ('description', 'expected_output'),
+    'time_resource_estimation': ('description', 'expected_output'),
+    'resource_allocation': ('description', 'expected_output'),
+}
+
+
+def validate_config(
+    config: dict,
+    schema: Mapping[str, Iterable[str]],
+    source: str = "config"
+) -> None:
+    """
+    Check that a parsed config defines every expected entry and field
+
+    Args:
+        config: Parsed YAML mapping
+        schema: Expected entry names mapped to their required fields
+        source: Name used in error messages
+
+    Raises:
+        ValueError: If entries or fields are missing
+    """
+    if not isinstance(config, dict):
+        raise ValueError(f"{source} must be a mapping, got {type(config).__name__}")
+
+    problems = []
+    for entry, fields in schema.items():
+        if entry not in config:
+            problems.append(f"missing '{entry}'")
+            continue
+        if not isinstance(config[entry], dict):
+            problems.append(f"'{entry}' must be a mapping")
+            continue
+        missing_fields = [field for field in fields if not config[entry].get(field)]
+        if missing_fields:
+            problems.append(f"'{entry}' is missing {missing_fields}")
+
+    if problems:
+        raise ValueError(f"Invalid {source}: " + "; ".join(problems))
+
+
+def stage_input_fields(tasks_config: dict) -> Dict[str, Tuple[str, ...]]:
+    """
+    Find the input placeholders each task reads
+
+    Args:
+        tasks_config: Parsed tasks configuration
+
+    Returns:
+        Task name mapped to the sorted ``{field}`` names used in its
+        description and expected output
+    """
+    fields = {}
+    for name, entry in tasks_config.items():
+        text = f"{entry.get('description', '')} {entry.get('expected_output', '')}"
+        fields[name] = tuple(sorted(set(re.findall(r'\{(\w+)\}', text))))
+    return fields
+
+
+class ConfigRegistry:
+    """Process-wide cache of parsed YAML configs keyed by path and mtime"""
+
+    def __init__(self):
+        self._entries: Dict[Path, Tuple[Tuple[int, int], dict]] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+
+    @staticmethod
+    def _stamp(path: Path) -> Tuple[int, int]:
+        stat = path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    def stamp(self, config_path: str) -> Tuple[int, int]:
+        """
+        Current (mtime, size) stamp of a config file
+
+        Args:
+            config_path: Path to the YAML file
+
+        Returns:
+            Stamp that changes whenever the file is modified
+        """
+        return self._stamp(Path(config_path).resolve())
+
+    def load(
+        self,
+        config_path: str,
+        schema: Optional[Mapping[str, Iterable[str]]] = None
+    ) -> dict:
+        """
+        Return the parsed config, re-reading the file only if it changed
+
+        Args:
+            config_path: Path to the YAML file
+            schema: Optional schema to validate against on (re)load
+
+        Returns:
+            A private copy of the parsed config
+        """
+        path = Path(config_path).resolve()
+        try:
+            stamp = self._stamp(path)
+        except FileNotFoundError:
+            print(f"❌ Error: Config file not found at {config_path}")
+            raise
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != stamp:
+                try:
+                    with open(path, 'r', encoding='utf-8') as file:
+                        config = yaml.safe_load(file)
+                except yaml.YAMLError as e:
+                    print(f"❌ Error parsing YAML file: {e}")
+                    raise
+                if schema is not None:
+                    validate_config(config, schema, source=str(config_path))
+                self._entries[path] = (stamp, config)
+                self.loads += 1
+                print(f"✅ Config loaded from {config_path}")
+            config = self._entries[path][1]
+
+        return copy.deepcopy(config)
+
+    def clear(self) -> None:
+        """Forget every cached config"""
+        with self._lock:
+            self._entries.clear()
+
+
+# Shared registry used by the agent and task factories
+registry = ConfigRegistry()
+
+
+def load_agents_config(config_path: str = "config/agents.yaml") -> dict:
+    """Load and validate the agents configuration"""
+    return registry.load(config_path, AGENTS_SCHEMA)
+
+
+def load_tasks_config(config_path: str = "config/tasks.yaml") -> dict:
+    """Load and validate the tasks configuration"""
+    return registry.load(config_path, TASKS_SCHEMA)
@@ -3,13 +3,45 @@ Crew orchestration for AI Project Planner.
 Manages the coordination of agents and tasks.
 """
 
-from crewai import Crew
-from typing import Dict, Any, Optional
+import asyncio
+import queue
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from crewai import Agent, Crew, TaskOutput
+from typing import Dict, Any, Optional, List, Tuple, Union, AsyncIterator, Callable
 from pathlib import Path
 
 from .agents import ProjectAgents
 from .tasks import ProjectTasks
 from .models import ProjectPlan
+from .cache import PlanCache, StageCache, compute_cache_key, compute_stage_key
+from .compaction import COMPACT_FIELDS, compact_stage_output, split_task_blocks
+from .hierarchy import cluster_requirements, merge_cluster_breakdowns
+from .config import registry as config_registry, stage_input_fields
+from .llms import StructuredOutputLLM, usage_of
+from .retrieval import SimilarPlan, SimilarPlanIndex, format_reference, same_team
+from .validation import repair_plan
+from .events import (
+    STAGES,
+    RUN_STARTED,
+    STAGE_STARTED,
+    STAGE_STEP,
+    STAGE_FINISHED,
+    RUN_FINISHED,
+    RUN_FAILED,
+    EventListener,
+    PlanningEvent,
+)
+
+
+# Stages that can be split into parallel sub-runs
+BREAKDOWN_STAGE = 0
+ESTIMATION_STAGE = 1
+
+# Prompt-only inputs left out of stage cache keys: the similar-plan example
+# is a hint, and it changes whenever a newer similar plan is stored
+UNKEYED_INPUT_FIELDS = ('reference_plan',)
 
 
 class ProjectPlannerCrew:
@@ -19,7 +51,20 @@ class ProjectPlannerCrew:
         self,
         agents_config: str = "config/agents.yaml",
         tasks_config: str = "config/tasks.yaml",
-        verbose: bool = True
+        verbose: bool = True,
+        cache: Optional[PlanCache] = None,
+        compact_context: bool = False,
+        stage_cache: Optional[StageCache] = None,
+        llm_factory: Optional[Callable[[str], Any]] = None,
+        structured_output: bool = True,
+        estimation_chunk_size: Optional[int] = None,
+        estimation_workers: int = 4,
+        requirement_cluster_size: Optional[int] = None,
+        planning_workers: int = 4,
+        similar_plans: Optional[SimilarPlanIndex] = None,
+        reuse_threshold: Optional[float] = None,
+        reference_threshold: float = 0.35,
+        plan_retries: int = 1
     ):
         """
         Initialize the project planner crew
@@ -28,11 +73,72 @@ class ProjectPlannerCrew:
             agents_config: Path to agents configuration
             tasks_config: Path to tasks configuration
             verbose: Enable verbose output
+            cache: Optional PlanCache used to reuse results of identical requests
+            compact_context: Reduce each stage output to a compact task
+                table before it is passed to the next stage as context
+            stage_cache: Optional StageCache of intermediate stage outputs;
+                stages whose inputs did not change are not rerun
+            llm_factory: Optional callable returning the LLM for each agent
+                key, e.g. Cassette.llm_factory() for record/replay
+            structured_output: Request schema-constrained JSON for the final
+                plan and repair malformed output locally instead of
+                asking the model to convert it again
+            estimation_chunk_size: Estimate the task breakdown in chunks of
+                this many tasks, in parallel (None estimates all at once)
+            estimation_workers: Maximum concurrent estimation calls when
+                estimating in chunks
+            requirement_cluster_size: Break down long requirement lists in
+                clusters of at most this many requirements, in parallel,
+                and merge the results (None plans all requirements at once)
+            planning_workers: Maximum concurrent planning calls when
+                planning requirement clusters
+            similar_plans: Optional SimilarPlanIndex of earlier plans; new
+                plans are added to it
+            reuse_threshold: Return the most similar earlier plan instead
+                of planning when it scores at least this (None never reuses)
+            reference_threshold: Show the most similar earlier plan to the
+                task breakdown as an example when it scores at least this
+            plan_retries: Re-run the final stage at most this many times
+                when the plan has issues local repair cannot fix
         """
+        if estimation_chunk_size is not None and estimation_chunk_size < 1:
+            raise ValueError("estimation_chunk_size must be at least 1")
+        if requirement_cluster_size is not None and requirement_cluster_size < 1:
+            raise ValueError("requirement_cluster_size must be at least 1")
+        if estimation_workers < 1 or planning_workers < 1:
+            raise ValueError("estimation_workers and planning_workers must be at least 1")
+        if plan_retries < 0:
+            raise ValueError("plan_retries must not be negative")
+        
         self.verbose = verbose
+        self.agents_config_path = agents_config
+        self.tasks_config_path = tasks_config
+        self.cache = cache
+        self.compact_context = compact_context
+        self.stage_cache = stage_cache
+        self.llm_factory = llm_factory
+        self.structured_output = structured_output
+        self.estimation_chunk_size = estimation_chunk_size
+        self.estimation_workers = estimation_workers
+        self.requirement_cluster_size = requirement_cluster_size
+        self.planning_workers = planning_workers
+        self.similar_plans = similar_plans
+        self.reuse_threshold = reuse_threshold
+        self.reference_threshold = reference_threshold
+        self.plan_retries = plan_retries
+        self.last_result_cached = False
+        self.last_similar_plan: Optional[SimilarPlan] = None
+        self.last_plan_repairs: List[str] = []
+        self.context_tokens_saved = 0
+        self.reused_stages = 0
+        self._usage_baseline: Dict[str, int] = {}
+        self._event_listener: Optional[EventListener] = None
+        self._run_started_at = 0.0
+        self._stage_index = 0
         
-        # Initialize factories
-        self.agents_factory = ProjectAgents(agents_config)
+        # Initialize factories (configs are parsed once per file version)
+        self.config_stamp = self._current_config_stamp()
+        self.agents_factory = ProjectAgents(agents_config, llm_factory=llm_factory)
         self.tasks_factory = ProjectTasks(tasks_config)
         
         # Create agents
@@ -43,17 +149,39 @@ class ProjectPlannerCrew:
             self.agents,
             output_pydantic=ProjectPlan
         )
+        if structured_output:
+            final_agent = self.tasks[-1].agent
+            final_agent.llm = StructuredOutputLLM.wrap(final_agent.llm)
+        
+        # Explicit context (all earlier stages) lets a run start mid-pipeline
+        # with earlier outputs restored from the stage cache
+        for index, task in enumerate(self.tasks[1:], 1):
+            task.context = self.tasks[:index]
+        self.stage_fields = {
+            stage: tuple(name for name in fields if name not in UNKEYED_INPUT_FIELDS)
+            for stage, fields in stage_input_fields(self.tasks_factory.tasks_config).items()
+        }
+        self._partial_crews: Dict[Tuple[int, Optional[int]], Crew] = {}
+        # Extra agent copies for parallel sub-runs, by agent key
+        self._helper_agents: Dict[str, List[Agent]] = {}
         
-        # Create crew
+        # Create crew; callbacks feed the progress event stream
         self.crew = Crew(
             agents=self.agents,
             tasks=self.tasks,
-            verbose=self.verbose
+            verbose=self.verbose,
+            task_callback=self._on_task_complete,
+            step_callback=self._on_agent_step
         )
         
         print("✅ Project Planner Crew initialized successfully!")
     
-    def plan_project(self, inputs: Dict[str, Any]) -> ProjectPlan:
+    def plan_project(
+        self,
+        inputs: Dict[str, Any],
+        use_cache: bool = True,
+        on_event: Optional[EventListener] = None
+    ) -> ProjectPlan:
         """
         Execute project planning with given inputs
         
@@ -64,11 +192,183 @@ class ProjectPlannerCrew:
                 - industry: Industry domain
                 - team_members: List or description of team members
                 - project_requirements: Detailed requirements
+            use_cache: Look up and store the result in the plan cache
+                (ignored when the crew has no cache)
+            on_event: Optional callback receiving PlanningEvent progress
+                updates (stage started/finished, elapsed time, tokens)
         
         Returns:
             ProjectPlan object with structured results
         """
-        # Validate inputs
+        self._validate_inputs(inputs)
+        
+        cache_key, cached_plan = self._lookup_cache(inputs, use_cache)
+        if cached_plan is not None:
+            self._emit_cached(on_event)
+            return cached_plan
+        
+        similar_plan, inputs = self._match_similar(inputs)
+        if similar_plan is not None:
+            self._emit_cached(on_event, message="Reused a similar plan")
+            return similar_plan
+        
+        print("\n🚀 Starting project planning process...")
+        print(f"📋 Project Type: {inputs['project_type']}")
+        print(f"🏢 Industry: {inputs['industry']}\n")
+        
+        start = self._restore_stages(inputs, use_cache)
+        
+        # Execute crew (only the stages that could not be reused)
+        with self._track_run(on_event, start_stage=start):
+            result = self._kickoff(start, inputs)
+        
+        print("\n✅ Project planning completed!")
+        
+        return self._finish_run(result, cache_key, inputs)
+    
+    async def plan_project_async(
+        self,
+        inputs: Dict[str, Any],
+        use_cache: bool = True,
+        timeout: Optional[float] = None,
+        on_event: Optional[EventListener] = None
+    ) -> ProjectPlan:
+        """
+        Execute project planning without blocking the event loop
+        
+        Args:
+            inputs: Same dictionary as plan_project
+            use_cache: Look up and store the result in the plan cache
+            timeout: Seconds to wait for the crew before raising
+                asyncio.TimeoutError (None waits forever)
+            on_event: Optional progress callback; it is invoked from the
+                crew's worker thread
+        
+        Returns:
+            ProjectPlan object with structured results
+        
+        Note:
+            On timeout the underlying kickoff keeps running in its worker
+            thread, so this crew must not be reused until it finishes.
+        """
+        self._validate_inputs(inputs)
+        
+        cache_key, cached_plan = self._lookup_cache(inputs, use_cache)
+        if cached_plan is not None:
+            self._emit_cached(on_event)
+            return cached_plan
+        
+        similar_plan, inputs = self._match_similar(inputs)
+        if similar_plan is not None:
+            self._emit_cached(on_event, message="Reused a similar plan")
+            return similar_plan
+        
+        print(f"\n🚀 Planning {inputs['project_type']} ({inputs['industry']})...")
+        
+        start = self._restore_stages(inputs, use_cache)
+        
+        with self._track_run(on_event, start_stage=start):
+            result = await asyncio.wait_for(
+                asyncio.to_thread(self._kickoff, start, inputs),
+                timeout=timeout
+            )
+        
+        return self._finish_run(result, cache_key, inputs)
+    
+    async def plan_as_completed(
+        self,
+        inputs_list: List[Dict[str, Any]],
+        max_concurrency: int = 4,
+        timeout: Optional[float] = None,
+        use_cache: bool = True
+    ) -> AsyncIterator[Tuple[int, Union[ProjectPlan, BaseException]]]:
+        """
+        Plan many projects concurrently, yielding results as they finish
+        
+        Args:
+            inputs_list: List of input dictionaries for plan_project
+            max_concurrency: Maximum number of crews running at once
+            timeout: Per-item timeout in seconds (None waits forever)
+            use_cache: Look up and store results in the plan cache
+        
+        Yields:
+            (index, result) tuples in completion order, where result is the
+            ProjectPlan or the exception raised for that input
+        """
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        
+        # Each concurrent run needs its own crew: tasks hold per-run state
+        workers: asyncio.Queue = asyncio.Queue()
+        for _ in range(min(max_concurrency, len(inputs_list))):
+            workers.put_nowait(self._spawn_worker())
+        
+        async def run_one(index: int, inputs: Dict[str, Any]):
+            worker = await workers.get()
+            try:
+                plan = await worker.plan_project_async(
+                    inputs, use_cache=use_cache, timeout=timeout
+                )
+                # Don't carry usage baselines and stage counters into the next run
+                worker.reset()
+                workers.put_nowait(worker)
+                return index, plan
+            except asyncio.TimeoutError as e:
+                # The timed-out kickoff is still running on the old crew
+                workers.put_nowait(self._spawn_worker())
+                return index, e
+            except Exception as e:
+                worker.reset()
+                workers.put_nowait(worker)
+                return index, e
+        
+        pending = [
+            asyncio.ensure_future(run_one(index, inputs))
+            for index, inputs in enumerate(inputs_list)
+        ]
+        try:
+            for next_done in asyncio.as_completed(pending):
+                yield await next_done
+        finally:
+            for future in pending:
+                future.cancel()
+    
+    async def plan_many_async(
+        self,
+        inputs_list: List[Dict[str, Any]],
+        max_concurrency: int = 4,
+        timeout: Optional[float] = None,
+        use_cache: bool = True,
+        return_exceptions: bool = False
+    ) -> List[Union[ProjectPlan, BaseException]]:
+        """
+        Plan many projects concurrently and return results in input order
+        
+        Args:
+            inputs_list: List of input dictionaries for plan_project
+            max_concurrency: Maximum number of crews running at once
+            timeout: Per-item timeout in seconds (None waits forever)
+            use_cache: Look up and store results in the plan cache
+            return_exceptions: Return per-item exceptions in the result list
+                instead of raising the first one
+        
+        Returns:
+            List of ProjectPlan (or exceptions) aligned with inputs_list
+        """
+        results: List[Union[ProjectPlan, BaseException, None]] = [None] * len(inputs_list)
+        async for index, result in self.plan_as_completed(
+            inputs_list,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            use_cache=use_cache
+        ):
+            if isinstance(result, BaseException) and not return_exceptions:
+                raise result
+            results[index] = result
+        return results
+    
+    def _validate_inputs(self, inputs: Dict[str, Any]) -> None:
+        """Raise ValueError if any required input key is missing"""
         required_keys = [
             'project_type',
             'project_objectives', 
@@ -80,33 +380,529 @@ class ProjectPlannerCrew:
         missing_keys = [key for key in required_keys if key not in inputs]
         if missing_keys:
             raise ValueError(f"Missing required input keys: {missing_keys}")
+    
+    def _lookup_cache(
+        self,
+        inputs: Dict[str, Any],
+        use_cache: bool
+    ) -> Tuple[Optional[str], Optional[ProjectPlan]]:
+        """Return the cache key for inputs and the cached plan, if any"""
+        self.last_result_cached = False
+        if self.cache is None or not use_cache:
+            return None, None
         
-        print("\n🚀 Starting project planning process...")
-        print(f"📋 Project Type: {inputs['project_type']}")
-        print(f"🏢 Industry: {inputs['industry']}\n")
+        cache_key = compute_cache_key(
+            inputs,
+            agents_config=self.agents_config_path,
+            tasks_config=self.tasks_config_path
+        )
+        cached_plan = self.cache.get(cache_key)
+        if cached_plan is not None:
+            print("⚡ Returning cached project plan")
+            self.last_result_cached = True
+        return cache_key, cached_plan
+    
+    def _match_similar(self, inputs: Dict[str, Any]) -> Tuple[Optional[ProjectPlan], Dict[str, Any]]:
+        """
+        Reuse or reference the most similar earlier plan
         
-        # Execute crew
-        result = self.crew.kickoff(inputs=inputs)
+        A plan is only reused outright when it was made for the same
+        team, since its estimates and allocation depend on the team.
+        Otherwise it is shown to the task breakdown as an example, and
+        the stage cache restores the breakdown when the project itself
+        is unchanged, so only estimation and allocation run again.
         
-        print("\n✅ Project planning completed!")
+        Returns:
+            The earlier plan if it is close enough to reuse (else None),
+            and the inputs with ``reference_plan`` filled in for the
+            task breakdown ("" when there is no useful example)
+        """
+        self.last_similar_plan = None
+        inputs = {**inputs, 'reference_plan': ""}
+        if self.similar_plans is None:
+            return None, inputs
+        
+        thresholds = [self.reference_threshold]
+        if self.reuse_threshold is not None:
+            thresholds.append(self.reuse_threshold)
+        match = self.similar_plans.best(inputs, min_score=min(thresholds))
+        if match is None or match.plan is None:
+            return None, inputs
+        
+        self.last_similar_plan = match
+        if self.reuse_threshold is not None and match.score >= self.reuse_threshold:
+            if same_team(match.inputs, inputs):
+                print(f"🔁 Reusing a similar earlier plan ({match.score:.0%} match)")
+                self.last_result_cached = True
+                return match.plan, inputs
+            print("👥 A similar earlier plan was made for a different team; re-estimating it")
+        if match.score >= self.reference_threshold:
+            print(f"🧭 Using a similar earlier plan as an example ({match.score:.0%} match)")
+            inputs['reference_plan'] = format_reference(match)
+        return None, inputs
+    
+    def _finish_run(
+        self,
+        result,
+        cache_key: Optional[str],
+        inputs: Optional[Dict[str, Any]] = None
+    ) -> ProjectPlan:
+        """Extract the ProjectPlan from a crew result and cache it"""
+        plan = result.pydantic
+        if cache_key is not None and plan is not None:
+            self.cache.put(cache_key, plan)
+        if inputs is not None:
+            self._store_stages(inputs)
+            if self.similar_plans is not None and plan is not None:
+                self.similar_plans.add(inputs, plan)
+        # Partial crews share our agents, so refresh our own totals
+        self.crew.calculate_usage_metrics()
+        return plan
+    
+    def _stage_key(self, index: int, inputs: Dict[str, Any]) -> str:
+        """Cache key of a stage given the outputs of the stages before it"""
+        stage = STAGES[index][0]
+        return compute_stage_key(
+            stage,
+            self.tasks_factory.tasks_config[stage],
+            inputs,
+            self.stage_fields.get(stage, ()),
+            [task.output.raw for task in self.tasks[:index]],
+            agents_config=self.agents_config_path,
+            compact_context=self.compact_context
+        )
+    
+    def _restore_stages(self, inputs: Dict[str, Any], use_cache: bool) -> int:
+        """
+        Restore leading stage outputs from the stage cache
+        
+        The final stage always runs, since it produces the ProjectPlan.
         
-        return result.pydantic
+        Returns:
+            Index of the first stage that has to run
+        """
+        self.reused_stages = 0
+        if self.stage_cache is None or not use_cache:
+            return 0
+        
+        for index, task in enumerate(self.tasks[:-1]):
+            raw = self.stage_cache.get(self._stage_key(index, inputs))
+            if raw is None:
+                break
+            task.output = TaskOutput(
+                description=task.description,
+                name=task.name,
+                raw=raw,
+                agent=task.agent.role
+            )
+            self.reused_stages = index + 1
+        
+        if self.reused_stages:
+            print(f"♻️ Reusing {self.reused_stages} unchanged stage(s)")
+        return self.reused_stages
+    
+    def _store_stages(self, inputs: Dict[str, Any]) -> None:
+        """Save the outputs of the intermediate stages that just ran"""
+        if self.stage_cache is None:
+            return
+        for index in range(self.reused_stages, len(self.tasks) - 1):
+            output = self.tasks[index].output
+            if output is None or not output.raw:
+                break
+            self.stage_cache.put(self._stage_key(index, inputs), output.raw)
+    
+    def _crew_from(self, start: int, stop: Optional[int] = None) -> Crew:
+        """Crew running the stages from ``start`` up to (not including) ``stop``"""
+        if start == 0 and stop is None:
+            return self.crew
+        if (start, stop) not in self._partial_crews:
+            self._partial_crews[(start, stop)] = Crew(
+                agents=self.agents,
+                tasks=self.tasks[start:stop],
+                verbose=self.verbose,
+                task_callback=self._on_task_complete,
+                step_callback=self._on_agent_step
+            )
+        return self._partial_crews[(start, stop)]
+    
+    def _kickoff(self, start: int, inputs: Dict[str, Any]):
+        """Run the stages from ``start`` onwards and return the checked crew result"""
+        return self._check_plan(self._run_stages(start, inputs), inputs)
+    
+    def _run_stages(self, start: int, inputs: Dict[str, Any]):
+        """Run the stages from ``start`` onwards and return the crew result"""
+        if start == BREAKDOWN_STAGE and self._plan_in_clusters(inputs):
+            start = ESTIMATION_STAGE
+        if not self.estimation_chunk_size or start > ESTIMATION_STAGE:
+            return self._crew_from(start).kickoff(inputs=inputs)
+        
+        if start < ESTIMATION_STAGE:
+            self._crew_from(start, ESTIMATION_STAGE).kickoff(inputs=inputs)
+        if self._estimate_in_chunks(inputs):
+            return self._crew_from(ESTIMATION_STAGE + 1).kickoff(inputs=inputs)
+        return self._crew_from(ESTIMATION_STAGE).kickoff(inputs=inputs)
+    
+    def _check_plan(self, result, inputs: Dict[str, Any]):
+        """
+        Validate the final plan and fix it locally where possible
+        
+        Broken milestone references, unassigned tasks and invalid hours
+        are repaired without the model. Only when issues remain is the
+        final stage re-run (up to plan_retries times); the earlier stage
+        outputs are kept as its context.
+        
+        Returns:
+            The crew result, with ``pydantic`` set to the repaired plan
+        """
+        self.last_plan_repairs = []
+        final_stage = len(self.tasks) - 1
+        for attempt in range(self.plan_retries + 1):
+            plan = getattr(result, 'pydantic', None)
+            if plan is None:
+                return result
+            repaired = repair_plan(plan)
+            result.pydantic = repaired.plan
+            if repaired.repairs:
+                print(f"🩹 Repaired plan locally: {', '.join(repaired.repairs)}")
+                self.last_plan_repairs.extend(
+                    name for name in repaired.repairs if name not in self.last_plan_repairs
+                )
+            if not repaired.needs_rerun:
+                return result
+            summary = repaired.report.summary()
+            if attempt == self.plan_retries:
+                print(f"⚠️ Plan still has issues: {summary}")
+                return result
+            print(f"🔄 Plan has issues local repair cannot fix ({summary}); re-running the final stage")
+            self._stage_index = final_stage
+            self._emit(STAGE_STARTED, message=f"Re-running to fix: {summary}")
+            result = self._crew_from(final_stage).kickoff(inputs=inputs)
+        return result
+    
+    def _estimate_in_chunks(self, inputs: Dict[str, Any]) -> bool:
+        """
+        Map-reduce the estimation stage over chunks of the task breakdown
+        
+        Each chunk of estimation_chunk_size tasks is estimated by its own
+        agent, at most estimation_workers at a time, and the estimates are
+        merged back in task order as the stage output.
+        
+        Returns:
+            False if the breakdown fits in one chunk (or its tasks could not
+            be identified), in which case nothing was run
+        """
+        breakdown = self.tasks[ESTIMATION_STAGE - 1].output.raw
+        header = ' | '.join(COMPACT_FIELDS)
+        if breakdown.startswith(header):
+            # Compacted breakdown: one row per task under a column header
+            blocks = breakdown.splitlines()[1:]
+        else:
+            header = None
+            blocks = split_task_blocks(breakdown)
+        
+        size = self.estimation_chunk_size
+        chunks = [blocks[i:i + size] for i in range(0, len(blocks), size)]
+        if len(chunks) < 2:
+            return False
+        
+        workers = min(self.estimation_workers, len(chunks))
+        print(f"🧩 Estimating {len(blocks)} tasks in {len(chunks)} chunks ({workers} parallel)")
+        
+        def estimate(index: int, agent: Agent) -> str:
+            first = index * size + 1
+            context = "\n\n".join(
+                [f"Tasks {first}-{first + len(chunks[index]) - 1} of {len(blocks)} "
+                 "from the task breakdown. Estimate only these tasks:"]
+                + ([header] if header else [])
+                + chunks[index]
+            )
+            task = self.tasks_factory.create_time_resource_estimation(agent)
+            task.interpolate_inputs_and_add_conversation_history(inputs)
+            return task.execute_sync(agent=agent, context=context).raw
+        
+        estimates = self._run_parallel('estimation_agent', estimate, len(chunks), workers, "Estimated chunk")
+        
+        stage = self.tasks[ESTIMATION_STAGE]
+        stage.output = TaskOutput(
+            description=stage.description,
+            name=stage.name,
+            raw="\n\n".join(estimate.strip() for estimate in estimates),
+            agent=stage.agent.role
+        )
+        self._on_task_complete(stage.output)
+        return True
+    
+    def _plan_in_clusters(self, inputs: Dict[str, Any]) -> bool:
+        """
+        Break down a long requirement list cluster by cluster
+        
+        Requirements are grouped by cluster_requirements, each cluster is
+        broken down by its own planning agent (at most planning_workers
+        at a time) and the breakdowns are merged without duplicate tasks
+        as the task_breakdown stage output.
+        
+        Returns:
+            False if the requirements fit in one cluster, in which case
+            nothing was run
+        """
+        if not self.requirement_cluster_size:
+            return False
+        clusters = cluster_requirements(str(inputs['project_requirements']), self.requirement_cluster_size)
+        if len(clusters) < 2:
+            return False
+        
+        workers = min(self.planning_workers, len(clusters))
+        print(f"🧱 Planning {sum(len(c.requirements) for c in clusters)} requirements "
+              f"in {len(clusters)} groups ({workers} parallel)")
+        
+        def plan(index: int, agent: Agent) -> str:
+            cluster = clusters[index]
+            requirements = (
+                f"Requirement group {index + 1} of {len(clusters)} ({cluster.label}). "
+                "Other groups are planned separately; only plan tasks for these requirements:\n"
+                f"{cluster.text}"
+            )
+            task = self.tasks_factory.create_task_breakdown(agent)
+            # The example covers the whole project, so groups plan without it
+            task.interpolate_inputs_and_add_conversation_history(
+                {**inputs, 'project_requirements': requirements, 'reference_plan': ""}
+            )
+            return task.execute_sync(agent=agent).raw
+        
+        outputs = self._run_parallel('project_planning_agent', plan, len(clusters), workers, "Planned requirement group")
+        merged = merge_cluster_breakdowns(outputs, [cluster.label for cluster in clusters])
+        if merged.duplicates:
+            print(f"🔗 Merged {merged.task_count} tasks, dropped {merged.duplicates} duplicates")
+        
+        stage = self.tasks[BREAKDOWN_STAGE]
+        stage.output = TaskOutput(
+            description=stage.description,
+            name=stage.name,
+            raw=merged.text,
+            agent=stage.agent.role
+        )
+        self._on_task_complete(stage.output)
+        return True
+    
+    def _run_parallel(
+        self,
+        agent_key: str,
+        job: Callable[[int, Agent], str],
+        count: int,
+        workers: int,
+        label: str
+    ) -> List[str]:
+        """
+        Run ``job(index, agent)`` for every index on a bounded thread pool
+        
+        Each job gets exclusive use of one copy of the agent for its run.
+        A stage_step event is emitted as each job finishes.
+        
+        Returns:
+            Job results in index order
+        """
+        agents: "queue.Queue[Agent]" = queue.Queue()
+        for agent in self._parallel_agents(agent_key, workers):
+            agents.put(agent)
+        
+        def run(index: int) -> str:
+            agent = agents.get()
+            try:
+                return job(index, agent)
+            finally:
+                agents.put(agent)
+        
+        results: List[str] = [""] * count
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(run, index): index for index in range(count)}
+            for done, future in enumerate(as_completed(futures), 1):
+                results[futures[future]] = future.result()
+                self._emit(STAGE_STEP, message=f"{label} {done}/{count}")
+        return results
+    
+    def _parallel_agents(self, agent_key: str, count: int) -> List[Agent]:
+        """Copies of an agent for parallel sub-runs, created on first use"""
+        agents = self._helper_agents.setdefault(agent_key, [])
+        create = getattr(self.agents_factory, f"create_{agent_key}")
+        while len(agents) < count:
+            agents.append(create())
+        return agents[:count]
+    
+    def _usage_totals(self) -> Dict[str, int]:
+        """Cumulative token usage of the crew's agents and chunk agents"""
+        totals = self._metrics_to_dict(self.crew.calculate_usage_metrics())
+        helpers = [agent for agents in self._helper_agents.values() for agent in agents]
+        for agent in helpers:
+            for key, value in usage_of(agent.llm).items():
+                totals[key] += value
+        return totals
+    
+    @contextmanager
+    def _track_run(self, on_event: Optional[EventListener], start_stage: int = 0):
+        """Emit run/stage events around a crew kickoff"""
+        self._event_listener = on_event
+        self._run_started_at = time.monotonic()
+        self._stage_index = 0
+        self._emit(RUN_STARTED)
+        for _ in range(start_stage):
+            self._emit(STAGE_FINISHED, message="Reused previous output")
+            self._stage_index += 1
+        self._emit(STAGE_STARTED)
+        try:
+            yield
+        except BaseException as e:
+            self._emit(RUN_FAILED, message=str(e) or type(e).__name__)
+            raise
+        else:
+            self._emit(RUN_FINISHED)
+        finally:
+            self._event_listener = None
+    
+    def _emit(self, kind: str, message: str = "") -> None:
+        """Send a PlanningEvent to the current listener, if any"""
+        listener = self._event_listener
+        if listener is None:
+            return
+        
+        index = self._stage_index
+        stage = STAGES[index][0] if index < len(STAGES) else None
+        agent = self.agents[index].role.strip() if index < len(self.agents) else None
+        tokens = self._usage_totals()['total_tokens']
+        
+        event = PlanningEvent(
+            kind=kind,
+            stage=stage,
+            stage_index=index,
+            total_stages=len(self.tasks),
+            agent=agent,
+            elapsed_seconds=time.monotonic() - self._run_started_at,
+            total_tokens=tokens - self._usage_baseline.get('total_tokens', 0),
+            message=message
+        )
+        try:
+            listener(event)
+        except Exception as e:
+            # A broken progress display must not abort the planning run
+            print(f"⚠️ Progress listener failed: {e}")
+    
+    def _emit_cached(self, on_event: Optional[EventListener], message: str = "Loaded from cache") -> None:
+        """Report a cache hit as an immediately finished run"""
+        if on_event is not None:
+            on_event(PlanningEvent(
+                kind=RUN_FINISHED,
+                stage=None,
+                stage_index=len(self.tasks),
+                total_stages=len(self.tasks),
+                agent=None,
+                elapsed_seconds=0.0,
+                total_tokens=0,
+                message=message
+            ))
+    
+    def _on_task_complete(self, output) -> None:
+        """Crew task callback: close the current stage and open the next"""
+        if self.compact_context:
+            self._compact_output(output)
+        self._emit(STAGE_FINISHED)
+        self._stage_index += 1
+        if self._stage_index < len(self.tasks):
+            self._emit(STAGE_STARTED)
+    
+    def _compact_output(self, output) -> None:
+        """Replace a stage output with its compact form for later stages"""
+        # Later stages read the same TaskOutput object as their context
+        consumers = len(self.tasks) - 1 - self._stage_index
+        if output is None or consumers <= 0 or not getattr(output, 'raw', None):
+            return
+        result = compact_stage_output(output.raw)
+        if result.compacted:
+            output.raw = result.text
+            self.context_tokens_saved += result.tokens_saved * consumers
+    
+    def _on_agent_step(self, step) -> None:
+        """Crew step callback: report that the current agent made progress"""
+        self._emit(STAGE_STEP)
+    
+    def _spawn_worker(self) -> "ProjectPlannerCrew":
+        """Create an independent crew with the same configuration"""
+        return ProjectPlannerCrew(
+            agents_config=self.agents_config_path,
+            tasks_config=self.tasks_config_path,
+            verbose=self.verbose,
+            cache=self.cache,
+            compact_context=self.compact_context,
+            stage_cache=self.stage_cache,
+            llm_factory=self.llm_factory,
+            structured_output=self.structured_output,
+            estimation_chunk_size=self.estimation_chunk_size,
+            estimation_workers=self.estimation_workers,
+            requirement_cluster_size=self.requirement_cluster_size,
+            planning_workers=self.planning_workers,
+            similar_plans=self.similar_plans,
+            reuse_threshold=self.reuse_threshold,
+            reference_threshold=self.reference_threshold,
+            plan_retries=self.plan_retries
+        )
+    
+    def _current_config_stamp(self) -> Tuple:
+        return (
+            config_registry.stamp(self.agents_config_path),
+            config_registry.stamp(self.tasks_config_path),
+        )
+    
+    def is_stale(self) -> bool:
+        """
+        Check whether the YAML configs changed since this crew was built
+        
+        Returns:
+            True if agents.yaml or tasks.yaml was modified on disk
+        """
+        try:
+            return self._current_config_stamp() != self.config_stamp
+        except FileNotFoundError:
+            return True
+    
+    def reset(self) -> None:
+        """
+        Prepare the crew for another run
+
+        Clears task outputs from the previous kickoff and snapshots the
+        cumulative LLM token counters so get_usage_metrics only reports
+        the next run.
+        """
+        for task in self.tasks:
+            task.output = None
+        self.last_result_cached = False
+        self.context_tokens_saved = 0
+        self.reused_stages = 0
+        self._usage_baseline = self._usage_totals()
+
+    @staticmethod
+    def _metrics_to_dict(metrics) -> Dict[str, int]:
+        return {
+            'total_tokens': metrics.total_tokens,
+            'prompt_tokens': metrics.prompt_tokens,
+            'completion_tokens': metrics.completion_tokens,
+            'successful_requests': metrics.successful_requests
+        }
     
     def get_usage_metrics(self) -> Optional[Dict[str, Any]]:
         """
         Get usage metrics from the crew execution
         
         Returns:
-            Dictionary with usage metrics or None if not available
-        """
-        if hasattr(self.crew, 'usage_metrics'):
-            metrics = self.crew.usage_metrics
-            return {
-                'total_tokens': metrics.total_tokens,
-                'prompt_tokens': metrics.prompt_tokens,
-                'completion_tokens': metrics.completion_tokens,
-                'successful_requests': metrics.successful_requests
+            Dictionary with usage metrics or None if not available.
+            ``context_tokens_saved`` estimates the prompt tokens avoided by
+            context compaction.
+        """
+        if getattr(self.crew, 'usage_metrics', None) is not None:
+            metrics = self._usage_totals()
+            usage = {
+                key: value - self._usage_baseline.get(key, 0)
+                for key, value in metrics.items()
             }
+            usage['context_tokens_saved'] = self.context_tokens_saved
+            return usage
         return None
     
     def calculate_cost(self, cost_per_million: float = 0.150) -> float:
@@ -133,7 +929,9 @@ def plan_project(
     industry: str,
     team_members: str,
     project_requirements: str,
-    verbose: bool = True
+    verbose: bool = True,
+    cache: Optional[PlanCache] = None,
+    on_event: Optional[EventListener] = None
 ) -> ProjectPlan:
     """
     Quick function to plan a project
@@ -145,11 +943,13 @@ def plan_project(
         team_members: Team members description
         project_requirements: Detailed requirements
         verbose: Enable verbose output
+        cache: Optional PlanCache for reusing identical requests
+        on_event: Optional callback receiving PlanningEvent progress updates
     
     Returns:
         ProjectPlan with structured results
     """
-    crew = ProjectPlannerCrew(verbose=verbose)
+    crew = ProjectPlannerCrew(verbose=verbose, cache=cache)
     
     inputs = {
         'project_type': project_type,
@@ -159,4 +959,4 @@ def plan_project(
         'project_requirements': project_requirements
     }
     
-    return crew.plan_project(inputs)
\ No newline at end of file
+    return crew.plan_project(inputs, on_event=on_event)
\ No newline at end of file
@@ -0,0 +1,86 @@
+"""
+Progress events for the AI Project Planner.
+Describes the structured events a ProjectPlannerCrew emits while a
+planning run moves through its agent stages.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+
+# Pipeline stages in execution order: (tasks.yaml key, display label)
+STAGES = (
+    ('task_breakdown', "Breaking down tasks"),
+    ('time_resource_estimation', "Estimating time and resources"),
+    ('resource_allocation', "Allocating resources and milestones"),
+)
+
+# Event kinds
+RUN_STARTED = "run_started"
+STAGE_STARTED = "stage_started"
+STAGE_STEP = "stage_step"
+STAGE_FINISHED = "stage_finished"
+RUN_FINISHED = "run_finished"
+RUN_FAILED = "run_failed"
+
+
+@dataclass(frozen=True)
+class PlanningEvent:
+    """A single progress update from a planning run"""
+
+    kind: str
+    stage: Optional[str]
+    stage_index: int
+    total_stages: int
+    agent: Optional[str]
+    elapsed_seconds: float
+    total_tokens: int
+    message: str = ""
+
+    @property
+    def progress(self) -> float:
+        """Fraction of stages completed, between 0.0 and 1.0"""
+        if self.kind == RUN_FINISHED:
+            return 1.0
+        done = self.stage_index + 1 if self.kind == STAGE_FINISHED else self.stage_index
+        return min(done / self.total_stages, 1.0) if self.total_stages else 0.0
+
+    @property
+    def label(self) -> str:
+        """Human readable label for the event's stage"""
+        for key, label in STAGES:
+            if key == self.stage:
+                return label
+        return self.stage or ""
+
+
+# Signature of functions that receive planning events
+EventListener = Callable[[PlanningEvent], None]
+
+
+def format_event(event: PlanningEvent) -> str:
+    """
+    Format an event as a single console line
+
+    Args:
+        event: Event to format
+
+    Returns:
+        Printable status line
+    """
+    position = f"[{min(event.stage_index + 1, event.total_stages)}/{event.total_stages}]"
+    timing = f"{event.elapsed_seconds:6.1f}s · {event.total_tokens:,} tokens"
+
+    if event.kind == RUN_STARTED:
+        return f"🚀 Planning started ({event.total_stages} stages)"
+    if event.kind == STAGE_STARTED:
+        return f"▶️  {position} {event.label} ({event.agent}) · {timing}"
+    if event.kind == STAGE_STEP:
+        return f"   … {position} {event.agent} is working · {timing}"
+    if event.kind == STAGE_FINISHED:
+        return f"✅ {position} {event.label} done · {timing}"
+    if event.kind == RUN_FINISHED:
+        return f"🏁 Planning finished · {timing}"
+    if event.kind == RUN_FAILED:
+        return f"❌ Planning failed at {event.label or 'startup'}: {event.message} · {timing}"
+    return f"{event.kind} {position} · {timing}"
@@ -0,0 +1,323 @@
+"""
+Streaming plan exporters for the AI Project Planner.
+Writes one plan, a batch result file or the whole plan store to JSONL,
+CSV, XLSX or Parquet, one plan at a time, so memory use stays bounded
+no matter how many plans are exported.
+"""
+
+import csv
+import io
+import json
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from .models import ProjectPlan
+
+
+# Export formats by file extension
+FORMATS = ('jsonl', 'csv', 'xlsx', 'parquet')
+
+# Tables of the flattened export, with their columns (after plan_id)
+TABLES: Dict[str, Tuple[str, ...]] = {
+    'tasks': ('task_name', 'estimated_time_hours', 'required_resources', 'dependencies', 'assignees'),
+    'milestones': ('milestone_name', 'task_count', 'tasks'),
+    'resources': ('resource', 'task_name', 'hours'),
+}
+
+# Rows buffered per Parquet row group
+PARQUET_BATCH_ROWS = 10_000
+
+# Separator for list values in flat tables
+LIST_SEPARATOR = ', '
+
+# (plan_id, plan) pairs; plan_id is None when exporting a single plan
+PlanRecords = Iterable[Tuple[Optional[str], ProjectPlan]]
+Target = Union[str, Path, IO[bytes]]
+
+
+def table_rows(plan: ProjectPlan, table: str) -> Iterator[Tuple[Any, ...]]:
+    """
+    Flatten one plan into the rows of an export table
+
+    Args:
+        plan: ProjectPlan to flatten
+        table: One of TABLES
+
+    Yields:
+        Row tuples matching TABLES[table]
+    """
+    if table == 'tasks':
+        for task in plan.tasks:
+            yield (
+                task.task_name,
+                task.estimated_time_hours,
+                LIST_SEPARATOR.join(task.required_resources),
+                LIST_SEPARATOR.join(task.dependencies),
+                LIST_SEPARATOR.join(task.assignees),
+            )
+    elif table == 'milestones':
+        for milestone in plan.milestones:
+            yield milestone.milestone_name, len(milestone.tasks), LIST_SEPARATOR.join(milestone.tasks)
+    elif table == 'resources':
+        for task in plan.tasks:
+            for resource in task.required_resources:
+                yield resource, task.task_name, task.estimated_time_hours
+    else:
+        raise ValueError(f"Unknown export table: {table!r} (expected one of {list(TABLES)})")
+
+
+def _columns(table: str, with_plan_id: bool) -> List[str]:
+    return (['plan_id'] if with_plan_id else []) + list(TABLES[table])
+
+
+def _rows(records: PlanRecords, table: str, with_plan_id: bool) -> Iterator[Tuple[Any, ...]]:
+    for plan_id, plan in records:
+        for row in table_rows(plan, table):
+            yield ((plan_id,) + row) if with_plan_id else row
+
+
+class _Output:
+    """Open a path for binary writing, or pass an open file object through"""
+
+    def __init__(self, target: Target):
+        self.target = target
+        self.file: Optional[IO[bytes]] = None
+
+    def __enter__(self) -> IO[bytes]:
+        if isinstance(self.target, (str, Path)):
+            Path(self.target).parent.mkdir(parents=True, exist_ok=True)
+            self.file = open(self.target, 'wb')
+            return self.file
+        return self.target
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if self.file is not None:
+            self.file.close()
+
+
+def write_jsonl(records: PlanRecords, target: Target) -> int:
+    """
+    Write one JSON line per plan
+
+    Args:
+        records: (plan_id, plan) pairs
+        target: Output path or binary file object
+
+    Returns:
+        Number of plans written
+    """
+    count = 0
+    with _Output(target) as output:
+        for plan_id, plan in records:
+            line = {'plan_id': plan_id, 'plan': plan.model_dump()} if plan_id is not None else plan.model_dump()
+            output.write(json.dumps(line, ensure_ascii=False).encode('utf-8') + b"\n")
+            count += 1
+    return count
+
+
+def write_csv(records: PlanRecords, target: Target, table: str = 'tasks', with_plan_id: bool = True) -> int:
+    """
+    Write one export table as CSV
+
+    Args:
+        records: (plan_id, plan) pairs
+        target: Output path or binary file object
+        table: Table to write (see TABLES)
+        with_plan_id: Start each row with the plan ID
+
+    Returns:
+        Number of rows written
+    """
+    count = 0
+    with _Output(target) as output:
+        text = io.TextIOWrapper(output, encoding='utf-8', newline='')
+        try:
+            writer = csv.writer(text)
+            writer.writerow(_columns(table, with_plan_id))
+            for row in _rows(records, table, with_plan_id):
+                writer.writerow(row)
+                count += 1
+        finally:
+            # Leave the caller's file open
+            text.flush()
+            text.detach()
+    return count
+
+
+def write_xlsx(records: PlanRecords, target: Target, with_plan_id: bool = True) -> int:
+    """
+    Write a workbook with tasks, milestones and resources sheets
+
+    Uses openpyxl's write-only mode, which streams rows to disk instead
+    of keeping every cell in memory.
+
+    Args:
+        records: (plan_id, plan) pairs
+        target: Output path or binary file object
+        with_plan_id: Start each row with the plan ID
+
+    Returns:
+        Number of plans written
+    """
+    from openpyxl import Workbook
+
+    workbook = Workbook(write_only=True)
+    sheets = {}
+    for table in TABLES:
+        sheets[table] = workbook.create_sheet(table)
+        sheets[table].append(_columns(table, with_plan_id))
+
+    count = 0
+    for plan_id, plan in records:
+        for table, sheet in sheets.items():
+            for row in table_rows(plan, table):
+                sheet.append(((plan_id,) + row) if with_plan_id else row)
+        count += 1
+
+    with _Output(target) as output:
+        workbook.save(output)
+    return count
+
+
+def write_parquet(
+    records: PlanRecords,
+    target: Target,
+    table: str = 'tasks',
+    with_plan_id: bool = True,
+    batch_rows: int = PARQUET_BATCH_ROWS
+) -> int:
+    """
+    Write one export table as Parquet, one row group per batch_rows rows
+
+    Requires the optional pyarrow package.
+
+    Args:
+        records: (plan_id, plan) pairs
+        target: Output path or binary file object
+        table: Table to write (see TABLES)
+        with_plan_id: Start each row with the plan ID
+        batch_rows: Rows buffered before a row group is written
+
+    Returns:
+        Number of rows written
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError as e:
+        raise ImportError("Parquet export needs pyarrow: pip install 'ai-project-planner[parquet]'") from e
+
+    types = {
+        'plan_id': pa.string(),
+        'estimated_time_hours': pa.float64(),
+        'hours': pa.float64(),
+        'task_count': pa.int64(),
+    }
+    columns = _columns(table, with_plan_id)
+    schema = pa.schema([(name, types.get(name, pa.string())) for name in columns])
+
+    count = 0
+    with _Output(target) as output, pq.ParquetWriter(output, schema) as writer:
+        batch: List[Tuple[Any, ...]] = []
+
+        def flush() -> None:
+            values = list(zip(*batch)) if batch else [[] for _ in columns]
+            writer.write_table(pa.table(
+                [pa.array(column, type=field.type) for column, field in zip(values, schema)],
+                schema=schema
+            ))
+            batch.clear()
+
+        for row in _rows(records, table, with_plan_id):
+            batch.append(row)
+            count += 1
+            if len(batch) >= batch_rows:
+                flush()
+        if batch or not count:
+            flush()
+    return count
+
+
+_WRITERS: Dict[str, Callable[..., int]] = {
+    'jsonl': write_jsonl,
+    'csv': write_csv,
+    'xlsx': write_xlsx,
+    'parquet': write_parquet,
+}
+
+
+def format_for(path: Union[str, Path]) -> str:
+    """
+    Export format implied by a file name
+
+    Raises:
+        ValueError: If the extension is not a known format
+    """
+    fmt = Path(path).suffix.lower().lstrip('.')
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown export format for {path}: expected one of {list(FORMATS)}")
+    return fmt
+
+
+def export_plans(records: PlanRecords, target: Target, fmt: Optional[str] = None, **options) -> int:
+    """
+    Stream plans to a file in any export format
+
+    Args:
+        records: (plan_id, plan) pairs, e.g. from iter_batch_plans or
+            PlanStore.iter_plans
+        target: Output path or binary file object
+        fmt: One of FORMATS (default: from the target's extension)
+        **options: Passed to the format's writer (e.g. table for CSV
+            and Parquet)
+
+    Returns:
+        Count reported by the writer (plans, or rows for flat tables)
+    """
+    if fmt is None:
+        if not isinstance(target, (str, Path)):
+            raise ValueError("fmt is required when exporting to a file object")
+        fmt = format_for(target)
+    if fmt not in _WRITERS:
+        raise ValueError(f"Unknown export format: {fmt!r} (expected one of {list(FORMATS)})")
+    return _WRITERS[fmt](records, target, **options)
+
+
+def export_plan(plan: ProjectPlan, fmt: str, **options) -> bytes:
+    """
+    Export a single plan to bytes (e.g. for a download button)
+
+    Args:
+        plan: ProjectPlan to export
+        fmt: One of FORMATS
+        **options: Passed to the format's writer
+
+    Returns:
+        The exported file contents
+    """
+    buffer = io.BytesIO()
+    if fmt != 'jsonl':
+        options.setdefault('with_plan_id', False)
+    export_plans([(None, plan)], buffer, fmt, **options)
+    return buffer.getvalue()
+
+
+def iter_batch_plans(path: Union[str, Path]) -> Iterator[Tuple[str, ProjectPlan]]:
+    """
+    Read the successful plans of a batch result file, one line at a time
+
+    Args:
+        path: JSONL output of run_batch
+
+    Yields:
+        (request_id, plan) pairs
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # A partially written last line from an interrupted run
+                continue
+            if record.get('status') == 'ok':
+                yield str(record['request_id']), ProjectPlan.model_validate(record['plan'])
@@ -0,0 +1,121 @@
+"""
+Columnar view of a ProjectPlan for the AI Project Planner.
+Builds NumPy/pandas columns once so totals, resource load and milestone
+metrics are vectorized and shared by every view.
+"""
+
+from itertools import chain
+from typing import Dict, Sequence
+
+import numpy as np
+import pandas as pd
+
+from .models import ProjectPlan
+
+
+class PlanFrame:
+    """Column-oriented, read-only representation of a ProjectPlan"""
+
+    def __init__(self, plan: ProjectPlan):
+        """
+        Build the columns from a plan in a single pass over its tasks
+
+        Args:
+            plan: ProjectPlan to represent
+        """
+        self.plan = plan
+        tasks = plan.tasks
+
+        self.task_names = np.array([task.task_name for task in tasks], dtype=object)
+        self.hours = np.fromiter(
+            (task.estimated_time_hours for task in tasks),
+            dtype=np.float64,
+            count=len(tasks)
+        )
+
+        # Exploded resources: one row per (task, resource)
+        resource_lists = [task.required_resources for task in tasks]
+        lengths = np.fromiter((len(r) for r in resource_lists), dtype=np.int64, count=len(tasks))
+        resource_task_index = np.repeat(np.arange(len(tasks)), lengths)
+        self.resources = pd.DataFrame({
+            'task_index': resource_task_index,
+            'resource': pd.Series(list(chain.from_iterable(resource_lists)), dtype=object),
+            'hours': self.hours[resource_task_index],
+        })
+
+        # Exploded milestone membership: one row per (milestone, task name)
+        unique_names = pd.Index(self.task_names).drop_duplicates(keep='first')
+        first_position = pd.Series(np.arange(len(tasks)), index=self.task_names)
+        first_position = first_position[~first_position.index.duplicated()].to_numpy()
+        member_names = list(chain.from_iterable(m.tasks for m in plan.milestones))
+        member_counts = [len(m.tasks) for m in plan.milestones]
+        # get_indexer returns -1 for unknown names, which lands on the
+        # appended sentinel: task index -1 and zero hours
+        found = unique_names.get_indexer(member_names)
+        task_index = np.append(first_position, -1)[found]
+        padded_hours = np.append(self.hours, 0.0)
+        self.milestones = pd.DataFrame({
+            'milestone_index': np.repeat(np.arange(len(member_counts)), member_counts),
+            'milestone_name': np.repeat(
+                np.array([m.milestone_name for m in plan.milestones], dtype=object),
+                member_counts
+            ),
+            'task_name': pd.Series(member_names, dtype=object),
+            'task_index': task_index,
+            'hours': padded_hours[task_index],
+        })
+        self.milestone_names = [m.milestone_name for m in plan.milestones]
+
+        self.tasks = pd.DataFrame({
+            'task_name': self.task_names,
+            'estimated_time_hours': self.hours,
+            'required_resources': [', '.join(r) for r in resource_lists],
+        })
+
+    def __len__(self) -> int:
+        return len(self.hours)
+
+    @property
+    def total_hours(self) -> float:
+        """Sum of all task estimates"""
+        return float(self.hours.sum())
+
+    @property
+    def total_days(self) -> float:
+        """Total effort in 8-hour days"""
+        return self.total_hours / 8
+
+    def resource_counts(self) -> pd.Series:
+        """Number of tasks each resource is required for, largest first"""
+        return self.resources['resource'].value_counts()
+
+    def resource_load(self) -> pd.Series:
+        """Hours of work each resource is attached to, largest first"""
+        return (
+            self.resources.groupby('resource', sort=False)['hours']
+            .sum()
+            .sort_values(ascending=False)
+        )
+
+    def milestone_hours(self) -> pd.Series:
+        """Hours of the tasks in each milestone, aligned with plan.milestones"""
+        totals = np.bincount(
+            self.milestones['milestone_index'].to_numpy(),
+            weights=self.milestones['hours'].to_numpy(),
+            minlength=len(self.milestone_names)
+        )
+        return pd.Series(totals, index=self.milestone_names, dtype=np.float64)
+
+    def percentiles(self, q: Sequence[float] = (50, 75, 90)) -> Dict[float, float]:
+        """
+        Task duration percentiles
+
+        Args:
+            q: Percentiles to compute (0-100)
+
+        Returns:
+            Mapping from percentile to hours
+        """
+        if not len(self.hours):
+            return {p: 0.0 for p in q}
+        return dict(zip(q, np.percentile(self.hours, q).tolist()))
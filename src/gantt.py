@@ -0,0 +1,187 @@
+"""
+Gantt chart data for the AI Project Planner.
+Builds timeline rows for a Schedule with vectorized operations, either
+one row per task or one bar per milestone, and caps the number of rows
+so very large plans stay light to render.
+"""
+
+from datetime import datetime
+from typing import Tuple
+
+import numpy as np
+import pandas as pd
+
+from .frame import PlanFrame
+from .scheduler import Schedule
+
+
+# Rows drawn before a task-level chart is downsampled
+MAX_GANTT_ROWS = 60
+
+# Pixel height per chart row, and the height cap of a chart
+ROW_HEIGHT = 28
+MAX_CHART_HEIGHT = 1800
+
+# Bar label for tasks that belong to no milestone
+UNASSIGNED_MILESTONE = "(No milestone)"
+
+
+def _timeline_columns(schedule: Schedule):
+    """Per-task start, finish and slack arrays aligned with schedule.tasks"""
+    count = len(schedule.tasks)
+    start = np.fromiter((task.start for task in schedule.tasks), dtype=np.float64, count=count)
+    finish = np.fromiter((task.finish for task in schedule.tasks), dtype=np.float64, count=count)
+    slack = np.fromiter((task.slack for task in schedule.tasks), dtype=np.float64, count=count)
+    critical = np.fromiter((task.critical for task in schedule.tasks), dtype=bool, count=count)
+    return start, finish, slack, critical
+
+
+def task_rows(schedule: Schedule, start_date: datetime) -> pd.DataFrame:
+    """
+    One Gantt row per scheduled task
+
+    Args:
+        schedule: Schedule computed by schedule_plan
+        start_date: Date the project starts (pass the same date to
+            every chart of a plan so their time axes line up)
+
+    Returns:
+        DataFrame with Task, Start, Finish, Resources, Slack (h) and
+        Critical columns, in plan order
+    """
+    start_date = pd.Timestamp(start_date)
+    start, finish, slack, critical = _timeline_columns(schedule)
+    return pd.DataFrame({
+        'Task': [task.task_name for task in schedule.tasks],
+        'Start': start_date + pd.to_timedelta(start, unit='h'),
+        'Finish': start_date + pd.to_timedelta(finish, unit='h'),
+        'Resources': [', '.join(task.resources) for task in schedule.tasks],
+        'Slack (h)': np.round(slack, 1),
+        'Critical': np.where(critical, '🔴 Critical', 'Has slack'),
+    })
+
+
+def milestone_rows(
+    schedule: Schedule,
+    frame: PlanFrame,
+    start_date: datetime
+) -> pd.DataFrame:
+    """
+    One Gantt bar per milestone, spanning its tasks
+
+    Tasks listed in no milestone are collected in an extra bar.
+
+    Args:
+        schedule: Schedule computed by schedule_plan
+        frame: PlanFrame of the same plan
+        start_date: Date the project starts (pass the same date to
+            every chart of a plan so their time axes line up)
+
+    Returns:
+        DataFrame with Milestone, Start, Finish, Tasks, Hours and Critical
+        columns, in milestone order (milestones without known tasks are
+        left out)
+    """
+    start_date = pd.Timestamp(start_date)
+    start, finish, _, critical = _timeline_columns(schedule)
+    names = frame.milestone_names
+
+    members = frame.milestones[frame.milestones['task_index'] >= 0]
+    group = members['milestone_index'].to_numpy()
+    task_index = members['task_index'].to_numpy()
+    unassigned = np.setdiff1d(np.arange(len(schedule.tasks)), task_index)
+    if len(unassigned):
+        group = np.concatenate([group, np.full(len(unassigned), len(names))])
+        task_index = np.concatenate([task_index, unassigned])
+        names = names + [UNASSIGNED_MILESTONE]
+
+    bars = pd.DataFrame({
+        'group': group,
+        'start': start[task_index],
+        'finish': finish[task_index],
+        'hours': frame.hours[task_index],
+        'critical': critical[task_index],
+    }).groupby('group', sort=True).agg(
+        start=('start', 'min'),
+        finish=('finish', 'max'),
+        tasks=('start', 'size'),
+        hours=('hours', 'sum'),
+        critical=('critical', 'any'),
+    )
+    return pd.DataFrame({
+        'Milestone': np.asarray(names, dtype=object)[bars.index.to_numpy()],
+        'Start': start_date + pd.to_timedelta(bars['start'].to_numpy(), unit='h'),
+        'Finish': start_date + pd.to_timedelta(bars['finish'].to_numpy(), unit='h'),
+        'Tasks': bars['tasks'].to_numpy(),
+        'Hours': np.round(bars['hours'].to_numpy(), 1),
+        'Critical': np.where(bars['critical'].to_numpy(), '🔴 Critical', 'Has slack'),
+        'milestone_index': bars.index.to_numpy(),
+    })
+
+
+def milestone_task_rows(
+    schedule: Schedule,
+    frame: PlanFrame,
+    milestone_index: int,
+    start_date: datetime
+) -> pd.DataFrame:
+    """
+    Task rows of a single milestone, for drilling down from its bar
+
+    Args:
+        schedule: Schedule computed by schedule_plan
+        frame: PlanFrame of the same plan
+        milestone_index: Position in plan.milestones, or
+            len(plan.milestones) for tasks in no milestone
+        start_date: Date the project starts (pass the same date to
+            every chart of a plan so their time axes line up)
+
+    Returns:
+        task_rows() restricted to the milestone's tasks
+    """
+    rows = task_rows(schedule, start_date)
+    known = frame.milestones['task_index'].to_numpy()
+    if milestone_index == len(frame.milestone_names):
+        keep = np.setdiff1d(np.arange(len(rows)), known[known >= 0])
+    else:
+        selected = frame.milestones['milestone_index'].to_numpy() == milestone_index
+        keep = np.unique(known[selected & (known >= 0)])
+    return rows.iloc[keep].reset_index(drop=True)
+
+
+def downsample_rows(rows: pd.DataFrame, max_rows: int = MAX_GANTT_ROWS) -> Tuple[pd.DataFrame, int]:
+    """
+    Cap the number of Gantt rows
+
+    Critical tasks are always kept (up to max_rows). The remaining rows
+    are picked evenly across the plan, so the chart still shows the
+    shape of the whole timeline, and plan order is preserved.
+
+    Args:
+        rows: Rows from task_rows() or milestone_task_rows()
+        max_rows: Maximum rows to keep
+
+    Returns:
+        (kept rows, number of rows left out)
+    """
+    if max_rows < 1:
+        raise ValueError("max_rows must be at least 1")
+    if len(rows) <= max_rows:
+        return rows, 0
+
+    is_critical = (rows['Critical'] == '🔴 Critical').to_numpy()
+    critical = np.flatnonzero(is_critical)[:max_rows]
+    others = np.flatnonzero(~is_critical)
+    slots = max_rows - len(critical)
+    if slots > 0 and len(others):
+        picks = np.unique(np.linspace(0, len(others) - 1, num=min(slots, len(others))).round().astype(int))
+        others = others[picks]
+    else:
+        others = others[:0]
+    keep = np.sort(np.concatenate([critical, others]))
+    return rows.iloc[keep].reset_index(drop=True), len(rows) - len(keep)
+
+
+def chart_height(row_count: int) -> int:
+    """Figure height in pixels for a chart with this many rows"""
+    return int(min(MAX_CHART_HEIGHT, max(400, row_count * ROW_HEIGHT + 120)))
@@ -0,0 +1,232 @@
+"""
+Hierarchical decomposition for the AI Project Planner.
+Groups long requirement lists into clusters that can be broken down by
+separate planning calls, and merges the per-cluster task breakdowns into
+one list without duplicate tasks.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+from .compaction import parse_task_blocks
+
+
+# Words that carry no topic information when comparing requirements
+_STOP_WORDS = {
+    'a', 'an', 'and', 'are', 'as', 'be', 'by', 'for', 'from', 'in', 'into',
+    'is', 'it', 'of', 'on', 'or', 'should', 'that', 'the', 'their', 'to',
+    'with', 'must', 'can', 'all', 'any', 'each', 'users', 'user', 'support', 'via',
+}
+
+# Minimum share of a requirement's keywords a cluster must already contain
+_AFFINITY = 0.3
+
+_BULLET = re.compile(r'^\s*(?:[-*+•]|\d+[.)]|[a-z][.)])\s+')
+_HEADING = re.compile(r'^\s*(?:#{1,6}\s+(?P<hash>.+?)|(?P<colon>[^-*+•\d].{0,60}?):)\s*$')
+_WORD = re.compile(r'[a-z0-9]+')
+
+# Task IDs such as T1, TASK-3 or FE_2.1 that can be namespaced per cluster
+_TASK_ID = re.compile(r'^[A-Za-z]+[-_]?\d+(?:\.\d+)*$')
+
+
+@dataclass
+class RequirementCluster:
+    """Group of related requirements planned by one planning call"""
+
+    label: str
+    requirements: List[str] = field(default_factory=list)
+
+    @property
+    def text(self) -> str:
+        """Requirements rendered as a bullet list"""
+        return "\n".join(f"- {requirement}" for requirement in self.requirements)
+
+
+@dataclass
+class MergedBreakdown:
+    """Outcome of merging per-cluster task breakdowns"""
+
+    text: str
+    task_count: int
+    duplicates: int
+
+
+def _stem(word: str) -> str:
+    for suffix in ('ing', 'ed', 'es', 's'):
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            return word[:-len(suffix)]
+    return word
+
+
+def _keywords(text: str) -> Set[str]:
+    text = re.sub(r'\bset\s+up\b', 'setup', text.lower())
+    return {_stem(word) for word in _WORD.findall(text) if word not in _STOP_WORDS and len(word) > 2}
+
+
+def _parse_requirements(text: str) -> List[Tuple[Optional[str], List[str]]]:
+    """Requirements grouped under their section headings, in order"""
+    lines = [line for line in text.splitlines() if line.strip()]
+    has_bullets = any(_BULLET.match(line) for line in lines)
+    sections: List[Tuple[Optional[str], List[str]]] = [(None, [])]
+
+    for line in lines:
+        heading = _HEADING.match(line) if not _BULLET.match(line) else None
+        if heading:
+            sections.append((heading.group('hash') or heading.group('colon'), []))
+            continue
+        items = sections[-1][1]
+        if _BULLET.match(line) or not has_bullets:
+            items.append(_BULLET.sub('', line).strip())
+        elif items:
+            # Wrapped continuation of the previous bullet
+            items[-1] = f"{items[-1]} {line.strip()}"
+        else:
+            items.append(line.strip())
+    return [(heading, items) for heading, items in sections if items]
+
+
+def _group_by_keywords(requirements: List[str], cluster_size: int) -> List[List[str]]:
+    """Greedily group requirements that share keywords, keeping their order"""
+    groups: List[List[str]] = []
+    group_words: List[Set[str]] = []
+    for requirement in requirements:
+        words = _keywords(requirement)
+        best, best_score = None, _AFFINITY
+        for index, existing in enumerate(group_words):
+            if len(groups[index]) >= cluster_size or not words or not existing:
+                continue
+            score = len(words & existing) / len(words)
+            if score >= best_score:
+                best, best_score = index, score
+        if best is None:
+            groups.append([requirement])
+            group_words.append(set(words))
+        else:
+            groups[best].append(requirement)
+            group_words[best] |= words
+    return groups
+
+
+def _label(requirements: List[str]) -> str:
+    counts: Dict[str, int] = {}
+    for requirement in requirements:
+        for word in _keywords(requirement):
+            counts[word] = counts.get(word, 0) + 1
+    top = sorted(counts, key=lambda word: (-counts[word], word))[:3]
+    return ", ".join(top) or "general"
+
+
+def cluster_requirements(text: str, cluster_size: int = 20) -> List[RequirementCluster]:
+    """
+    Group a requirement list into clusters of related requirements
+
+    Section headings ("## Payments", "Payments:") are kept as cluster
+    boundaries and split into consecutive pieces when too large.
+    Requirements outside any section are grouped by shared keywords.
+    Small neighbouring clusters are then combined up to cluster_size.
+
+    Args:
+        text: The project_requirements input
+        cluster_size: Maximum requirements per cluster
+
+    Returns:
+        Clusters in the order their first requirement appears
+    """
+    if cluster_size < 1:
+        raise ValueError("cluster_size must be at least 1")
+
+    groups: List[Tuple[Optional[str], List[str]]] = []
+    for heading, requirements in _parse_requirements(text):
+        if heading is None:
+            groups.extend((None, group) for group in _group_by_keywords(requirements, cluster_size))
+        else:
+            groups.extend(
+                (heading, requirements[i:i + cluster_size])
+                for i in range(0, len(requirements), cluster_size)
+            )
+
+    merged: List[Tuple[List[str], List[str]]] = []
+    for heading, requirements in groups:
+        if merged and len(merged[-1][1]) + len(requirements) <= cluster_size:
+            headings, combined = merged[-1]
+            combined.extend(requirements)
+        else:
+            headings, combined = [], list(requirements)
+            merged.append((headings, combined))
+        if heading and heading not in headings:
+            headings.append(heading)
+
+    # Clusters named by their headings, or by their commonest keywords
+    return [
+        RequirementCluster(" / ".join(headings) or _label(requirements), requirements)
+        for headings, requirements in merged
+    ]
+
+
+def _task_key(record: Dict[str, object]) -> Optional[frozenset]:
+    """Order-insensitive identity of a task, used to spot duplicates"""
+    words = _keywords(str(record.get('name') or record.get('description') or ''))
+    return frozenset(words) or None
+
+
+def _replace_ids(block: str, mapping: Dict[str, str]) -> str:
+    for old in sorted(mapping, key=len, reverse=True):
+        block = re.sub(rf'(?<![\w-]){re.escape(old)}(?![\w-]|\.\d)', mapping[old], block)
+    return block
+
+
+def merge_cluster_breakdowns(outputs: List[str], labels: List[str]) -> MergedBreakdown:
+    """
+    Merge the task breakdowns of several requirement clusters
+
+    Tasks are listed cluster by cluster under a heading per cluster.
+    A task whose name matches one already listed (ignoring word order,
+    case and filler words) is dropped, and references to its ID point to
+    the task that was kept. Letter-prefixed task IDs are namespaced per
+    cluster (T1 becomes C2-T1) so IDs stay unique across clusters.
+
+    Args:
+        outputs: Raw breakdown output of each cluster
+        labels: Cluster labels, aligned with outputs
+
+    Returns:
+        MergedBreakdown with the combined text and counts
+    """
+    seen: Dict[frozenset, str] = {}
+    sections: List[str] = []
+    task_count = 0
+    duplicates = 0
+
+    for index, (output, label) in enumerate(zip(outputs, labels), 1):
+        blocks = parse_task_blocks(output)
+        heading = f"## Requirement group {index} - {label}"
+        if not blocks:
+            # Nothing recognizable as tasks: keep the output as written
+            sections.append(f"{heading}\n\n{output.strip()}")
+            continue
+
+        mapping: Dict[str, str] = {}
+        kept: List[str] = []
+        for record, block in blocks:
+            task_id = str(record.get('id') or '')
+            namespaced = f"C{index}-{task_id}" if _TASK_ID.match(task_id) else task_id
+            key = _task_key(record)
+            if key is not None and key in seen:
+                duplicates += 1
+                if task_id and seen[key]:
+                    mapping[task_id] = seen[key]
+                continue
+            if namespaced != task_id:
+                mapping[task_id] = namespaced
+            if key is not None:
+                seen[key] = namespaced
+            kept.append(block)
+
+        task_count += len(kept)
+        if not kept:
+            continue
+        blocks_text = "\n\n".join(_replace_ids(block, mapping) for block in kept)
+        sections.append(f"{heading}\n\n{blocks_text}")
+
+    return MergedBreakdown(text="\n\n".join(sections), task_count=task_count, duplicates=duplicates)
@@ -0,0 +1,137 @@
+"""
+Indexed view of a ProjectPlan for the AI Project Planner.
+Gives every task an integer ID and resolves milestone membership and
+resource usage to ID arrays once, so consumers look tasks up by name in
+O(1) instead of scanning plan.tasks, and each distinct resource string
+is stored only once.
+"""
+
+import sys
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from .models import ProjectPlan, TaskEstimate
+
+
+# dtype of task, resource and milestone ID arrays
+ID_DTYPE = np.int32
+
+
+class IndexedPlan:
+    """Integer-ID companion to a ProjectPlan, built in one linear pass"""
+
+    def __init__(self, plan: ProjectPlan, share_strings: bool = True):
+        """
+        Index a plan
+
+        Task IDs are positions in plan.tasks. When a task name repeats,
+        the name maps to its first task (as in schedule_plan and
+        PlanFrame) and the later IDs are listed in duplicate_task_ids.
+
+        Args:
+            plan: ProjectPlan to index
+            share_strings: Replace equal resource strings inside the plan
+                with one interned object (values are unchanged)
+        """
+        self.plan = plan
+        tasks = plan.tasks
+        count = len(tasks)
+
+        self.task_names: List[str] = [sys.intern(task.task_name) for task in tasks]
+        self.hours = np.fromiter(
+            (task.estimated_time_hours for task in tasks),
+            dtype=np.float64,
+            count=count
+        )
+        self.task_ids: Dict[str, int] = {}
+        self.duplicate_task_ids: List[int] = []
+        for task_id, name in enumerate(self.task_names):
+            if self.task_ids.setdefault(name, task_id) != task_id:
+                self.duplicate_task_ids.append(task_id)
+
+        # Resources: one interned string and ID per distinct name, plus a
+        # flat (task ID, resource ID) edge list
+        self.resource_names: List[str] = []
+        self.resource_ids: Dict[str, int] = {}
+        edge_tasks: List[int] = []
+        edge_resources: List[int] = []
+        for task_id, task in enumerate(tasks):
+            resources = task.required_resources
+            for position, resource in enumerate(resources):
+                resource_id = self.resource_ids.get(resource)
+                if resource_id is None:
+                    resource_id = self.resource_ids[resource] = len(self.resource_names)
+                    self.resource_names.append(sys.intern(resource))
+                if share_strings:
+                    resources[position] = self.resource_names[resource_id]
+                edge_tasks.append(task_id)
+                edge_resources.append(resource_id)
+        self.resource_task_ids = np.array(edge_tasks, dtype=ID_DTYPE)
+        self.resource_index = np.array(edge_resources, dtype=ID_DTYPE)
+
+        # Milestones: resolved task IDs per milestone, unknown names kept
+        # aside, and the first milestone of every task (-1 for none)
+        self.milestone_names: List[str] = [m.milestone_name for m in plan.milestones]
+        self.milestone_task_ids: List[np.ndarray] = []
+        self.unknown_milestone_tasks: Dict[int, List[str]] = {}
+        self.milestone_of = np.full(count, -1, dtype=ID_DTYPE)
+        for milestone_id, milestone in enumerate(plan.milestones):
+            members: List[int] = []
+            for name in milestone.tasks:
+                task_id = self.task_ids.get(name)
+                if task_id is None:
+                    self.unknown_milestone_tasks.setdefault(milestone_id, []).append(name)
+                    continue
+                members.append(task_id)
+                if self.milestone_of[task_id] < 0:
+                    self.milestone_of[task_id] = milestone_id
+            self.milestone_task_ids.append(np.array(members, dtype=ID_DTYPE))
+
+        self._tasks_by_resource: Optional[Dict[str, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.task_names)
+
+    def __contains__(self, task_name: object) -> bool:
+        return task_name in self.task_ids
+
+    def task_id(self, task_name: str) -> Optional[int]:
+        """ID of the (first) task with this name, or None"""
+        return self.task_ids.get(task_name)
+
+    def task(self, task_name: str) -> Optional[TaskEstimate]:
+        """
+        Look up a task by name
+
+        Args:
+            task_name: Name as used in milestones and dependencies
+
+        Returns:
+            The TaskEstimate, or None if no task has this name
+        """
+        task_id = self.task_ids.get(task_name)
+        return None if task_id is None else self.plan.tasks[task_id]
+
+    @property
+    def tasks_by_resource(self) -> Dict[str, np.ndarray]:
+        """Task IDs requiring each resource, in plan order"""
+        if self._tasks_by_resource is None:
+            order = np.argsort(self.resource_index, kind='stable')
+            bounds = np.cumsum(np.bincount(self.resource_index, minlength=len(self.resource_names)))
+            groups = np.split(self.resource_task_ids[order], bounds[:-1])
+            self._tasks_by_resource = dict(zip(self.resource_names, groups))
+        return self._tasks_by_resource
+
+    def resource_task_ids_for(self, resource: str) -> np.ndarray:
+        """Task IDs requiring a resource (empty if it is not used)"""
+        return self.tasks_by_resource.get(resource, np.empty(0, dtype=ID_DTYPE))
+
+    def milestone_tasks(self, milestone_id: int) -> List[TaskEstimate]:
+        """Known tasks of a milestone, in the milestone's order"""
+        tasks = self.plan.tasks
+        return [tasks[task_id] for task_id in self.milestone_task_ids[milestone_id]]
+
+    def unassigned_task_ids(self) -> np.ndarray:
+        """IDs of tasks that belong to no milestone"""
+        return np.flatnonzero(self.milestone_of < 0).astype(ID_DTYPE)
@@ -0,0 +1,368 @@
+"""
+Background planning jobs for the AI Project Planner.
+A small in-process job service: planning requests are queued, run by a
+fixed set of worker threads on pooled crews, and persisted under
+outputs/ so a caller (e.g. a Streamlit session) can submit, disconnect
+and later poll for the finished ProjectPlan.
+"""
+
+import json
+import os
+import threading
+import time
+import uuid
+from dataclasses import asdict, dataclass, field, replace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .cache import INPUT_KEYS
+from .events import STAGE_STEP, PlanningEvent, format_event
+from .models import ProjectPlan
+from .pool import CrewPool
+from .store import PlanStore
+
+
+# Job statuses
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+FINISHED_STATUSES = (SUCCEEDED, FAILED)
+
+# Crew settings a job may override for its run
+JOB_OPTIONS = ('compact_context', 'estimation_chunk_size', 'requirement_cluster_size', 'reuse_threshold')
+
+
+@dataclass
+class Job:
+    """State of one planning job"""
+
+    job_id: str
+    inputs: Dict[str, Any]
+    use_cache: bool = True
+    options: Dict[str, Any] = field(default_factory=dict)
+    status: str = QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    progress: float = 0.0
+    message: str = ""
+    error: Optional[str] = None
+    plan: Optional[ProjectPlan] = None
+    usage: Optional[Dict[str, Any]] = None
+    cached: bool = False
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job succeeded or failed"""
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-serializable form of the job"""
+        data = asdict(self)
+        data['plan'] = self.plan.model_dump(mode='json') if self.plan is not None else None
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Job":
+        """Rebuild a job saved with to_dict"""
+        data = dict(data)
+        if data.get('plan') is not None:
+            data['plan'] = ProjectPlan.model_validate(data['plan'])
+        return cls(**data)
+
+
+# Signature of functions notified when a job changes
+JobListener = Callable[[Job], None]
+
+
+class JobQueue:
+    """Queue of planning jobs run by a fixed pool of worker threads"""
+
+    def __init__(
+        self,
+        pool: CrewPool,
+        workers: Optional[int] = None,
+        directory: str = "outputs/jobs",
+        max_jobs: int = 500,
+        store: Optional[PlanStore] = None
+    ):
+        """
+        Initialize the job service and start its workers
+
+        Jobs left queued or running by a previous process are queued again.
+
+        Args:
+            pool: Crews the workers check out for each job
+            workers: Number of worker threads (default: the pool size)
+            directory: Folder holding one JSON file per job
+            max_jobs: Finished jobs kept on disk; the oldest are deleted
+            store: Optional PlanStore that records every newly planned result
+        """
+        workers = workers or pool.size
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+
+        self.pool = pool
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.max_jobs = max_jobs
+        self.store = store
+        self._jobs: Dict[str, Job] = {}
+        self._pending: List[str] = []
+        self._listeners: Dict[str, List[JobListener]] = {}
+        self._changed = threading.Condition()
+        self._closed = False
+
+        for job in self._load_jobs():
+            if not job.finished:
+                # Interrupted by a restart; plan it again from the start
+                job = replace(job, status=QUEUED, started_at=None, progress=0.0, message="")
+                self._pending.append(job.job_id)
+            self._jobs[job.job_id] = job
+        if self._pending:
+            print(f"🔁 Resuming {len(self._pending)} unfinished planning job(s)")
+
+        self._threads = [
+            threading.Thread(target=self._work, name=f"planner-job-{index}", daemon=True)
+            for index in range(workers)
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    def _load_jobs(self) -> List[Job]:
+        jobs = []
+        for path in self.directory.glob("*.json"):
+            try:
+                jobs.append(Job.from_dict(json.loads(path.read_text(encoding='utf-8'))))
+            except (OSError, ValueError, TypeError) as e:
+                print(f"⚠️ Skipping unreadable job file {path.name}: {e}")
+        return sorted(jobs, key=lambda job: job.created_at)
+
+    def _save(self, job: Job) -> None:
+        path = self.directory / f"{job.job_id}.json"
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_path.write_text(json.dumps(job.to_dict(), ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp_path, path)
+
+    def submit(self, inputs: Dict[str, Any], use_cache: bool = True, **options) -> str:
+        """
+        Queue a planning request
+
+        Args:
+            inputs: Same dictionary as ProjectPlannerCrew.plan_project
+            use_cache: Look up and store the result in the plan cache
+            **options: Crew settings for this job (see JOB_OPTIONS)
+
+        Returns:
+            Job ID to poll with get() or wait()
+        """
+        missing = [key for key in INPUT_KEYS if key not in inputs]
+        if missing:
+            raise ValueError(f"Missing required input keys: {missing}")
+        unknown = sorted(set(options) - set(JOB_OPTIONS))
+        if unknown:
+            raise ValueError(f"Unknown job options: {unknown}")
+
+        job = Job(
+            job_id=uuid.uuid4().hex,
+            inputs={key: inputs[key] for key in INPUT_KEYS},
+            use_cache=use_cache,
+            options=options
+        )
+        with self._changed:
+            if self._closed:
+                raise RuntimeError("Job queue is shut down")
+            self._save(job)
+            self._jobs[job.job_id] = job
+            self._pending.append(job.job_id)
+            self._prune()
+            self._changed.notify_all()
+        return job.job_id
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Current state of a job
+
+        Args:
+            job_id: ID returned by submit()
+
+        Returns:
+            Snapshot of the job, or None if it is unknown
+        """
+        with self._changed:
+            return self._jobs.get(job_id)
+
+    def result(self, job_id: str) -> Optional[ProjectPlan]:
+        """ProjectPlan of a succeeded job, or None"""
+        job = self.get(job_id)
+        return job.plan if job is not None else None
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Job:
+        """
+        Block until a job has finished
+
+        Args:
+            job_id: ID returned by submit()
+            timeout: Seconds to wait (None waits forever)
+
+        Returns:
+            The finished job
+
+        Raises:
+            KeyError: If the job is unknown
+            TimeoutError: If the job is still unfinished after timeout
+        """
+        with self._changed:
+            if job_id not in self._jobs:
+                raise KeyError(job_id)
+            if not self._changed.wait_for(lambda: self._jobs[job_id].finished, timeout):
+                raise TimeoutError(f"Job {job_id} did not finish within {timeout}s")
+            return self._jobs[job_id]
+
+    def subscribe(self, job_id: str, listener: JobListener) -> Callable[[], None]:
+        """
+        Call listener with the job's state whenever it changes
+
+        The listener runs on the worker thread and is called right away
+        with the current state.
+
+        Args:
+            job_id: ID returned by submit()
+            listener: Callback receiving Job snapshots
+
+        Returns:
+            Function that removes the subscription
+        """
+        with self._changed:
+            if job_id not in self._jobs:
+                raise KeyError(job_id)
+            self._listeners.setdefault(job_id, []).append(listener)
+            job = self._jobs[job_id]
+
+        def unsubscribe() -> None:
+            with self._changed:
+                listeners = self._listeners.get(job_id, [])
+                if listener in listeners:
+                    listeners.remove(listener)
+
+        self._notify(job, [listener])
+        return unsubscribe
+
+    def jobs(self) -> List[Job]:
+        """All known jobs, newest first"""
+        with self._changed:
+            return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop the workers after their current job
+
+        Args:
+            wait: Block until the worker threads have exited
+        """
+        with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+    def _update(self, job_id: str, persist: bool = True, **changes) -> Job:
+        """Replace a job with an updated copy, save it and notify listeners"""
+        with self._changed:
+            job = replace(self._jobs[job_id], **changes)
+            self._jobs[job_id] = job
+            if persist:
+                self._save(job)
+            listeners = list(self._listeners.get(job_id, []))
+            self._changed.notify_all()
+        self._notify(job, listeners)
+        return job
+
+    @staticmethod
+    def _notify(job: Job, listeners: List[JobListener]) -> None:
+        for listener in listeners:
+            try:
+                listener(job)
+            except Exception as e:
+                print(f"⚠️ Job listener failed: {e}")
+
+    def _prune(self) -> None:
+        """Delete the oldest finished jobs beyond max_jobs (lock held)"""
+        finished = sorted(
+            (job for job in self._jobs.values() if job.finished),
+            key=lambda job: job.created_at
+        )
+        for job in finished[:max(len(self._jobs) - self.max_jobs, 0)]:
+            del self._jobs[job.job_id]
+            self._listeners.pop(job.job_id, None)
+            (self.directory / f"{job.job_id}.json").unlink(missing_ok=True)
+
+    def _next_job(self) -> Optional[str]:
+        with self._changed:
+            self._changed.wait_for(lambda: self._pending or self._closed)
+            if self._closed:
+                return None
+            return self._pending.pop(0)
+
+    def _work(self) -> None:
+        while True:
+            job_id = self._next_job()
+            if job_id is None:
+                return
+            self._run(job_id)
+
+    def _run(self, job_id: str) -> None:
+        """Plan one job on a pooled crew"""
+        job = self._update(job_id, status=RUNNING, started_at=time.time(), message="Waiting for a free planner")
+
+        def on_event(event: PlanningEvent) -> None:
+            # Step events are frequent; keep them in memory only
+            self._update(
+                job_id,
+                persist=event.kind != STAGE_STEP,
+                progress=event.progress,
+                message=format_event(event)
+            )
+
+        try:
+            with self.pool.checkout() as crew:
+                defaults = {name: getattr(crew, name) for name in JOB_OPTIONS}
+                try:
+                    for name, value in job.options.items():
+                        setattr(crew, name, value)
+                    plan = crew.plan_project(job.inputs, use_cache=job.use_cache, on_event=on_event)
+                    if plan is None:
+                        raise ValueError("Planner returned no structured plan")
+                    cached = crew.last_result_cached
+                    usage = None if cached else crew.get_usage_metrics()
+                finally:
+                    for name, value in defaults.items():
+                        setattr(crew, name, value)
+        except Exception as e:
+            print(f"❌ Planning job {job_id} failed: {e}")
+            self._update(
+                job_id,
+                status=FAILED,
+                finished_at=time.time(),
+                error=str(e) or type(e).__name__
+            )
+            return
+
+        if self.store is not None and not cached:
+            try:
+                self.store.add(plan, job.inputs)
+            except Exception as e:
+                print(f"⚠️ Could not record plan of job {job_id}: {e}")
+
+        self._update(
+            job_id,
+            status=SUCCEEDED,
+            finished_at=time.time(),
+            progress=1.0,
+            plan=plan,
+            usage=usage,
+            cached=cached
+        )
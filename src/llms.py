@@ -0,0 +1,161 @@
+"""
+LLM wrappers for the AI Project Planner.
+CrewAI BaseLLM subclasses that sit in front of an agent's real LLM to add
+behaviour (structured output repair, recording, routing) while keeping
+token usage accounting intact.
+"""
+
+import logging
+from typing import Any, Dict, Optional
+
+from crewai.llms.base_llm import BaseLLM, call_stop_override
+from pydantic import BaseModel
+
+from .repair import parse_structured_output
+
+
+# Token counters mirrored from the wrapped LLM
+USAGE_KEYS = ('prompt_tokens', 'completion_tokens', 'total_tokens', 'successful_requests')
+
+
+def usage_of(llm) -> Dict[str, int]:
+    """
+    Cumulative token usage of an LLM
+
+    Args:
+        llm: CrewAI LLM
+
+    Returns:
+        Counter values for USAGE_KEYS
+    """
+    summary = llm.get_token_usage_summary()
+    return {key: getattr(summary, key, 0) for key in USAGE_KEYS}
+
+
+class DelegatingLLM(BaseLLM):
+    """Base class for LLMs that forward calls to another LLM"""
+
+    llm_type: str = "delegating"
+    inner: Any = None
+
+    def _call_inner(self, llm, messages, **kwargs) -> Any:
+        """
+        Call a wrapped LLM and add its token usage to this instance
+
+        Stop words are set per call on the wrapper the agent talks to, so
+        they are passed through to the wrapped LLM.
+        """
+        before = usage_of(llm)
+        with call_stop_override(llm, self.stop_sequences or None):
+            result = llm.call(messages, **kwargs)
+        # Calls that raise (e.g. on a dead endpoint) are not counted
+        after = usage_of(llm)
+        self._track_token_usage_internal({
+            key: after[key] - before[key] for key in USAGE_KEYS
+        })
+        return result
+
+    def supports_function_calling(self) -> bool:
+        return bool(self.inner is not None and self.inner.supports_function_calling())
+
+    def get_context_window_size(self) -> int:
+        if self.inner is not None:
+            return self.inner.get_context_window_size()
+        return super().get_context_window_size()
+
+
+class StructuredOutputLLM(DelegatingLLM):
+    """
+    Produces structured output through constrained decoding plus local repair
+
+    When an agent asks for a response model, the wrapped LLM is asked for
+    JSON matching the model's schema (if its backend accepts a
+    ``response_format``) and the text is parsed locally with
+    parse_structured_output, so broken JSON never costs another LLM call.
+    """
+
+    llm_type: str = "structured"
+    constrained: bool = True
+
+    def call(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+        response_model=None
+    ):
+        """Forward a call, turning structured requests into repaired models"""
+        options = {
+            'tools': tools,
+            'callbacks': callbacks,
+            'available_functions': available_functions,
+            'from_task': from_task,
+            'from_agent': from_agent,
+        }
+        if response_model is None:
+            return self._call_inner(self.inner, messages, response_model=None, **options)
+
+        text = self._call_constrained(messages, response_model, options)
+        if isinstance(text, BaseModel):
+            return text
+        try:
+            result, repairs = parse_structured_output(str(text), response_model)
+        except ValueError as e:
+            # Leave it to CrewAI's own conversion as a last resort
+            logging.warning(f"Structured output repair failed: {e}")
+            return text
+        if repairs:
+            print(f"🩹 Repaired {response_model.__name__} output: {', '.join(repairs)}")
+        return result
+
+    def _call_constrained(self, messages, response_model, options: Dict[str, Any]) -> Any:
+        """Ask the backend for schema-constrained JSON when it supports it"""
+        if not self.constrained or 'response_format' not in type(self.inner).model_fields:
+            return self._call_inner(self.inner, messages, response_model=None, **options)
+
+        previous = self.inner.response_format
+        self.inner.response_format = {
+            'type': 'json_schema',
+            'json_schema': {
+                'name': response_model.__name__,
+                'schema': response_model.model_json_schema(),
+            },
+        }
+        try:
+            return self._call_inner(self.inner, messages, response_model=None, **options)
+        except Exception as e:
+            if not _is_unsupported_format(e):
+                raise
+            # The backend rejected response_format; stop asking for it
+            print(f"⚠️ Constrained output not supported by {self.inner.model}, using local repair only")
+            self.constrained = False
+        finally:
+            self.inner.response_format = previous
+        return self._call_inner(self.inner, messages, response_model=None, **options)
+
+    @classmethod
+    def wrap(cls, llm: Optional[BaseLLM], constrained: bool = True) -> "StructuredOutputLLM":
+        """
+        Wrap an agent's LLM
+
+        Args:
+            llm: LLM to wrap (CrewAI's environment-configured LLM if None)
+            constrained: Request schema-constrained JSON from the backend
+
+        Returns:
+            StructuredOutputLLM delegating to llm
+        """
+        if llm is None:
+            from crewai.utilities.llm_utils import create_llm
+            llm = create_llm(None)
+        return cls(model=llm.model, inner=llm, constrained=constrained)
+
+
+def _is_unsupported_format(error: Exception) -> bool:
+    """Whether an LLM error means the backend does not accept response_format"""
+    status = getattr(error, 'status_code', None)
+    message = str(error).lower()
+    return status in (400, 422) and ('response_format' in message or 'json_schema' in message)
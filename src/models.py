@@ -22,13 +22,23 @@ class TaskEstimate(BaseModel):
         ..., 
         description="List of resources required to complete the task"
     )
+    dependencies: List[str] = Field(
+        default_factory=list,
+        description="Names of tasks that must be finished before this task can start"
+    )
+    assignees: List[str] = Field(
+        default_factory=list,
+        description="Team members assigned to the task"
+    )
     
     class Config:
         json_schema_extra = {
             "example": {
                 "task_name": "Design homepage mockup",
                 "estimated_time_hours": 8.0,
-                "required_resources": ["UI Designer", "Figma"]
+                "required_resources": ["UI Designer", "Figma"],
+                "dependencies": ["Gather requirements"],
+                "assignees": ["Bob Wilson"]
             }
         }
 
@@ -73,7 +83,9 @@ class ProjectPlan(BaseModel):
                     {
                         "task_name": "Design homepage",
                         "estimated_time_hours": 8.0,
-                        "required_resources": ["UI Designer"]
+                        "required_resources": ["UI Designer"],
+                        "dependencies": [],
+                        "assignees": ["Bob Wilson"]
                     }
                 ],
                 "milestones": [
@@ -0,0 +1,172 @@
+"""
+Crew pooling for the AI Project Planner.
+Keeps a fixed number of pre-built crews that are checked out for a
+planning run and returned afterwards, so agents, tasks and configs are
+not rebuilt on every request.
+"""
+
+import queue
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+
+from .cache import PlanCache, StageCache
+from .crew import ProjectPlannerCrew
+from .retrieval import SimilarPlanIndex
+
+
+class CrewPool:
+    """Thread-safe pool of warm ProjectPlannerCrew instances"""
+
+    def __init__(
+        self,
+        size: int = 2,
+        agents_config: str = "config/agents.yaml",
+        tasks_config: str = "config/tasks.yaml",
+        verbose: bool = False,
+        cache: Optional[PlanCache] = None,
+        stage_cache: Optional[StageCache] = None,
+        llm_factory: Optional[Callable[[str], Any]] = None,
+        structured_output: bool = True,
+        estimation_chunk_size: Optional[int] = None,
+        estimation_workers: int = 4,
+        requirement_cluster_size: Optional[int] = None,
+        planning_workers: int = 4,
+        similar_plans: Optional[SimilarPlanIndex] = None,
+        reuse_threshold: Optional[float] = None,
+        reference_threshold: float = 0.35,
+        plan_retries: int = 1
+    ):
+        """
+        Initialize the pool and build all crews up front
+
+        Args:
+            size: Number of crews, which is also the maximum number of
+                concurrent planning runs
+            agents_config: Path to agents configuration
+            tasks_config: Path to tasks configuration
+            verbose: Enable verbose output for pooled crews
+            cache: Optional PlanCache shared by every pooled crew
+            stage_cache: Optional StageCache shared by every pooled crew, so
+                any crew can reuse stages planned by another
+            llm_factory: Optional callable returning the LLM for each agent
+            structured_output: Constrain and locally repair the final plan
+            estimation_chunk_size: Estimate tasks in parallel chunks of this
+                size (None estimates all tasks in one call)
+            estimation_workers: Concurrent estimation calls per crew
+            requirement_cluster_size: Plan long requirement lists in
+                parallel clusters of this size (None plans them at once)
+            planning_workers: Concurrent planning calls per crew
+            similar_plans: Optional SimilarPlanIndex shared by every pooled crew
+            reuse_threshold: Similarity at which an earlier plan is returned
+                instead of planning (None never reuses)
+            reference_threshold: Similarity at which an earlier plan is shown
+                to the task breakdown as an example
+            plan_retries: Final-stage re-runs per request for plans that
+                local repair cannot fix
+        """
+        if size < 1:
+            raise ValueError("Pool size must be at least 1")
+
+        self.size = size
+        self._crew_options = {
+            'agents_config': agents_config,
+            'tasks_config': tasks_config,
+            'verbose': verbose,
+            'cache': cache,
+            'stage_cache': stage_cache,
+            'llm_factory': llm_factory,
+            'structured_output': structured_output,
+            'estimation_chunk_size': estimation_chunk_size,
+            'estimation_workers': estimation_workers,
+            'requirement_cluster_size': requirement_cluster_size,
+            'planning_workers': planning_workers,
+            'similar_plans': similar_plans,
+            'reuse_threshold': reuse_threshold,
+            'reference_threshold': reference_threshold,
+            'plan_retries': plan_retries,
+        }
+        self._available: "queue.Queue[ProjectPlannerCrew]" = queue.Queue(maxsize=size)
+        self._members = set()
+        self._closed = False
+
+        for _ in range(size):
+            crew = ProjectPlannerCrew(**self._crew_options)
+            self._members.add(id(crew))
+            self._available.put(crew)
+
+        print(f"✅ Crew pool ready with {size} crews")
+
+    @property
+    def available(self) -> int:
+        """Number of crews currently idle in the pool"""
+        return self._available.qsize()
+
+    def acquire(self, timeout: Optional[float] = None) -> ProjectPlannerCrew:
+        """
+        Check a crew out of the pool, waiting if all crews are busy
+
+        Args:
+            timeout: Seconds to wait for a free crew (None waits forever)
+
+        Returns:
+            A reset ProjectPlannerCrew ready for a new run; crews built
+            from outdated YAML configs are rebuilt first
+        """
+        if self._closed:
+            raise RuntimeError("Crew pool is closed")
+        try:
+            crew = self._available.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No planner crew became available within {timeout}s")
+        if crew.is_stale():
+            crew = self._rebuild(crew)
+        crew.reset()
+        return crew
+
+    def _rebuild(self, stale_crew: ProjectPlannerCrew) -> ProjectPlannerCrew:
+        """Replace a crew whose configs changed on disk"""
+        try:
+            crew = ProjectPlannerCrew(**self._crew_options)
+        except Exception:
+            # Keep the pool at full size even if the new config is broken
+            self._available.put_nowait(stale_crew)
+            raise
+        self._members.discard(id(stale_crew))
+        self._members.add(id(crew))
+        print("🔄 Rebuilt pooled crew after config change")
+        return crew
+
+    def release(self, crew: ProjectPlannerCrew) -> None:
+        """
+        Return a crew to the pool
+
+        Args:
+            crew: Crew previously obtained from acquire()
+        """
+        if id(crew) not in self._members:
+            raise ValueError("Crew does not belong to this pool")
+        if not self._closed:
+            self._available.put_nowait(crew)
+
+    @contextmanager
+    def checkout(self, timeout: Optional[float] = None) -> Iterator[ProjectPlannerCrew]:
+        """
+        Context manager that acquires a crew and always releases it
+
+        Args:
+            timeout: Seconds to wait for a free crew (None waits forever)
+        """
+        crew = self.acquire(timeout=timeout)
+        try:
+            yield crew
+        finally:
+            self.release(crew)
+
+    def close(self) -> None:
+        """Stop handing out crews and drop idle ones"""
+        self._closed = True
+        while True:
+            try:
+                self._available.get_nowait()
+            except queue.Empty:
+                break
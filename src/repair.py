@@ -0,0 +1,335 @@
+"""
+Local repair of structured model output for the AI Project Planner.
+Turns slightly broken JSON from small local models (trailing commas,
+hours as "8h", missing keys) into a valid ProjectPlan without another
+LLM round-trip, and counts how often each repair was needed.
+"""
+
+import json
+import re
+import threading
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from .models import ProjectPlan
+
+
+# Field names small models use instead of the schema's
+_TASK_ALIASES = {
+    'name': 'task_name',
+    'task': 'task_name',
+    'title': 'task_name',
+    'hours': 'estimated_time_hours',
+    'estimated_hours': 'estimated_time_hours',
+    'estimated_time': 'estimated_time_hours',
+    'estimate': 'estimated_time_hours',
+    'duration': 'estimated_time_hours',
+    'resources': 'required_resources',
+    'depends_on': 'dependencies',
+    'assignee': 'assignees',
+    'assigned_to': 'assignees',
+    'team_members': 'assignees',
+}
+
+_MILESTONE_ALIASES = {
+    'name': 'milestone_name',
+    'milestone': 'milestone_name',
+    'title': 'milestone_name',
+    'task_names': 'tasks',
+}
+
+_LIST_FIELDS = ('required_resources', 'dependencies', 'assignees')
+
+# Working hours per unit when durations are given in other units (a
+# month is four 40-hour weeks; a bare "m" means minutes)
+_UNIT_HOURS = {
+    'month': 160.0,
+    'week': 40.0,
+    'day': 8.0,
+    'hour': 1.0,
+    'minute': 1 / 60,
+}
+_UNIT_ALIASES = (
+    ('month', r'months?|mos?'),
+    ('week', r'weeks?|wks?|w'),
+    ('day', r'days?|d'),
+    ('hour', r'hours?|hrs?|h'),
+    ('minute', r'minutes?|mins?|m'),
+)
+# A number with an optional unit written right after it ("2d", "1.5 days")
+_DURATION = re.compile(
+    r'(\d+(?:\.\d+)?)\s*(?:' + '|'.join(f'(?P<{unit}>{pattern})' for unit, pattern in _UNIT_ALIASES) + r')?\b',
+    re.IGNORECASE
+)
+# Thousands separators inside numbers ("1,000"); other commas between
+# digits are decimal commas ("1,5")
+_THOUSANDS = re.compile(r'(?<=\d),(?=\d{3}(?!\d))')
+_DECIMAL_COMMA = re.compile(r'(?<=\d),(?=\d)')
+# Text between two numbers that makes them the bounds of a range
+_RANGE_SEPARATOR = re.compile(r'\s*(?:-|–|—|~|to|or)\s*', re.IGNORECASE)
+
+
+class RepairStats:
+    """Thread-safe counters of parsed outputs and the repairs they needed"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts: Counter = Counter()
+
+    def record(self, repairs: List[str], failed: bool = False) -> None:
+        """Count one parsed output and the repairs applied to it"""
+        with self._lock:
+            self._counts['parsed'] += 1
+            if failed:
+                self._counts['failed'] += 1
+            elif repairs:
+                self._counts['repaired'] += 1
+            self._counts.update(f"repair.{name}" for name in repairs)
+
+    def snapshot(self) -> Dict[str, int]:
+        """
+        Current counter values
+
+        Returns:
+            ``parsed``, ``repaired`` and ``failed`` totals plus one
+            ``repair.<name>`` entry per repair that fired
+        """
+        with self._lock:
+            return dict(self._counts)
+
+    def reset(self) -> None:
+        """Set every counter back to zero"""
+        with self._lock:
+            self._counts.clear()
+
+
+# Process-wide counters shared by every crew
+repair_stats = RepairStats()
+
+
+def _extract_json(text: str, repairs: List[str]) -> str:
+    """Cut the JSON value out of surrounding prose or code fences"""
+    stripped = text.strip()
+    fenced = re.search(r'```(?:json)?\s*(.*?)(?:```|$)', stripped, re.DOTALL)
+    candidate = fenced.group(1).strip() if fenced else stripped
+    starts = [index for index in (candidate.find('{'), candidate.find('[')) if index >= 0]
+    if starts:
+        candidate = candidate[min(starts):]
+        end = max(candidate.rfind('}'), candidate.rfind(']'))
+        # Keep truncated output as-is; bracket closing handles it later
+        if end >= 0 and _balance(candidate[:end + 1]) == "":
+            candidate = candidate[:end + 1]
+    if candidate != stripped:
+        repairs.append('extracted_json')
+    return candidate
+
+
+def _balance(text: str) -> str:
+    """Closing characters needed to balance strings and brackets in text"""
+    stack = []
+    in_string = False
+    escaped = False
+    for char in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in '{[':
+            stack.append('}' if char == '{' else ']')
+        elif char in '}]' and stack and stack[-1] == char:
+            stack.pop()
+    return ('"' if in_string else '') + ''.join(reversed(stack))
+
+
+def _apply(text: str, name: str, pattern: str, replacement, repairs: List[str], flags: int = 0) -> str:
+    fixed = re.sub(pattern, replacement, text, flags=flags)
+    if fixed != text:
+        repairs.append(name)
+    return fixed
+
+
+def _repair_syntax(text: str, repairs: List[str]) -> str:
+    """Fix the JSON syntax errors small models commonly make"""
+    text = _apply(text, 'smart_quotes', r'[“”]', '"', repairs)
+    if '"' not in text:
+        text = _apply(text, 'single_quotes', r"'([^'\\]*)'", r'"\1"', repairs)
+    text = _apply(text, 'unquoted_keys', r'([{,]\s*)([A-Za-z_]\w*)\s*:', r'\1"\2":', repairs)
+    text = _apply(
+        text, 'python_literals', r':\s*(True|False|None)\s*(?=[,}\]])',
+        lambda m: ': ' + {'True': 'true', 'False': 'false', 'None': 'null'}[m.group(1)],
+        repairs
+    )
+    text = _apply(text, 'missing_commas', r'([}\]"])\s*\n(\s*)(?=[{"])', r'\1,\n\2', repairs)
+    text = _apply(text, 'trailing_commas', r',\s*(?=[}\]])', '', repairs)
+
+    closers = _balance(text)
+    if closers:
+        # Drop a dangling comma or key before closing a truncated value
+        text = re.sub(r'[,:]\s*$', '', text.rstrip()) + closers
+        text = re.sub(r',\s*(?=[}\]])', '', text)
+        repairs.append('closed_brackets')
+    return text
+
+
+def _coerce_hours(value: Any, repairs: List[str]) -> Any:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    text = _DECIMAL_COMMA.sub('.', _THOUSANDS.sub('', str(value)))
+    matches = list(_DURATION.finditer(text))
+    if not matches:
+        repairs.append('hours_defaulted')
+        return 0.0
+
+    # A number without a unit takes the next unit given ("8-12h"), or hours
+    units: List[Optional[str]] = [
+        next((unit for unit, found in match.groupdict().items() if found), None)
+        for match in matches
+    ]
+    following = 'hour'
+    for index in range(len(units) - 1, -1, -1):
+        following = units[index] = units[index] or following
+
+    # Parts of a compound duration add up ("2 weeks 3 days"); a range
+    # separator starts another bound, and the upper bound is used
+    bounds = [0.0]
+    for index, match in enumerate(matches):
+        if index and _RANGE_SEPARATOR.fullmatch(text, matches[index - 1].end(), match.start()):
+            bounds.append(0.0)
+        bounds[-1] += float(match.group(1)) * _UNIT_HOURS[units[index]]
+    repairs.append('hours_coerced')
+    return max(bounds)
+
+
+def _coerce_list(value: Any, repairs: List[str]) -> List[Any]:
+    if isinstance(value, list):
+        return value
+    repairs.append('lists_coerced')
+    if value is None:
+        return []
+    return [item.strip() for item in re.split(r'[,;]', str(value)) if item.strip()]
+
+
+def _rename(entry: Dict[str, Any], aliases: Dict[str, str], repairs: List[str]) -> Dict[str, Any]:
+    renamed = {}
+    for key, value in entry.items():
+        target = aliases.get(key, key)
+        if target != key:
+            if target in entry:
+                continue
+            repairs.append('renamed_keys')
+        renamed[target] = value
+    return renamed
+
+
+def _coerce_plan(data: Any, repairs: List[str]) -> Any:
+    """Reshape parsed JSON towards the ProjectPlan schema"""
+    if isinstance(data, list):
+        data = {'tasks': data}
+        repairs.append('wrapped_task_list')
+    if not isinstance(data, dict):
+        return data
+    if 'tasks' not in data and len(data) == 1:
+        inner = next(iter(data.values()))
+        if isinstance(inner, dict) and 'tasks' in inner:
+            data = inner
+            repairs.append('unwrapped_plan')
+
+    data = dict(data)
+    if 'tasks' not in data:
+        data['tasks'] = []
+        repairs.append('missing_tasks')
+    if 'milestones' not in data or data['milestones'] is None:
+        data['milestones'] = []
+        repairs.append('missing_milestones')
+
+    tasks = []
+    for task in _coerce_list(data['tasks'], repairs):
+        if not isinstance(task, dict):
+            tasks.append(task)
+            continue
+        task = _rename(task, _TASK_ALIASES, repairs)
+        if 'estimated_time_hours' not in task:
+            repairs.append('hours_defaulted')
+            task['estimated_time_hours'] = 0.0
+        else:
+            task['estimated_time_hours'] = _coerce_hours(task['estimated_time_hours'], repairs)
+        for field in _LIST_FIELDS:
+            if field in task:
+                task[field] = _coerce_list(task[field], repairs)
+        task.setdefault('required_resources', [])
+        tasks.append(task)
+    data['tasks'] = tasks
+
+    milestones = []
+    for milestone in _coerce_list(data['milestones'], repairs):
+        if isinstance(milestone, dict):
+            milestone = _rename(milestone, _MILESTONE_ALIASES, repairs)
+            members = _coerce_list(milestone.get('tasks', []), repairs)
+            if any(isinstance(member, dict) for member in members):
+                repairs.append('milestone_tasks_coerced')
+                members = [
+                    member.get('task_name') or member.get('name', '') if isinstance(member, dict) else member
+                    for member in members
+                ]
+            milestone['tasks'] = [str(member) for member in members]
+        milestones.append(milestone)
+    data['milestones'] = milestones
+    return data
+
+
+def parse_structured_output(
+    text: str,
+    model: Type[BaseModel] = ProjectPlan,
+    stats: RepairStats = repair_stats
+) -> Tuple[BaseModel, List[str]]:
+    """
+    Parse model output into a Pydantic model, repairing it if needed
+
+    Valid JSON is validated directly. Otherwise the JSON is extracted
+    from surrounding text, syntax errors are fixed and, for ProjectPlan,
+    values are coerced to the schema (hours from strings, lists from
+    comma-separated text, missing keys defaulted).
+
+    Args:
+        text: Raw model output
+        model: Pydantic model to produce
+        stats: Counters to update
+
+    Returns:
+        (parsed model, names of the repairs that were applied)
+
+    Raises:
+        ValueError: If the output cannot be turned into the model
+    """
+    try:
+        result = model.model_validate_json(text)
+        stats.record([])
+        return result, []
+    except ValidationError:
+        pass
+
+    repairs: List[str] = []
+    try:
+        candidate = _extract_json(text, repairs)
+        try:
+            data = json.loads(candidate, strict=False)
+        except json.JSONDecodeError:
+            data = json.loads(_repair_syntax(candidate, repairs), strict=False)
+        if model is ProjectPlan:
+            data = _coerce_plan(data, repairs)
+        result = model.model_validate(data)
+    except (json.JSONDecodeError, ValidationError, TypeError) as e:
+        stats.record(repairs, failed=True)
+        raise ValueError(f"Could not repair output into {model.__name__}: {e}") from e
+
+    # Keep the first occurrence of each repair, in the order applied
+    repairs = list(dict.fromkeys(repairs))
+    stats.record(repairs)
+    return result, repairs
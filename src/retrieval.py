@@ -0,0 +1,277 @@
+"""
+Similar-plan retrieval for the AI Project Planner.
+A small in-memory TF-IDF index over hashed word n-grams of the planning
+inputs, used to find earlier plans for near-identical projects so they
+can be reused outright or shown to the planning agent as an example.
+"""
+
+import math
+import re
+import threading
+import zlib
+from collections import Counter, OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from .cache import INPUT_KEYS
+from .models import ProjectPlan
+from .store import PlanStore, hash_inputs
+
+
+# Inputs that describe what is built (the team does not change the breakdown)
+RETRIEVAL_KEYS = ('project_type', 'project_objectives', 'industry', 'project_requirements')
+
+# Feature buckets for the hashing trick
+DEFAULT_BUCKETS = 1 << 20
+
+# Tasks listed in a reference example before it is cut short
+MAX_EXAMPLE_TASKS = 25
+
+# Plans kept in memory by an index without a store to load them from
+DEFAULT_MAX_PLANS = 256
+
+_WORD = re.compile(r'[a-z0-9]+')
+
+
+def _features(inputs: Dict[str, Any], buckets: int) -> Dict[int, float]:
+    """Sublinear term frequencies of the hashed word unigrams and bigrams"""
+    counts: Counter = Counter()
+    for key in RETRIEVAL_KEYS:
+        words = _WORD.findall(str(inputs.get(key) or '').lower())
+        # Prefix with the field so "retail" as industry and in requirements differ
+        grams = [f"{key}:{word}" for word in words]
+        grams += [f"{key}:{a} {b}" for a, b in zip(words, words[1:])]
+        counts.update(zlib.crc32(gram.encode('utf-8')) % buckets for gram in grams)
+    return {bucket: 1.0 + math.log(count) for bucket, count in counts.items()}
+
+
+@dataclass(frozen=True)
+class SimilarPlan:
+    """A stored plan ranked by how similar its inputs are to a query"""
+
+    key: str
+    score: float
+    inputs: Dict[str, Any]
+    plan: Optional[ProjectPlan]
+
+
+class SimilarPlanIndex:
+    """Thread-safe TF-IDF index over the inputs of earlier plans"""
+
+    def __init__(
+        self,
+        store: Optional[PlanStore] = None,
+        buckets: int = DEFAULT_BUCKETS,
+        max_plans: int = DEFAULT_MAX_PLANS
+    ):
+        """
+        Initialize an empty index
+
+        Args:
+            store: Optional PlanStore that matched plans are loaded from;
+                an index with a store keeps only the inputs in memory
+            buckets: Number of hashed feature buckets
+            max_plans: Without a store, the most recently used plans kept
+                in memory (older entries still match, without a plan)
+        """
+        self.store = store
+        self.buckets = buckets
+        self.max_plans = max_plans
+        self._docs: Dict[str, Tuple[Dict[int, float], Dict[str, Any]]] = {}
+        self._postings: Dict[int, Dict[str, float]] = {}
+        self._plans: "OrderedDict[str, ProjectPlan]" = OrderedDict()
+        self._norms: Dict[str, float] = {}
+        self._norms_size = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_store(cls, store: PlanStore, **kwargs) -> "SimilarPlanIndex":
+        """
+        Index the inputs of every plan in a PlanStore
+
+        Args:
+            store: Plan history to index
+            **kwargs: Passed to SimilarPlanIndex
+
+        Returns:
+            Index that loads matched plans from the store
+        """
+        index = cls(store=store, **kwargs)
+        index.add_many((inputs, None) for _, inputs in store.iter_inputs())
+        return index
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    def add(self, inputs: Dict[str, Any], plan: Optional[ProjectPlan] = None) -> str:
+        """
+        Index the inputs of a plan
+
+        Plans made from the same inputs share one entry; the latest wins.
+
+        Args:
+            inputs: Planning inputs
+            plan: The plan made from them, kept in memory only when the
+                index has no store (with a store it is loaded when matched)
+
+        Returns:
+            Key of the entry (hash_inputs of the inputs)
+        """
+        return self.add_many([(inputs, plan)])[0]
+
+    def add_many(self, records: Iterable[Tuple[Dict[str, Any], Optional[ProjectPlan]]]) -> List[str]:
+        """
+        Index many plans at once
+
+        Args:
+            records: (inputs, plan) pairs, as for add()
+
+        Returns:
+            Keys of the entries, in order
+        """
+        entries = [(hash_inputs(inputs), _features(inputs, self.buckets), inputs, plan) for inputs, plan in records]
+        with self._lock:
+            for key, vector, inputs, plan in entries:
+                self._remove(key)
+                # Keep the team too: it is not matched on, but decides reuse
+                self._docs[key] = (vector, {name: inputs.get(name) for name in INPUT_KEYS})
+                for bucket, weight in vector.items():
+                    self._postings.setdefault(bucket, {})[key] = weight
+                if plan is not None and self.store is None:
+                    self._plans[key] = plan
+                    if len(self._plans) > self.max_plans:
+                        self._plans.popitem(last=False)
+            if len(self._docs) > self._norms_size * 1.2:
+                # IDF drifts as the index grows; refresh every norm now and then
+                self._refresh_norms()
+            else:
+                for key, vector, _, _ in entries:
+                    self._norms[key] = self._norm(vector)
+        return [entry[0] for entry in entries]
+
+    def search(self, inputs: Dict[str, Any], k: int = 3, min_score: float = 0.0) -> List[SimilarPlan]:
+        """
+        Find the plans whose inputs are most similar to the given inputs
+
+        Scores are cosine similarities of TF-IDF vectors, between 0 and 1.
+        Features found in more than half of a large index carry almost
+        no weight and are skipped, which keeps lookups fast.
+
+        Args:
+            inputs: Planning inputs to match
+            k: Maximum number of matches
+            min_score: Drop matches scoring below this
+
+        Returns:
+            Up to k matches, best first
+        """
+        query = _features(inputs, self.buckets)
+        with self._lock:
+            total = len(self._docs)
+            scores: Dict[str, float] = {}
+            query_norm = 0.0
+            for bucket, weight in query.items():
+                postings = self._postings.get(bucket)
+                if not postings:
+                    continue
+                idf = self._idf(len(postings), total)
+                query_norm += (weight * idf) ** 2
+                if total > 100 and len(postings) * 2 > total:
+                    continue
+                scaled = weight * idf * idf
+                for key, doc_weight in postings.items():
+                    scores[key] = scores.get(key, 0.0) + scaled * doc_weight
+            if not scores or not query_norm:
+                return []
+            query_norm = math.sqrt(query_norm)
+            ranked = sorted(
+                ((score / (query_norm * self._norms[key]), key) for key, score in scores.items() if self._norms[key]),
+                reverse=True
+            )[:k]
+            matches = [
+                (key, min(score, 1.0), dict(self._docs[key][1]), self._recall(key))
+                for score, key in ranked if score >= min_score
+            ]
+        return [
+            SimilarPlan(key, score, inputs, plan if plan is not None else self._load(key))
+            for key, score, inputs, plan in matches
+        ]
+
+    def best(self, inputs: Dict[str, Any], min_score: float = 0.0) -> Optional[SimilarPlan]:
+        """Most similar earlier plan scoring at least min_score, or None"""
+        matches = self.search(inputs, k=1, min_score=min_score)
+        return matches[0] if matches else None
+
+    def _recall(self, key: str) -> Optional[ProjectPlan]:
+        """In-memory plan of an entry, marked as recently used"""
+        plan = self._plans.get(key)
+        if plan is not None:
+            self._plans.move_to_end(key)
+        return plan
+
+    def _load(self, key: str) -> Optional[ProjectPlan]:
+        if self.store is None:
+            return None
+        rows = self.store.query(input_hash=key, limit=1)
+        return self.store.get(rows[0].plan_id) if rows else None
+
+    def _remove(self, key: str) -> None:
+        entry = self._docs.pop(key, None)
+        if entry is None:
+            return
+        for bucket in entry[0]:
+            postings = self._postings[bucket]
+            del postings[key]
+            if not postings:
+                del self._postings[bucket]
+        self._norms.pop(key, None)
+        self._plans.pop(key, None)
+
+    @staticmethod
+    def _idf(document_frequency: int, total: int) -> float:
+        return math.log((total + 1) / (document_frequency + 1)) + 0.01
+
+    def _norm(self, vector: Dict[int, float]) -> float:
+        total = len(self._docs)
+        return math.sqrt(sum(
+            (weight * self._idf(len(self._postings[bucket]), total)) ** 2
+            for bucket, weight in vector.items()
+        ))
+
+    def _refresh_norms(self) -> None:
+        self._norms = {key: self._norm(vector) for key, (vector, _) in self._docs.items()}
+        self._norms_size = len(self._docs)
+
+
+def same_team(first: Dict[str, Any], second: Dict[str, Any]) -> bool:
+    """Whether two sets of inputs name the same team (ignoring whitespace)"""
+    def normalize(inputs: Dict[str, Any]) -> str:
+        return " ".join(str(inputs.get('team_members') or '').split())
+    return normalize(first) == normalize(second)
+
+
+def format_reference(match: SimilarPlan, max_tasks: int = MAX_EXAMPLE_TASKS) -> str:
+    """
+    Render a similar plan as a compact example for the task breakdown
+
+    Args:
+        match: Match returned by SimilarPlanIndex.search
+        max_tasks: Maximum tasks listed
+
+    Returns:
+        Prompt text listing the earlier plan's tasks, or "" without a plan
+    """
+    if match.plan is None or not match.plan.tasks:
+        return ""
+    tasks = match.plan.tasks[:max_tasks]
+    lines = [
+        f"Reference: a similar earlier project ({match.inputs.get('project_type')}, "
+        f"{match.inputs.get('industry')}) was broken down into these tasks. "
+        "Reuse what fits these requirements, change or drop the rest:"
+    ]
+    for task in tasks:
+        after = f"; after {', '.join(task.dependencies)}" if task.dependencies else ""
+        lines.append(f"- {task.task_name} ({task.estimated_time_hours:g}h{after})")
+    if len(match.plan.tasks) > len(tasks):
+        lines.append(f"- … {len(match.plan.tasks) - len(tasks)} more tasks")
+    return "\n".join(lines)
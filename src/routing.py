@@ -0,0 +1,341 @@
+"""
+Multi-endpoint LLM routing for the AI Project Planner.
+Spreads planning traffic over several OpenAI-compatible endpoints (e.g.
+a few Ollama boxes), sending each request to the healthy endpoint with
+the fewest requests in flight and failing over when one stops answering.
+"""
+
+import os
+import statistics
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional
+
+from pydantic import PrivateAttr
+
+from .llms import DelegatingLLM
+
+
+# Latency samples kept per endpoint for percentile stats
+LATENCY_WINDOW = 256
+
+# HTTP statuses that mean the endpoint (not the request) is at fault
+_FAILOVER_STATUSES = {502, 503, 504}
+
+
+class NoHealthyEndpoint(ConnectionError):
+    """Raised when every endpoint has failed for a request"""
+
+
+def parse_endpoints(value: Optional[str]) -> List[str]:
+    """
+    Parse a comma- or whitespace-separated list of base URLs
+
+    Args:
+        value: e.g. ``"http://gpu1:11434/v1, http://gpu2:11434/v1"``
+
+    Returns:
+        Base URLs without trailing slashes, duplicates removed
+    """
+    urls = [url.strip().rstrip('/') for url in (value or "").replace(',', ' ').split()]
+    return list(dict.fromkeys(url for url in urls if url))
+
+
+class Endpoint:
+    """Routing state and latency stats of one LLM endpoint"""
+
+    def __init__(self, base_url: str):
+        self.base_url = base_url
+        self.healthy = True
+        self.outstanding = 0
+        self.requests = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+        self.latencies: Deque[float] = deque(maxlen=LATENCY_WINDOW)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Snapshot of the endpoint's counters
+
+        Returns:
+            Dictionary with health, load, request/failure counts and
+            mean / p50 / p95 latency in seconds over recent requests
+        """
+        ordered = sorted(self.latencies)
+        latency = None
+        if ordered:
+            latency = {
+                'mean': statistics.fmean(ordered),
+                'p50': statistics.median(ordered),
+                'p95': ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))],
+            }
+        return {
+            'base_url': self.base_url,
+            'healthy': self.healthy,
+            'outstanding': self.outstanding,
+            'requests': self.requests,
+            'failures': self.failures,
+            'last_error': self.last_error,
+            'latency': latency,
+        }
+
+
+class EndpointRouter:
+    """Least-outstanding-requests router over several LLM endpoints"""
+
+    def __init__(
+        self,
+        endpoints: Iterable[str],
+        model: Optional[str] = None,
+        api_key: Optional[str] = None,
+        health_interval: float = 15.0,
+        health_timeout: float = 3.0
+    ):
+        """
+        Initialize the router (call start() to begin background health checks)
+
+        Args:
+            endpoints: Base URLs of OpenAI-compatible APIs
+            model: Model served by every endpoint (default OPENAI_MODEL_NAME)
+            api_key: API key for every endpoint (default OPENAI_API_KEY)
+            health_interval: Seconds between health checks
+            health_timeout: Seconds to wait for a health check response
+        """
+        urls = list(dict.fromkeys(url.rstrip('/') for url in endpoints))
+        if not urls:
+            raise ValueError("At least one endpoint is required")
+
+        self.endpoints = [Endpoint(url) for url in urls]
+        self.model = model or os.getenv('OPENAI_MODEL_NAME')
+        self.api_key = api_key or os.getenv('OPENAI_API_KEY')
+        self.health_interval = health_interval
+        self.health_timeout = health_timeout
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_env(cls, **kwargs) -> Optional["EndpointRouter"]:
+        """
+        Build a router from OPENAI_API_BASES
+
+        Returns:
+            EndpointRouter, or None if fewer than two endpoints are configured
+        """
+        urls = parse_endpoints(os.getenv('OPENAI_API_BASES'))
+        if len(urls) < 2:
+            return None
+        return cls(urls, **kwargs)
+
+    def acquire(self, exclude: Iterable[Endpoint] = ()) -> Endpoint:
+        """
+        Reserve the least loaded endpoint for one request
+
+        Healthy endpoints are preferred; ties go to the lower recent
+        latency. If no healthy endpoint is left, unhealthy ones are tried
+        too, since they may have recovered since the last check.
+
+        Args:
+            exclude: Endpoints that already failed for this request
+
+        Returns:
+            Endpoint whose outstanding count was incremented
+
+        Raises:
+            NoHealthyEndpoint: If every endpoint is excluded
+        """
+        excluded = set(map(id, exclude))
+        with self._lock:
+            candidates = [endpoint for endpoint in self.endpoints if id(endpoint) not in excluded]
+            if not candidates:
+                raise NoHealthyEndpoint("All LLM endpoints failed: " + ", ".join(
+                    f"{endpoint.base_url} ({endpoint.last_error})" for endpoint in self.endpoints
+                ))
+            endpoint = min(candidates, key=lambda e: (
+                not e.healthy,
+                e.outstanding,
+                statistics.fmean(e.latencies) if e.latencies else 0.0,
+            ))
+            endpoint.outstanding += 1
+            endpoint.requests += 1
+            return endpoint
+
+    def release(self, endpoint: Endpoint, seconds: float, error: Optional[BaseException] = None) -> None:
+        """
+        Finish a request started with acquire()
+
+        Args:
+            endpoint: Endpoint returned by acquire()
+            seconds: Time the request took
+            error: Failure that should take the endpoint out of rotation
+        """
+        with self._lock:
+            endpoint.outstanding -= 1
+            if error is None:
+                endpoint.latencies.append(seconds)
+                endpoint.healthy = True
+            else:
+                endpoint.failures += 1
+                endpoint.healthy = False
+                endpoint.last_error = str(error) or type(error).__name__
+
+    def check_health(self) -> None:
+        """Probe every endpoint's /models route and update its health"""
+        for endpoint in self.endpoints:
+            request = urllib.request.Request(f"{endpoint.base_url}/models")
+            if self.api_key:
+                request.add_header('Authorization', f"Bearer {self.api_key}")
+            try:
+                with urllib.request.urlopen(request, timeout=self.health_timeout) as response:
+                    healthy, error = 200 <= response.status < 300, None
+            except (urllib.error.URLError, OSError) as e:
+                healthy, error = False, str(getattr(e, 'reason', e))
+            with self._lock:
+                if healthy and not endpoint.healthy:
+                    print(f"✅ LLM endpoint back online: {endpoint.base_url}")
+                elif not healthy and endpoint.healthy:
+                    print(f"⚠️ LLM endpoint unhealthy: {endpoint.base_url} ({error})")
+                endpoint.healthy = healthy
+                if error:
+                    endpoint.last_error = error
+
+    def start(self) -> "EndpointRouter":
+        """Run an initial health check and keep checking in the background"""
+        if self._thread is not None:
+            return self
+        self.check_health()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._health_loop, name="llm-health", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop background health checks"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.health_timeout + 1)
+            self._thread = None
+
+    def _health_loop(self) -> None:
+        while not self._stop.wait(self.health_interval):
+            self.check_health()
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """
+        Per-endpoint routing and latency stats
+
+        Returns:
+            One Endpoint.stats() dictionary per endpoint
+        """
+        with self._lock:
+            return [endpoint.stats() for endpoint in self.endpoints]
+
+    def llm_factory(self, inner_factory: Optional[Callable[[str], Any]] = None) -> Callable[[str], "RoutedLLM"]:
+        """
+        Build a factory giving each agent its own routed LLM
+
+        Args:
+            inner_factory: Creates the LLM for one endpoint base URL
+                (defaults to an OpenAI-compatible LLM for self.model
+                with client retries disabled, so failover is immediate)
+
+        Returns:
+            Callable taking an agent key and returning a RoutedLLM
+        """
+        def create(base_url: str):
+            if inner_factory is not None:
+                return inner_factory(base_url)
+            from crewai import LLM
+            return LLM(
+                model=self.model,
+                base_url=base_url,
+                api_base=base_url,
+                api_key=self.api_key,
+                max_retries=0
+            )
+
+        def factory(agent_key: str) -> RoutedLLM:
+            return RoutedLLM(model=self.model or "routed", router=self, create_inner=create)
+
+        return factory
+
+    def __enter__(self) -> "EndpointRouter":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.stop()
+
+
+def _is_endpoint_failure(error: BaseException) -> bool:
+    """Whether an LLM error means the endpoint is down rather than the request is bad"""
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+    return getattr(error, 'status_code', None) in _FAILOVER_STATUSES
+
+
+class RoutedLLM(DelegatingLLM):
+    """LLM that sends each call to an endpoint chosen by an EndpointRouter"""
+
+    llm_type: str = "routed"
+    router: Any = None
+    create_inner: Any = None
+    # Passed on to the endpoint LLM, so constrained output keeps working
+    response_format: Any = None
+    _inners: Dict[str, Any] = PrivateAttr(default_factory=dict)
+
+    def model_post_init(self, context: Any) -> None:
+        super().model_post_init(context)
+        # Capability queries (function calling, context window) use the first endpoint
+        if self.inner is None:
+            self.inner = self._inner_for(self.router.endpoints[0])
+
+    def _inner_for(self, endpoint: Endpoint):
+        inner = self._inners.get(endpoint.base_url)
+        if inner is None:
+            inner = self._inners[endpoint.base_url] = self.create_inner(endpoint.base_url)
+        return inner
+
+    def call(
+        self,
+        messages,
+        tools=None,
+        callbacks=None,
+        available_functions=None,
+        from_task=None,
+        from_agent=None,
+        response_model=None
+    ):
+        """Call the least loaded endpoint, failing over to the next on endpoint errors"""
+        tried: List[Endpoint] = []
+        while True:
+            endpoint = self.router.acquire(exclude=tried)
+            inner = self._inner_for(endpoint)
+            if 'response_format' in type(inner).model_fields:
+                inner.response_format = self.response_format
+            started = time.perf_counter()
+            try:
+                result = self._call_inner(
+                    inner,
+                    messages,
+                    tools=tools,
+                    callbacks=callbacks,
+                    available_functions=available_functions,
+                    from_task=from_task,
+                    from_agent=from_agent,
+                    response_model=response_model
+                )
+            except Exception as e:
+                failed = _is_endpoint_failure(e)
+                self.router.release(endpoint, time.perf_counter() - started, error=e if failed else None)
+                if not failed:
+                    raise
+                tried.append(endpoint)
+                if len(tried) == len(self.router.endpoints):
+                    raise NoHealthyEndpoint(f"All LLM endpoints failed, last error: {e}") from e
+                print(f"🔀 LLM endpoint {endpoint.base_url} failed, retrying on another endpoint")
+                continue
+            self.router.release(endpoint, time.perf_counter() - started)
+            return result
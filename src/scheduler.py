@@ -0,0 +1,216 @@
+"""
+Scheduling engine for the AI Project Planner.
+Turns a ProjectPlan into a timeline that respects task dependencies and
+team member availability, with critical path and slack analysis.
+"""
+
+import math
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from .models import ProjectPlan
+
+
+@dataclass
+class ScheduledTask:
+    """Timing information for a single task (all values in hours)"""
+
+    task_name: str
+    duration: float
+    start: float
+    finish: float
+    earliest_start: float
+    earliest_finish: float
+    latest_start: float
+    latest_finish: float
+    slack: float
+    critical: bool
+    resources: List[str]
+
+
+@dataclass
+class Schedule:
+    """Result of scheduling a ProjectPlan"""
+
+    tasks: List[ScheduledTask]
+    makespan_hours: float
+    critical_path: List[str]
+    unresolved_dependencies: Dict[str, List[str]] = field(default_factory=dict)
+    cyclic_tasks: List[str] = field(default_factory=list)
+
+    @property
+    def critical_path_hours(self) -> float:
+        """Length of the dependency-only critical path"""
+        return max((task.earliest_finish for task in self.tasks), default=0.0)
+
+
+def schedule_plan(
+    plan: ProjectPlan,
+    resource_constrained: bool = True,
+    epsilon: float = 1e-9
+) -> Schedule:
+    """
+    Schedule the tasks of a plan
+
+    Runs a critical path analysis over the dependency DAG (earliest and
+    latest start/finish, slack) and then a single greedy pass that delays
+    tasks until their assignees are free. Both passes are linear in the
+    number of tasks plus dependency edges.
+
+    Tasks are matched to dependencies by name. Unknown dependency names
+    are ignored and reported; tasks caught in a dependency cycle are
+    scheduled after everything else, in plan order.
+
+    Args:
+        plan: ProjectPlan to schedule
+        resource_constrained: Prevent a team member (assignee, or required
+            resource when a task has no assignees) from working on two
+            tasks at once
+        epsilon: Tolerance for treating slack as zero
+
+    Returns:
+        Schedule with per-task timing, makespan and critical path
+    """
+    tasks = plan.tasks
+    count = len(tasks)
+
+    index_by_name: Dict[str, int] = {}
+    for index, task in enumerate(tasks):
+        index_by_name.setdefault(task.task_name, index)
+
+    # Plans loaded from the store or history are not repaired, so NaN,
+    # infinite and negative estimates count as zero hours
+    durations = [float(task.estimated_time_hours) for task in tasks]
+    durations = [hours if math.isfinite(hours) and hours > 0 else 0.0 for hours in durations]
+    predecessors: List[List[int]] = [[] for _ in range(count)]
+    successors: List[List[int]] = [[] for _ in range(count)]
+    unresolved: Dict[str, List[str]] = {}
+
+    for index, task in enumerate(tasks):
+        seen = set()
+        for name in task.dependencies:
+            dep = index_by_name.get(name)
+            if dep is None or dep == index:
+                unresolved.setdefault(task.task_name, []).append(name)
+                continue
+            if dep in seen:
+                continue
+            seen.add(dep)
+            predecessors[index].append(dep)
+            successors[dep].append(index)
+
+    # Topological order (Kahn); leftovers belong to cycles
+    indegree = [len(preds) for preds in predecessors]
+    queue = deque(index for index in range(count) if indegree[index] == 0)
+    order: List[int] = []
+    while queue:
+        node = queue.popleft()
+        order.append(node)
+        for succ in successors[node]:
+            indegree[succ] -= 1
+            if indegree[succ] == 0:
+                queue.append(succ)
+
+    in_order = [False] * count
+    for node in order:
+        in_order[node] = True
+    cyclic = [index for index in range(count) if not in_order[index]]
+    order.extend(cyclic)
+    position = [0] * count
+    for rank, node in enumerate(order):
+        position[node] = rank
+
+    def acyclic_preds(node: int) -> List[int]:
+        # Only edges that point backwards in the order are honoured
+        return [pred for pred in predecessors[node] if position[pred] < position[node]]
+
+    # Forward pass: earliest start/finish
+    earliest_start = [0.0] * count
+    earliest_finish = [0.0] * count
+    for node in order:
+        start = max((earliest_finish[pred] for pred in acyclic_preds(node)), default=0.0)
+        earliest_start[node] = start
+        earliest_finish[node] = start + durations[node]
+
+    project_end = max(earliest_finish, default=0.0)
+
+    # Backward pass: latest start/finish
+    latest_finish = [project_end] * count
+    latest_start = [0.0] * count
+    for node in reversed(order):
+        succ_starts = [
+            latest_start[succ] for succ in successors[node]
+            if position[succ] > position[node]
+        ]
+        latest_finish[node] = min(succ_starts, default=project_end)
+        latest_start[node] = latest_finish[node] - durations[node]
+
+    slack = [latest_start[node] - earliest_start[node] for node in range(count)]
+    critical = [abs(value) <= epsilon for value in slack]
+
+    # Resource-leveled pass: start when predecessors are done and every
+    # assigned person is free
+    resources = [list(task.assignees or task.required_resources) for task in tasks]
+    start = [0.0] * count
+    finish = [0.0] * count
+    free_at: Dict[str, float] = {}
+    for node in order:
+        ready = max((finish[pred] for pred in acyclic_preds(node)), default=0.0)
+        if resource_constrained:
+            ready = max([ready] + [free_at.get(name, 0.0) for name in resources[node]])
+        start[node] = ready
+        finish[node] = ready + durations[node]
+        if resource_constrained:
+            for name in resources[node]:
+                free_at[name] = finish[node]
+
+    critical_path = _trace_critical_path(
+        order, successors, position, critical, earliest_start, earliest_finish, epsilon
+    )
+
+    scheduled = [
+        ScheduledTask(
+            task_name=tasks[node].task_name,
+            duration=durations[node],
+            start=start[node],
+            finish=finish[node],
+            earliest_start=earliest_start[node],
+            earliest_finish=earliest_finish[node],
+            latest_start=latest_start[node],
+            latest_finish=latest_finish[node],
+            slack=slack[node],
+            critical=critical[node],
+            resources=resources[node],
+        )
+        for node in range(count)
+    ]
+
+    return Schedule(
+        tasks=scheduled,
+        makespan_hours=max(finish, default=0.0),
+        critical_path=[tasks[node].task_name for node in critical_path],
+        unresolved_dependencies=unresolved,
+        cyclic_tasks=[tasks[node].task_name for node in cyclic],
+    )
+
+
+def _trace_critical_path(order, successors, position, critical, earliest_start, earliest_finish, epsilon):
+    """Follow zero-slack tasks from a project start to the project end"""
+    node = next(
+        (n for n in order if critical[n] and earliest_start[n] <= epsilon),
+        None
+    )
+    path = []
+    while node is not None:
+        path.append(node)
+        node = next(
+            (
+                succ for succ in successors[node]
+                if critical[succ]
+                and position[succ] > position[node]
+                and abs(earliest_start[succ] - earliest_finish[node]) <= epsilon
+            ),
+            None
+        )
+    return path
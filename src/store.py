@@ -0,0 +1,381 @@
+"""
+Persistent plan history for the AI Project Planner.
+Keeps every finished ProjectPlan in an indexed SQLite database, with
+tasks, resources and milestones in their own tables, so past plans can
+be queried (e.g. "all Retail plans over 500 hours") instead of being
+overwritten by the next run.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .cache import INPUT_KEYS
+from .models import ProjectPlan
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS plans (
+    plan_id INTEGER PRIMARY KEY,
+    input_hash TEXT NOT NULL,
+    project_type TEXT COLLATE NOCASE,
+    industry TEXT COLLATE NOCASE,
+    created_at REAL NOT NULL,
+    task_count INTEGER NOT NULL,
+    total_hours REAL NOT NULL,
+    inputs TEXT NOT NULL,
+    plan TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS plans_by_type ON plans (project_type, created_at);
+CREATE INDEX IF NOT EXISTS plans_by_industry ON plans (industry, total_hours);
+CREATE INDEX IF NOT EXISTS plans_by_created ON plans (created_at);
+CREATE INDEX IF NOT EXISTS plans_by_input_hash ON plans (input_hash, created_at);
+CREATE INDEX IF NOT EXISTS plans_by_hours ON plans (total_hours);
+
+CREATE TABLE IF NOT EXISTS tasks (
+    plan_id INTEGER NOT NULL REFERENCES plans (plan_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    task_name TEXT NOT NULL,
+    estimated_time_hours REAL NOT NULL,
+    dependencies TEXT NOT NULL,
+    assignees TEXT NOT NULL,
+    PRIMARY KEY (plan_id, position)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS resources (
+    plan_id INTEGER NOT NULL REFERENCES plans (plan_id) ON DELETE CASCADE,
+    task_position INTEGER NOT NULL,
+    resource TEXT NOT NULL COLLATE NOCASE
+);
+CREATE INDEX IF NOT EXISTS resources_by_name ON resources (resource, plan_id);
+CREATE INDEX IF NOT EXISTS resources_by_plan ON resources (plan_id);
+
+CREATE TABLE IF NOT EXISTS milestones (
+    plan_id INTEGER NOT NULL REFERENCES plans (plan_id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    milestone_name TEXT NOT NULL,
+    tasks TEXT NOT NULL,
+    PRIMARY KEY (plan_id, position)
+) WITHOUT ROWID;
+"""
+
+
+def hash_inputs(inputs: Dict[str, Any]) -> str:
+    """
+    Hash the planning inputs of a plan
+
+    Unlike compute_cache_key this ignores the model and configuration,
+    so it groups every plan made for the same project description.
+
+    Args:
+        inputs: Planning inputs (only the five known fields are used)
+
+    Returns:
+        Hex digest of the inputs
+    """
+    payload = {key: str(inputs.get(key, '')) for key in INPUT_KEYS}
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+
+@dataclass(frozen=True)
+class StoredPlan:
+    """Summary row of a stored plan (load the plan itself with PlanStore.get)"""
+
+    plan_id: int
+    input_hash: str
+    project_type: Optional[str]
+    industry: Optional[str]
+    created_at: float
+    task_count: int
+    total_hours: float
+
+
+class PlanStore:
+    """SQLite-backed history of finished project plans"""
+
+    def __init__(self, path: str = "outputs/plans.db"):
+        """
+        Open (or create) the plan store
+
+        Args:
+            path: SQLite database file (":memory:" for a throwaway store)
+        """
+        if path != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("PRAGMA synchronous = NORMAL")
+        with self._conn:
+            self._conn.executescript(_SCHEMA)
+
+    def add(
+        self,
+        plan: ProjectPlan,
+        inputs: Optional[Dict[str, Any]] = None,
+        created_at: Optional[float] = None
+    ) -> int:
+        """
+        Store one plan
+
+        Args:
+            plan: Finished ProjectPlan
+            inputs: Planning inputs the plan was made from
+            created_at: Timestamp to record (default: now)
+
+        Returns:
+            ID of the stored plan
+        """
+        return self.add_many([(plan, inputs)], created_at=created_at)[0]
+
+    def add_many(
+        self,
+        records: Iterable[Tuple[ProjectPlan, Optional[Dict[str, Any]]]],
+        created_at: Optional[float] = None
+    ) -> List[int]:
+        """
+        Store many plans in a single transaction
+
+        Args:
+            records: (plan, inputs) pairs
+            created_at: Timestamp to record for every plan (default: now)
+
+        Returns:
+            IDs of the stored plans, in order
+        """
+        created_at = time.time() if created_at is None else created_at
+        plan_ids = []
+        with self._lock, self._conn:
+            cursor = self._conn.cursor()
+            for plan, inputs in records:
+                inputs = inputs or {}
+                cursor.execute(
+                    "INSERT INTO plans (input_hash, project_type, industry, created_at,"
+                    " task_count, total_hours, inputs, plan) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        hash_inputs(inputs),
+                        inputs.get('project_type'),
+                        inputs.get('industry'),
+                        created_at,
+                        len(plan.tasks),
+                        sum(task.estimated_time_hours for task in plan.tasks),
+                        json.dumps({key: inputs.get(key) for key in INPUT_KEYS}, ensure_ascii=False),
+                        plan.model_dump_json(),
+                    )
+                )
+                plan_id = cursor.lastrowid
+                plan_ids.append(plan_id)
+                cursor.executemany(
+                    "INSERT INTO tasks VALUES (?, ?, ?, ?, ?, ?)",
+                    [
+                        (plan_id, position, task.task_name, task.estimated_time_hours,
+                         json.dumps(task.dependencies, ensure_ascii=False),
+                         json.dumps(task.assignees, ensure_ascii=False))
+                        for position, task in enumerate(plan.tasks)
+                    ]
+                )
+                cursor.executemany(
+                    "INSERT INTO resources VALUES (?, ?, ?)",
+                    [
+                        (plan_id, position, resource)
+                        for position, task in enumerate(plan.tasks)
+                        for resource in dict.fromkeys(task.required_resources)
+                    ]
+                )
+                cursor.executemany(
+                    "INSERT INTO milestones VALUES (?, ?, ?, ?)",
+                    [
+                        (plan_id, position, milestone.milestone_name,
+                         json.dumps(milestone.tasks, ensure_ascii=False))
+                        for position, milestone in enumerate(plan.milestones)
+                    ]
+                )
+        return plan_ids
+
+    def get(self, plan_id: int) -> Optional[ProjectPlan]:
+        """
+        Load a stored plan
+
+        Args:
+            plan_id: ID returned by add() or query()
+
+        Returns:
+            The ProjectPlan, or None if there is no such plan
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT plan FROM plans WHERE plan_id = ?", (plan_id,)).fetchone()
+        return ProjectPlan.model_validate_json(row[0]) if row else None
+
+    def inputs(self, plan_id: int) -> Optional[Dict[str, Any]]:
+        """Planning inputs a stored plan was made from, or None"""
+        with self._lock:
+            row = self._conn.execute("SELECT inputs FROM plans WHERE plan_id = ?", (plan_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def iter_inputs(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """
+        Planning inputs of every stored plan, oldest first
+
+        Yields:
+            (plan_id, inputs) pairs
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT plan_id, inputs FROM plans ORDER BY created_at, plan_id"
+            ).fetchall()
+        for plan_id, inputs in rows:
+            yield plan_id, json.loads(inputs)
+
+    def iter_plans(self, page_size: int = 500, **filters) -> Iterator[Tuple[int, ProjectPlan]]:
+        """
+        Stream stored plans in ID order, one page at a time
+
+        Only one page of plans is held in memory, and the lock is
+        released between pages so other threads can keep writing.
+
+        Args:
+            page_size: Plans loaded per query
+            **filters: Same filters as query()
+
+        Yields:
+            (plan_id, plan) pairs
+        """
+        where, params = self._filters(**filters)
+        where = f"{where} AND plan_id > ?" if where else " WHERE plan_id > ?"
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT plan_id, plan FROM plans{where} ORDER BY plan_id LIMIT ?",
+                    params + [last_id, page_size]
+                ).fetchall()
+            for plan_id, plan in rows:
+                yield plan_id, ProjectPlan.model_validate_json(plan)
+            if len(rows) < page_size:
+                return
+            last_id = rows[-1][0]
+
+    def query(
+        self,
+        project_type: Optional[str] = None,
+        industry: Optional[str] = None,
+        min_hours: Optional[float] = None,
+        max_hours: Optional[float] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        resource: Optional[str] = None,
+        input_hash: Optional[str] = None,
+        limit: Optional[int] = 100
+    ) -> List[StoredPlan]:
+        """
+        Find stored plans, newest first
+
+        Text filters match whole values, ignoring case. Every filter is
+        served by an index, so queries stay fast on large histories.
+
+        Args:
+            project_type: Plans for this project type
+            industry: Plans for this industry
+            min_hours: Plans with at least this many total task hours
+            max_hours: Plans with at most this many total task hours
+            since: Plans created at or after this timestamp
+            until: Plans created before this timestamp
+            resource: Plans with a task requiring this resource
+            input_hash: Plans made from these inputs (see hash_inputs)
+            limit: Maximum rows returned (None for all)
+
+        Returns:
+            StoredPlan summaries
+        """
+        where, params = self._filters(
+            project_type, industry, min_hours, max_hours, since, until, resource, input_hash
+        )
+        sql = (
+            "SELECT plan_id, input_hash, project_type, industry, created_at, task_count, total_hours"
+            f" FROM plans{where} ORDER BY created_at DESC, plan_id DESC"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [StoredPlan(*row) for row in rows]
+
+    def count(self, **filters) -> int:
+        """
+        Count stored plans
+
+        Args:
+            **filters: Same filters as query()
+
+        Returns:
+            Number of matching plans
+        """
+        where, params = self._filters(**filters)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM plans{where}", params).fetchone()[0]
+
+    def latest(self, inputs: Dict[str, Any]) -> Optional[ProjectPlan]:
+        """Most recent plan made from the given inputs, or None"""
+        rows = self.query(input_hash=hash_inputs(inputs), limit=1)
+        return self.get(rows[0].plan_id) if rows else None
+
+    def delete(self, plan_id: int) -> bool:
+        """
+        Remove a stored plan with its tasks, resources and milestones
+
+        Returns:
+            Whether a plan was removed
+        """
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM plans WHERE plan_id = ?", (plan_id,)).rowcount > 0
+
+    def close(self) -> None:
+        """Close the database connection"""
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "PlanStore":
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close()
+
+    @staticmethod
+    def _filters(
+        project_type: Optional[str] = None,
+        industry: Optional[str] = None,
+        min_hours: Optional[float] = None,
+        max_hours: Optional[float] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        resource: Optional[str] = None,
+        input_hash: Optional[str] = None
+    ) -> Tuple[str, List[Any]]:
+        """WHERE clause and parameters for the query() filters"""
+        conditions = []
+        params: List[Any] = []
+        for clause, value in (
+            ("project_type = ?", project_type),
+            ("industry = ?", industry),
+            ("total_hours >= ?", min_hours),
+            ("total_hours <= ?", max_hours),
+            ("created_at >= ?", since),
+            ("created_at < ?", until),
+            ("plan_id IN (SELECT plan_id FROM resources WHERE resource = ?)", resource),
+            ("input_hash = ?", input_hash),
+        ):
+            if value is not None:
+                conditions.append(clause)
+                params.append(value)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return where, params
@@ -3,11 +3,12 @@ Task definitions for the AI Project Planner.
 This module creates and configures tasks for AI agents.
 """
 
-import yaml
 from crewai import Task, Agent
 from pathlib import Path
 from typing import Optional
 
+from .config import load_tasks_config
+
 
 class ProjectTasks:
     """Factory class for creating project planning tasks"""
@@ -23,18 +24,8 @@ class ProjectTasks:
         self.tasks_config = self._load_config()
     
     def _load_config(self) -> dict:
-        """Load tasks configuration from YAML file"""
-        try:
-            with open(self.config_path, 'r', encoding='utf-8') as file:
-                config = yaml.safe_load(file)
-                print(f"✅ Tasks config loaded from {self.config_path}")
-                return config
-        except FileNotFoundError:
-            print(f"❌ Error: Config file not found at {self.config_path}")
-            raise
-        except yaml.YAMLError as e:
-            print(f"❌ Error parsing YAML file: {e}")
-            raise
+        """Load tasks configuration through the shared config registry"""
+        return load_tasks_config(str(self.config_path))
     
     def create_task_breakdown(self, agent: Agent) -> Task:
         """
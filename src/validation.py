@@ -0,0 +1,276 @@
+"""
+Referential validation and repair of generated plans for the AI Project
+Planner.
+Checks a ProjectPlan for the mistakes models make most often (milestones
+naming tasks that do not exist, tasks in no milestone, non-positive
+hours, tasks without resources) in one pass over an IndexedPlan, and
+fixes what can be fixed deterministically, so only plans that cannot be
+repaired need another LLM run.
+"""
+
+import difflib
+import math
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+from .indexed import IndexedPlan
+from .models import ProjectPlan
+from .repair import RepairStats
+
+
+# Issue kinds reported by validate_plan
+UNKNOWN_MILESTONE_TASK = "unknown_milestone_task"
+UNASSIGNED_TASK = "unassigned_task"
+INVALID_HOURS = "invalid_hours"
+NO_RESOURCES = "no_resources"
+DUPLICATE_TASK = "duplicate_task"
+NO_TASKS = "no_tasks"
+
+# Milestone collecting tasks that belong to no other milestone
+CATCH_ALL_MILESTONE = "Other tasks"
+
+# Resource given to tasks with neither resources nor assignees
+UNASSIGNED_RESOURCE = "Unassigned"
+
+# Plans checked by repair_plan and the repairs they needed
+plan_repair_stats = RepairStats()
+
+_NON_WORD = re.compile(r'[\W_]+')
+
+
+@dataclass
+class PlanIssue:
+    """One problem found in a plan"""
+
+    kind: str
+    message: str
+    task_name: Optional[str] = None
+    milestone_name: Optional[str] = None
+
+
+@dataclass
+class ValidationReport:
+    """Result of validate_plan"""
+
+    issues: List[PlanIssue] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        """Whether the plan has no issues"""
+        return not self.issues
+
+    def counts(self) -> Dict[str, int]:
+        """Number of issues of each kind"""
+        counts: Dict[str, int] = {}
+        for issue in self.issues:
+            counts[issue.kind] = counts.get(issue.kind, 0) + 1
+        return counts
+
+    def summary(self) -> str:
+        """One-line description, e.g. "2 unknown_milestone_task, 1 invalid_hours" """
+        return ", ".join(f"{count} {kind}" for kind, count in self.counts().items()) or "no issues"
+
+
+@dataclass
+class RepairResult:
+    """Result of repair_plan"""
+
+    plan: ProjectPlan
+    repairs: List[str]
+    report: ValidationReport
+
+    @property
+    def needs_rerun(self) -> bool:
+        """Whether issues remain that only a new model run can fix"""
+        return not self.report.ok
+
+
+def validate_plan(
+    plan: ProjectPlan,
+    indexed: Optional[IndexedPlan] = None,
+    max_hours: Optional[float] = None
+) -> ValidationReport:
+    """
+    Check a plan for broken references and invalid values
+
+    Every lookup is a dict or array access, so the check is linear in
+    the number of tasks plus milestone entries.
+
+    Args:
+        plan: ProjectPlan to check
+        indexed: IndexedPlan of the same plan, if already built
+        max_hours: Also report tasks estimated above this many hours
+
+    Returns:
+        ValidationReport listing every issue found
+    """
+    indexed = indexed or IndexedPlan(plan, share_strings=False)
+    issues: List[PlanIssue] = []
+    if not plan.tasks:
+        issues.append(PlanIssue(NO_TASKS, "The plan has no tasks"))
+
+    for task_id in indexed.duplicate_task_ids:
+        name = indexed.task_names[task_id]
+        issues.append(PlanIssue(DUPLICATE_TASK, f"Task name '{name}' is used more than once", task_name=name))
+
+    for milestone_id, names in indexed.unknown_milestone_tasks.items():
+        milestone = indexed.milestone_names[milestone_id]
+        for name in names:
+            issues.append(PlanIssue(
+                UNKNOWN_MILESTONE_TASK,
+                f"Milestone '{milestone}' lists unknown task '{name}'",
+                task_name=name,
+                milestone_name=milestone
+            ))
+
+    duplicates = set(indexed.duplicate_task_ids)
+    for task_id in indexed.unassigned_task_ids():
+        if int(task_id) in duplicates:
+            # Milestones can only name the first task with a given name
+            continue
+        name = indexed.task_names[task_id]
+        issues.append(PlanIssue(UNASSIGNED_TASK, f"Task '{name}' is in no milestone", task_name=name))
+
+    for task_id, task in enumerate(plan.tasks):
+        hours = task.estimated_time_hours
+        if not math.isfinite(hours) or hours <= 0 or (max_hours is not None and hours > max_hours):
+            issues.append(PlanIssue(
+                INVALID_HOURS,
+                f"Task '{task.task_name}' has invalid hours ({hours})",
+                task_name=task.task_name
+            ))
+        if not any(resource.strip() for resource in task.required_resources):
+            issues.append(PlanIssue(
+                NO_RESOURCES,
+                f"Task '{task.task_name}' has no required resources",
+                task_name=task.task_name
+            ))
+
+    return ValidationReport(issues)
+
+
+def _normalize(name: str) -> str:
+    return _NON_WORD.sub(' ', name).strip().lower()
+
+
+def _matcher(task_names: List[str], cutoff: float):
+    """Map a milestone entry to a real task name, or None"""
+    by_normalized: Dict[str, str] = {}
+    for name in task_names:
+        by_normalized.setdefault(_normalize(name), name)
+    candidates = list(by_normalized)
+
+    def match(name: str) -> Optional[str]:
+        normalized = _normalize(name)
+        if normalized in by_normalized:
+            return by_normalized[normalized]
+        close = difflib.get_close_matches(normalized, candidates, n=1, cutoff=cutoff)
+        return by_normalized[close[0]] if close else None
+
+    return match
+
+
+def repair_plan(
+    plan: ProjectPlan,
+    min_hours: float = 0.5,
+    max_hours: Optional[float] = None,
+    match_cutoff: float = 0.8,
+    catch_all: str = CATCH_ALL_MILESTONE,
+    fallback_resource: str = UNASSIGNED_RESOURCE,
+    stats: RepairStats = plan_repair_stats
+) -> RepairResult:
+    """
+    Fix a plan's references and values without another model run
+
+    Repairs, in order:
+    - repeated task names get a " (2)", " (3)", ... suffix
+    - milestone entries naming unknown tasks are matched to the closest
+      real task name (case, punctuation and small typos are ignored);
+      entries with no close match are dropped
+    - tasks in no milestone are collected in a catch-all milestone
+    - zero, negative or non-finite hours become min_hours, and hours
+      above max_hours become max_hours
+    - tasks without resources get their assignees as resources, or
+      fallback_resource when they have no assignees either
+
+    The input plan is not modified.
+
+    Args:
+        plan: ProjectPlan to repair
+        min_hours: Estimate given to tasks with invalid hours
+        max_hours: Highest allowed task estimate (None for no limit)
+        match_cutoff: Minimum similarity (0-1) for a fuzzy name match
+        catch_all: Name of the milestone for unassigned tasks
+        fallback_resource: Resource for tasks with no resources and no
+            assignees
+        stats: Counters to update
+
+    Returns:
+        RepairResult with the repaired plan, the names of the repairs
+        applied and the issues that are left
+    """
+    report = validate_plan(plan, max_hours=max_hours)
+    if report.ok:
+        stats.record([])
+        return RepairResult(plan, [], report)
+
+    kinds = report.counts()
+    data = plan.model_dump()
+    tasks = data['tasks']
+    milestones = data['milestones']
+    repairs: List[str] = []
+
+    if DUPLICATE_TASK in kinds:
+        seen: Dict[str, int] = {}
+        for task in tasks:
+            name = task['task_name']
+            seen[name] = seen.get(name, 0) + 1
+            if seen[name] > 1:
+                task['task_name'] = f"{name} ({seen[name]})"
+        repairs.append('renamed_duplicate_tasks')
+
+    if UNKNOWN_MILESTONE_TASK in kinds:
+        known = {task['task_name'] for task in tasks}
+        match = _matcher([task['task_name'] for task in tasks], match_cutoff)
+        for milestone in milestones:
+            members: Dict[str, None] = {}
+            for name in milestone['tasks']:
+                if name not in known:
+                    name = match(name)
+                    repairs.append('matched_milestone_tasks' if name else 'dropped_unknown_tasks')
+                if name is not None:
+                    members.setdefault(name)
+            milestone['tasks'] = list(members)
+
+    assigned = {name for milestone in milestones for name in milestone['tasks']}
+    orphans = [task['task_name'] for task in tasks if task['task_name'] not in assigned]
+    if orphans:
+        existing = next((m for m in milestones if m['milestone_name'] == catch_all), None)
+        if existing is None:
+            milestones.append({'milestone_name': catch_all, 'tasks': orphans})
+        else:
+            existing['tasks'].extend(orphans)
+        repairs.append('catch_all_milestone')
+
+    for task in tasks:
+        hours = task['estimated_time_hours']
+        if not math.isfinite(hours) or hours <= 0:
+            task['estimated_time_hours'] = min_hours
+            repairs.append('clamped_hours')
+        elif max_hours is not None and hours > max_hours:
+            task['estimated_time_hours'] = max_hours
+            repairs.append('clamped_hours')
+        if not any(resource.strip() for resource in task['required_resources']):
+            if task['assignees']:
+                task['required_resources'] = list(task['assignees'])
+                repairs.append('resources_from_assignees')
+            else:
+                task['required_resources'] = [fallback_resource]
+                repairs.append('fallback_resource')
+
+    repaired = ProjectPlan.model_validate(data)
+    remaining = validate_plan(repaired, max_hours=max_hours)
+    repairs = list(dict.fromkeys(repairs))
+    stats.record(repairs, failed=not remaining.ok)
+    return RepairResult(repaired, repairs, remaining)
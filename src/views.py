@@ -0,0 +1,165 @@
+"""
+Memoized derived views of a ProjectPlan for the AI Project Planner.
+Streamlit reruns the whole script on every interaction; keeping the
+schedule, columnar frame, figures and export bytes of a plan in a small
+LRU cache keyed by the plan's content hash means they are built once per
+plan instead of once per rerun.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from .export import export_plan
+from .frame import PlanFrame
+from .indexed import IndexedPlan
+from .models import ProjectPlan
+from .scheduler import Schedule, schedule_plan
+
+
+def plan_hash(plan: ProjectPlan) -> str:
+    """
+    Content hash of a plan
+
+    Args:
+        plan: ProjectPlan to hash
+
+    Returns:
+        Hex digest that changes whenever any field of the plan changes
+    """
+    return hashlib.sha256(plan.model_dump_json().encode('utf-8')).hexdigest()
+
+
+class PlanViews:
+    """Lazily built, memoized artifacts derived from one plan"""
+
+    def __init__(self, plan: ProjectPlan, key: str):
+        """
+        Args:
+            plan: The plan the views are derived from
+            key: plan_hash of the plan
+        """
+        self.plan = plan
+        self.key = key
+        self._values: Dict[Hashable, Any] = {}
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def get(self, name: Hashable, build: Callable[[], Any]) -> Any:
+        """
+        Return a derived artifact, building it on first use
+
+        Args:
+            name: Artifact name (any hashable, e.g. ("gantt", "Tasks"))
+            build: Zero-argument function producing the artifact
+
+        Returns:
+            The memoized artifact
+        """
+        with self._lock:
+            if name in self._values:
+                return self._values[name]
+        value = build()
+        with self._lock:
+            # Another rerun may have built it meanwhile; keep the first
+            value = self._values.setdefault(name, value)
+            self.builds += 1
+        return value
+
+    @property
+    def schedule(self) -> Schedule:
+        """Dependency- and resource-aware schedule of the plan"""
+        return self.get('schedule', lambda: schedule_plan(self.plan))
+
+    @property
+    def start_date(self) -> datetime:
+        """Project start shared by every timeline of the plan, fixed on first use"""
+        return self.get('start_date', datetime.now)
+
+    @property
+    def frame(self) -> PlanFrame:
+        """Columnar view of the plan"""
+        return self.get('frame', lambda: PlanFrame(self.plan))
+
+    @property
+    def indexed(self) -> IndexedPlan:
+        """Integer-ID index of the plan's tasks, resources and milestones"""
+        return self.get('indexed', lambda: IndexedPlan(self.plan))
+
+    @property
+    def plan_dict(self) -> Dict[str, Any]:
+        """Plan as a plain dictionary"""
+        return self.get('plan_dict', self.plan.model_dump)
+
+    @property
+    def json_bytes(self) -> bytes:
+        """Indented JSON export of the plan"""
+        return self.get('json', lambda: json.dumps(self.plan_dict, indent=2, ensure_ascii=False).encode('utf-8'))
+
+    @property
+    def csv_bytes(self) -> bytes:
+        """CSV export of the task table"""
+        return self.get('csv', lambda: export_plan(self.plan, 'csv'))
+
+    @property
+    def xlsx_bytes(self) -> bytes:
+        """Excel workbook with tasks, milestones and resources sheets"""
+        return self.get('xlsx', lambda: export_plan(self.plan, 'xlsx'))
+
+
+class ViewCache:
+    """Thread-safe LRU cache of PlanViews keyed by plan hash"""
+
+    def __init__(self, max_entries: int = 16):
+        """
+        Args:
+            max_entries: Plans whose views are kept; the least recently
+                viewed plan is dropped beyond this
+        """
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, PlanViews]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def views(self, plan: ProjectPlan, key: Optional[str] = None) -> PlanViews:
+        """
+        Views of a plan, reusing those built on an earlier rerun
+
+        Args:
+            plan: Plan being displayed
+            key: plan_hash of the plan, if already known
+
+        Returns:
+            PlanViews shared by every rerun showing this plan
+        """
+        key = key or plan_hash(plan)
+        with self._lock:
+            views = self._entries.get(key)
+            if views is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return views
+            self.misses += 1
+            views = self._entries[key] = PlanViews(plan, key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return views
+
+    def discard(self, key: Optional[str]) -> None:
+        """Drop the views of one plan (e.g. when a session resets)"""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every cached view"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,84 @@
+"""
+Tests for the asyncio planning API
+"""
+
+import asyncio
+
+import pytest
+
+from helper import load_env
+from src.crew import ProjectPlannerCrew
+
+
+load_env()
+
+
+class FakeWorker:
+    """Stands in for a crew: 'plans' by sleeping for inputs['delay']"""
+
+    running = 0
+    peak = 0
+
+    async def plan_project_async(self, inputs, use_cache=True, timeout=None):
+        FakeWorker.running += 1
+        FakeWorker.peak = max(FakeWorker.peak, FakeWorker.running)
+        try:
+            await asyncio.wait_for(asyncio.sleep(inputs['delay']), timeout)
+            return inputs['name']
+        finally:
+            FakeWorker.running -= 1
+
+    def reset(self):
+        pass
+
+
+@pytest.fixture
+def crew(monkeypatch):
+    crew = ProjectPlannerCrew(verbose=False)
+    monkeypatch.setattr(crew, '_spawn_worker', FakeWorker)
+    FakeWorker.running = FakeWorker.peak = 0
+    return crew
+
+
+def test_plan_many_async_keeps_order_and_bounds_concurrency(crew):
+    """Test results come back in input order with at most N running"""
+    inputs = [{'name': f"p{i}", 'delay': 0.05 - i * 0.01} for i in range(5)]
+
+    results = asyncio.run(crew.plan_many_async(inputs, max_concurrency=2))
+
+    assert results == [f"p{i}" for i in range(5)]
+    assert FakeWorker.peak == 2
+
+
+def test_plan_as_completed_reports_timeouts(crew):
+    """Test per-item timeouts are yielded without failing the batch"""
+    inputs = [{'name': 'slow', 'delay': 1.0}, {'name': 'fast', 'delay': 0.0}]
+
+    async def collect():
+        return [item async for item in crew.plan_as_completed(inputs, timeout=0.05)]
+
+    completed = asyncio.run(collect())
+
+    assert completed[0] == (1, 'fast')
+    assert completed[1][0] == 0
+    assert isinstance(completed[1][1], asyncio.TimeoutError)
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(crew.plan_many_async(inputs, timeout=0.05))
+
+
+def test_workers_are_reset_between_runs(crew, monkeypatch):
+    """Test a worker starts every run clean, after successes as well as failures"""
+    class StatefulWorker(FakeWorker):
+        def __init__(self):
+            self.dirty = False
+
+        async def plan_project_async(self, inputs, use_cache=True, timeout=None):
+            was_dirty, self.dirty = self.dirty, True
+            return was_dirty
+
+        def reset(self):
+            self.dirty = False
+
+    monkeypatch.setattr(crew, '_spawn_worker', StatefulWorker)
+
+    assert asyncio.run(crew.plan_many_async([{}] * 3, max_concurrency=1)) == [False, False, False]
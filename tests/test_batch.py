@@ -0,0 +1,98 @@
+"""
+Tests for JSONL batch planning
+"""
+
+import json
+
+from src import batch
+from src.models import ProjectPlan
+
+
+PLAN = ProjectPlan(
+    tasks=[{"task_name": "Build cart", "estimated_time_hours": 4.0, "required_resources": ["Dev"]}],
+    milestones=[{"milestone_name": "MVP", "tasks": ["Build cart"]}]
+)
+
+
+class FakeCrew:
+    """Returns PLAN for every input except those asking to fail or return nothing"""
+
+    planned = []
+
+    def __init__(self, **kwargs):
+        pass
+
+    async def plan_as_completed(self, inputs_list, **kwargs):
+        for index, inputs in enumerate(inputs_list):
+            FakeCrew.planned.append(inputs['project_type'])
+            if inputs['project_type'] == 'fail':
+                yield index, RuntimeError("model crashed")
+            elif inputs['project_type'] == 'empty':
+                yield index, None
+            else:
+                yield index, PLAN
+
+
+def write_jsonl(path, records):
+    path.write_text("".join(json.dumps(record) + "\n" for record in records))
+
+
+def test_read_batch_inputs_accepts_flat_and_nested(tmp_path):
+    """Test IDs and input fields are read from both record layouts"""
+    source = tmp_path / "in.jsonl"
+    write_jsonl(source, [
+        {"request_id": "a", "project_type": "Website", "title": "ignored"},
+        {"id": "b", "inputs": {"project_type": "App"}},
+        {"project_type": "API"},
+    ])
+
+    rows = list(batch.read_batch_inputs(str(source)))
+
+    assert rows == [
+        ("a", {"project_type": "Website"}),
+        ("b", {"project_type": "App"}),
+        ("line-3", {"project_type": "API"}),
+    ]
+
+
+def test_run_batch_streams_results_and_resumes(tmp_path, monkeypatch):
+    """Test results are appended per request and finished IDs are skipped"""
+    monkeypatch.setattr(batch, "ProjectPlannerCrew", FakeCrew)
+    FakeCrew.planned = []
+    source = tmp_path / "in.jsonl"
+    output = tmp_path / "out.jsonl"
+    write_jsonl(source, [
+        {"request_id": "a", "project_type": "Website"},
+        {"request_id": "b", "project_type": "fail"},
+    ])
+
+    first = batch.run_batch(str(source), str(output))
+    second = batch.run_batch(str(source), str(output))
+
+    assert first == {'total': 2, 'skipped': 0, 'succeeded': 1, 'failed': 1}
+    assert second == {'total': 2, 'skipped': 1, 'succeeded': 0, 'failed': 1}
+    assert FakeCrew.planned == ["Website", "fail", "fail"]
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert records[0]['plan'] == PLAN.model_dump()
+    assert batch.load_completed_ids(str(output)) == {"a"}
+
+
+def test_missing_plan_is_recorded_as_error(tmp_path, monkeypatch):
+    """Test a run without a structured plan fails its request, not the batch"""
+    monkeypatch.setattr(batch, "ProjectPlannerCrew", FakeCrew)
+    FakeCrew.planned = []
+    source = tmp_path / "in.jsonl"
+    output = tmp_path / "out.jsonl"
+    write_jsonl(source, [
+        {"request_id": "a", "project_type": "empty"},
+        {"request_id": "b", "project_type": "Website"},
+    ])
+
+    summary = batch.run_batch(str(source), str(output))
+
+    assert summary == {'total': 2, 'skipped': 0, 'succeeded': 1, 'failed': 1}
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert records[0] == {
+        'request_id': "a", 'status': "error", 'error': "ValueError: Planner returned no structured plan"
+    }
+    assert records[1]['status'] == "ok"
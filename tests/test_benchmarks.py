@@ -0,0 +1,61 @@
+"""
+Tests for the benchmark stub server and result comparison
+"""
+
+import importlib
+import sys
+
+from benchmarks.run import compare_results
+from benchmarks.stub_server import StubLLMServer, canned_plan
+from helper import load_env
+from src.models import ProjectPlan
+
+
+load_env()
+
+
+def test_crew_plans_against_stub_server(monkeypatch):
+    """Test a real planning run completes against the stub LLM"""
+    with StubLLMServer() as server:
+        monkeypatch.setenv('OPENAI_API_BASE', server.base_url)
+        monkeypatch.setenv('OPENAI_API_KEY', 'stub')
+        monkeypatch.setenv('OPENAI_MODEL_NAME', 'stub-model')
+        from src.crew import ProjectPlannerCrew
+
+        crew = ProjectPlannerCrew(verbose=False)
+        plan = crew.plan_project({
+            key: "x" for key in ['project_type', 'project_objectives', 'industry',
+                                 'team_members', 'project_requirements']
+        })
+
+    assert isinstance(plan, ProjectPlan)
+    assert plan == canned_plan()
+    # One LLM call per stage
+    assert server.requests == 3
+    assert crew.get_usage_metrics()['successful_requests'] == 3
+
+
+def test_compare_results_reports_relative_change():
+    """Test metrics shared by both result files are compared"""
+    baseline = {'results': {'latency': {'seconds': {'p50': 2.0}}, 'memory': {'max_rss_mb': 100}}}
+    current = {'results': {'latency': {'seconds': {'p50': 1.5}}, 'throughput': {}}}
+
+    rows = compare_results(baseline, current)
+
+    assert rows == [{'metric': 'latency.seconds.p50', 'baseline': 2.0, 'current': 1.5, 'change': -0.25}]
+
+
+def test_memory_benchmark_without_resource_module(monkeypatch):
+    """Test the suite imports and measures memory where resource is unavailable (Windows)"""
+    monkeypatch.setitem(sys.modules, 'resource', None)
+    monkeypatch.delitem(sys.modules, 'benchmarks.run')
+    run = importlib.import_module('benchmarks.run')
+
+    with StubLLMServer() as server:
+        monkeypatch.setenv('OPENAI_API_BASE', server.base_url)
+        monkeypatch.setenv('OPENAI_API_KEY', 'stub')
+        monkeypatch.setenv('OPENAI_MODEL_NAME', 'stub-model')
+        memory = run.bench_memory()
+
+    assert memory['traced_peak_mb'] > 0
+    assert 'max_rss_mb' not in memory
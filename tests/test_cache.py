@@ -0,0 +1,73 @@
+"""
+Tests for the persistent plan cache
+"""
+
+import os
+import time
+
+from src.cache import PlanCache, compute_cache_key
+from src.models import ProjectPlan
+
+
+def make_plan(name: str = "Design homepage") -> ProjectPlan:
+    return ProjectPlan(
+        tasks=[{"task_name": name, "estimated_time_hours": 8.0, "required_resources": ["UI Designer"]}],
+        milestones=[{"milestone_name": "MVP", "tasks": [name]}]
+    )
+
+
+INPUTS = {
+    'project_type': 'Website',
+    'project_objectives': 'Build a site',
+    'industry': 'Retail',
+    'team_members': '- Dev',
+    'project_requirements': '- Cart',
+}
+
+
+def test_cache_key_depends_on_inputs_and_model():
+    """Test that the key changes with inputs and model but ignores extra keys"""
+    base = compute_cache_key(INPUTS, model_name="qwen3:1.7b")
+    assert base == compute_cache_key({**INPUTS, 'unused': 'x'}, model_name="qwen3:1.7b")
+    assert base != compute_cache_key({**INPUTS, 'industry': 'Finance'}, model_name="qwen3:1.7b")
+    assert base != compute_cache_key(INPUTS, model_name="llama3")
+
+
+def test_cache_hit_and_miss(tmp_path):
+    """Test round-tripping a plan and the hit/miss counters"""
+    cache = PlanCache(cache_dir=str(tmp_path))
+    assert cache.get("abc") is None
+
+    cache.put("abc", make_plan())
+    cached = cache.get("abc")
+
+    assert cached == make_plan()
+    stats = cache.stats()
+    assert stats['hits'] == 1
+    assert stats['misses'] == 1
+    assert stats['entries'] == 1
+
+
+def test_cache_ttl_expiry(tmp_path):
+    """Test that expired entries are treated as misses and removed"""
+    cache = PlanCache(cache_dir=str(tmp_path), ttl_seconds=0.01)
+    cache.put("abc", make_plan())
+    time.sleep(0.05)
+
+    assert cache.get("abc") is None
+    assert cache.stats()['entries'] == 0
+
+
+def test_cache_size_eviction(tmp_path):
+    """Test that the least recently used entry is evicted first"""
+    cache = PlanCache(cache_dir=str(tmp_path), max_entries=2, ttl_seconds=None)
+    cache.put("a", make_plan("a"))
+    cache.put("b", make_plan("b"))
+    os.utime(tmp_path / "a.json", (1, 1))
+    os.utime(tmp_path / "b.json", (2, 2))
+    cache.put("c", make_plan("c"))
+
+    assert cache.get("a") is None
+    assert cache.get("b") is not None
+    assert cache.get("c") is not None
+    assert cache.stats()['evictions'] == 1
@@ -0,0 +1,62 @@
+"""
+Tests for LLM record/replay cassettes
+"""
+
+import pytest
+
+from benchmarks.stub_server import StubLLMServer
+from helper import load_env
+from src.cassette import Cassette, CassetteMiss
+from src.crew import ProjectPlannerCrew
+
+
+load_env()
+
+
+INPUTS = {
+    key: "x" for key in ['project_type', 'project_objectives', 'industry',
+                         'team_members', 'project_requirements']
+}
+
+
+def test_replay_runs_pipeline_without_a_model(tmp_path, monkeypatch):
+    """Test a recorded run replays to the same plan with no LLM server"""
+    path = tmp_path / "website.json.gz"
+    monkeypatch.setenv('OPENAI_API_KEY', 'stub')
+    monkeypatch.setenv('OPENAI_MODEL_NAME', 'stub-model')
+
+    with StubLLMServer() as server:
+        monkeypatch.setenv('OPENAI_API_BASE', server.base_url)
+        with Cassette(str(path), mode="record") as cassette:
+            crew = ProjectPlannerCrew(verbose=False, llm_factory=cassette.llm_factory())
+            recorded_plan = crew.plan_project(INPUTS)
+            recorded_usage = crew.get_usage_metrics()
+    assert server.requests == 3
+    assert cassette.recorded == 3
+
+    # Nothing listens here any more
+    monkeypatch.setenv('OPENAI_API_BASE', server.base_url)
+    cassette = Cassette(str(path))
+    crew = ProjectPlannerCrew(verbose=False, llm_factory=cassette.llm_factory())
+
+    assert crew.plan_project(INPUTS) == recorded_plan
+    assert cassette.replayed == 3
+    assert crew.get_usage_metrics() == recorded_usage
+
+
+def test_unrecorded_request_raises(tmp_path):
+    """Test replay fails loudly instead of calling a model"""
+    path = tmp_path / "empty.json"
+    Cassette(str(path), mode="record").save()
+
+    cassette = Cassette(str(path))
+    llm = cassette.llm_factory()('estimation_agent')
+
+    with pytest.raises(CassetteMiss):
+        llm.call([{'role': 'user', 'content': "Estimate this"}])
+
+
+def test_invalid_mode_is_rejected(tmp_path):
+    """Test only record and replay modes are accepted"""
+    with pytest.raises(ValueError):
+        Cassette(str(tmp_path / "c.json"), mode="live")
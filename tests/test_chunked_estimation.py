@@ -0,0 +1,85 @@
+"""
+Tests for map-reduce estimation over chunks of the task breakdown
+"""
+
+import re
+import time
+
+import pytest
+
+from benchmarks.stub_server import StubLLMServer, canned_plan
+from helper import load_env
+from src.compaction import split_task_blocks
+from src.crew import ProjectPlannerCrew
+from src.events import STAGE_STEP
+
+
+load_env()
+
+
+INPUTS = {
+    key: "x" for key in ['project_type', 'project_objectives', 'industry',
+                         'team_members', 'project_requirements']
+}
+
+
+def test_split_task_blocks_keeps_each_task_with_its_fields():
+    """Test a markdown breakdown is split into one block per task"""
+    breakdown = """Here is the breakdown:
+### Frontend
+1. **Task ID:** T1 - Design homepage
+   - Category: design
+   Mockups for desktop and mobile.
+2. **Task ID:** T2 - Build API
+   - Dependencies: T1
+"""
+
+    blocks = split_task_blocks(breakdown)
+
+    assert len(blocks) == 2
+    assert blocks[0].startswith("1. **Task ID:** T1") and "Mockups" in blocks[0]
+    assert blocks[1].endswith("Dependencies: T1")
+
+
+def test_estimation_runs_in_parallel_chunks(monkeypatch):
+    """Test each chunk gets its own estimation call and results merge in order"""
+    prompts = []
+
+    def respond(body):
+        prompt = "\n".join(str(m.get('content') or '') for m in body.get('messages', []))
+        prompts.append(prompt)
+        chunk = re.search(r"Tasks (\d+-\d+) of 12", prompt)
+        if chunk is None:
+            return None
+        if chunk.group(1) == "1-5":
+            # The first chunk finishes last, so merging must restore order
+            time.sleep(0.3)
+        return f"Thought: I now know the final answer\nFinal Answer: Estimates for tasks {chunk.group(1)}"
+
+    with StubLLMServer(latency=0.05, responder=respond) as server:
+        monkeypatch.setenv('OPENAI_API_BASE', server.base_url)
+        monkeypatch.setenv('OPENAI_API_KEY', 'stub')
+        monkeypatch.setenv('OPENAI_MODEL_NAME', 'stub-model')
+
+        crew = ProjectPlannerCrew(verbose=False, estimation_chunk_size=5, estimation_workers=3)
+        events = []
+        plan = crew.plan_project(INPUTS, use_cache=False, on_event=events.append)
+
+    assert plan == canned_plan()
+    # Breakdown, three estimation chunks (12 tasks), allocation
+    assert server.requests == 5
+    assert crew.get_usage_metrics()['successful_requests'] == 5
+    assert server.max_in_flight == 3
+    assert [e.message for e in events if e.kind == STAGE_STEP and e.message] == [
+        "Estimated chunk 1/3", "Estimated chunk 2/3", "Estimated chunk 3/3"
+    ]
+
+    allocation = prompts[-1]
+    positions = [allocation.find(f"Estimates for tasks {span}") for span in ("1-5", "6-10", "11-12")]
+    assert -1 not in positions and positions == sorted(positions)
+
+
+def test_invalid_chunk_size_is_rejected():
+    """Test a chunk size below one raises ValueError"""
+    with pytest.raises(ValueError):
+        ProjectPlannerCrew(verbose=False, estimation_chunk_size=0)
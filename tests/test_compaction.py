@@ -0,0 +1,99 @@
+"""
+Tests for inter-stage context compaction
+"""
+
+from helper import load_env
+from src.compaction import compact_stage_output
+from src.crew import ProjectPlannerCrew
+
+
+load_env()
+
+
+BREAKDOWN = """Here is the detailed task list:
+
+1. **Task ID:** T1
+   - **Task Name:** Set up repository
+   - **Description:** Create the git repository and CI pipeline for the team.
+   - **Category:** Deployment
+   - **Dependencies:** None
+   - **Priority:** High
+
+2. **Task ID:** T2
+   - **Task Name:** Design homepage
+   - **Description:** Produce responsive mockups for the landing page.
+   - **Category:** Design
+   - **Dependencies:** T1
+   - **Priority:** Medium
+"""
+
+ESTIMATES = """### Task 1: Set up repository
+- Estimated Hours: 6-8 hours
+- Required Resources: DevOps Engineer, GitHub Actions
+- Risk factors: CI flakiness may delay the pipeline setup considerably.
+- Mitigation: Use well-known templates and pair with a senior engineer.
+- Confidence level: High
+"""
+
+
+def test_compacts_breakdown_to_task_table():
+    """Test prose fields are dropped and task fields kept one line per task"""
+    result = compact_stage_output(BREAKDOWN)
+
+    assert result.compacted
+    assert result.task_count == 2
+    assert result.text.splitlines()[1:] == [
+        "T1 | Set up repository | deployment |  |  | ",
+        "T2 | Design homepage | design | T1 |  | ",
+    ]
+    assert result.tokens_saved > 0
+
+
+def test_compacts_estimates_with_hours_and_resources():
+    """Test hour ranges use the upper bound and resources are kept"""
+    result = compact_stage_output(ESTIMATES)
+
+    assert result.text.splitlines()[1] == (
+        "1 | Set up repository |  |  | 8 | DevOps Engineer,GitHub Actions"
+    )
+    assert "Mitigation" not in result.text
+
+
+def test_unrecognized_output_is_left_alone():
+    """Test text without a task list passes through unchanged"""
+    result = compact_stage_output("The project looks feasible.")
+
+    assert not result.compacted
+    assert result.text == "The project looks feasible."
+    assert result.tokens_saved == 0
+
+
+def test_crew_compacts_context_and_reports_savings(monkeypatch):
+    """Test intermediate outputs are compacted and savings reach the metrics"""
+    crew = ProjectPlannerCrew(verbose=False, compact_context=True)
+    outputs = [
+        type("Output", (), {"raw": BREAKDOWN})(),
+        type("Output", (), {"raw": ESTIMATES})(),
+        type("Output", (), {"raw": '{"tasks": []}'})(),
+    ]
+
+    def fake_kickoff(self, inputs):
+        for output in outputs:
+            crew._on_task_complete(output)
+        return type("Result", (), {"pydantic": None})()
+
+    monkeypatch.setattr(type(crew.crew), "kickoff", fake_kickoff)
+    crew.plan_project({key: "x" for key in ['project_type', 'project_objectives', 'industry',
+                                            'team_members', 'project_requirements']})
+
+    breakdown = compact_stage_output(BREAKDOWN)
+    estimates = compact_stage_output(ESTIMATES)
+    assert outputs[0].raw == breakdown.text
+    assert outputs[1].raw == estimates.text
+    # The final structured output is never rewritten
+    assert outputs[2].raw == '{"tasks": []}'
+    # Breakdown feeds two later stages, estimates feed one
+    assert crew.context_tokens_saved == 2 * breakdown.tokens_saved + estimates.tokens_saved
+
+    crew.reset()
+    assert crew.context_tokens_saved == 0
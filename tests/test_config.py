@@ -0,0 +1,51 @@
+"""
+Tests for the shared configuration registry
+"""
+
+import os
+import shutil
+
+import pytest
+
+from src.config import AGENTS_SCHEMA, TASKS_SCHEMA, ConfigRegistry
+
+
+def test_registry_parses_once_and_reloads_on_change(tmp_path):
+    """Test the file is parsed once per version and hot-reloaded"""
+    path = tmp_path / "tasks.yaml"
+    shutil.copy("config/tasks.yaml", path)
+    registry = ConfigRegistry()
+
+    first = registry.load(str(path), TASKS_SCHEMA)
+    second = registry.load(str(path), TASKS_SCHEMA)
+    assert registry.loads == 1
+    assert first == second
+    first['task_breakdown']['description'] = "mutated"
+    assert registry.load(str(path))['task_breakdown']['description'] != "mutated"
+
+    stamp = registry.stamp(str(path))
+    path.write_text(path.read_text().replace("Carefully analyze", "Analyze"))
+    os.utime(path, ns=(stamp[0] + 10**9, stamp[0] + 10**9))
+
+    reloaded = registry.load(str(path), TASKS_SCHEMA)
+    assert registry.loads == 2
+    assert reloaded['task_breakdown']['description'].startswith("Analyze")
+
+
+def test_registry_validates_expected_keys(tmp_path):
+    """Test missing entries and fields are reported at load time"""
+    path = tmp_path / "agents.yaml"
+    path.write_text(
+        "project_planning_agent:\n"
+        "  role: Planner\n"
+        "  goal: Plan\n"
+        "estimation_agent:\n"
+        "  role: Estimator\n"
+    )
+
+    with pytest.raises(ValueError) as error:
+        ConfigRegistry().load(str(path), AGENTS_SCHEMA)
+
+    message = str(error.value)
+    assert "'project_planning_agent' is missing ['backstory']" in message
+    assert "missing 'resource_allocation_agent'" in message
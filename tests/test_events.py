@@ -0,0 +1,74 @@
+"""
+Tests for planning progress events
+"""
+
+from helper import load_env
+from src.crew import ProjectPlannerCrew
+from src.events import (
+    RUN_FAILED,
+    RUN_FINISHED,
+    RUN_STARTED,
+    STAGE_FINISHED,
+    STAGE_STARTED,
+    format_event,
+)
+
+
+load_env()
+
+
+def test_crew_emits_stage_events_in_order(monkeypatch):
+    """Test a run reports every stage start/finish and full progress"""
+    crew = ProjectPlannerCrew(verbose=False)
+
+    def fake_kickoff(self, inputs):
+        for task in crew.tasks:
+            crew._on_agent_step(None)
+            crew._on_task_complete(None)
+        return type("Result", (), {"pydantic": None})()
+
+    monkeypatch.setattr(type(crew.crew), "kickoff", fake_kickoff)
+    events = []
+
+    crew.plan_project(
+        {key: "x" for key in ['project_type', 'project_objectives', 'industry',
+                              'team_members', 'project_requirements']},
+        on_event=events.append
+    )
+
+    kinds = [event.kind for event in events if event.kind != "stage_step"]
+    assert kinds == [
+        RUN_STARTED,
+        STAGE_STARTED, STAGE_FINISHED,
+        STAGE_STARTED, STAGE_FINISHED,
+        STAGE_STARTED, STAGE_FINISHED,
+        RUN_FINISHED,
+    ]
+    assert [event.stage for event in events if event.kind == STAGE_FINISHED] == [
+        'task_breakdown', 'time_resource_estimation', 'resource_allocation'
+    ]
+    assert events[-1].progress == 1.0
+    assert all(format_event(event) for event in events)
+
+
+def test_crew_reports_failures(monkeypatch):
+    """Test a crashing kickoff produces a run_failed event"""
+    crew = ProjectPlannerCrew(verbose=False)
+
+    def crash(self, inputs):
+        raise RuntimeError("model offline")
+
+    monkeypatch.setattr(type(crew.crew), "kickoff", crash)
+    events = []
+
+    try:
+        crew.plan_project(
+            {key: "x" for key in ['project_type', 'project_objectives', 'industry',
+                                  'team_members', 'project_requirements']},
+            on_event=events.append
+        )
+    except RuntimeError:
+        pass
+
+    assert events[-1].kind == RUN_FAILED
+    assert events[-1].message == "model offline"
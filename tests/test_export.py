@@ -0,0 +1,84 @@
+"""
+Tests for the streaming plan exporters
+"""
+
+import csv
+import io
+import json
+
+import pytest
+from openpyxl import load_workbook
+
+from src.export import export_plan, export_plans, iter_batch_plans
+from src.models import ProjectPlan
+from src.store import PlanStore
+
+
+PLAN = ProjectPlan(
+    tasks=[
+        {"task_name": "Build", "estimated_time_hours": 20, "required_resources": ["Developer", "CI"]},
+        {"task_name": "Test", "estimated_time_hours": 4, "required_resources": ["QA"],
+         "dependencies": ["Build"], "assignees": ["Ann"]},
+    ],
+    milestones=[{"milestone_name": "Launch", "tasks": ["Build", "Test"]}]
+)
+
+
+def test_single_plan_exports():
+    """Test a single plan exports to CSV, JSONL and an XLSX workbook with three sheets"""
+    rows = list(csv.reader(io.StringIO(export_plan(PLAN, 'csv').decode('utf-8'))))
+    assert rows[0] == ['task_name', 'estimated_time_hours', 'required_resources', 'dependencies', 'assignees']
+    assert rows[2] == ['Test', '4.0', 'QA', 'Build', 'Ann']
+
+    assert ProjectPlan.model_validate_json(export_plan(PLAN, 'jsonl')) == PLAN
+
+    workbook = load_workbook(io.BytesIO(export_plan(PLAN, 'xlsx')), read_only=True)
+    assert workbook.sheetnames == ['tasks', 'milestones', 'resources']
+    resources = list(workbook['resources'].values)
+    assert resources[0] == ('resource', 'task_name', 'hours')
+    assert resources[1:] == [('Developer', 'Build', 20), ('CI', 'Build', 20), ('QA', 'Test', 4)]
+    assert list(workbook['milestones'].values)[1] == ('Launch', 2, 'Build, Test')
+
+    with pytest.raises(ValueError):
+        export_plan(PLAN, 'pdf')
+
+
+def test_export_store_and_batch(tmp_path):
+    """Test store and batch plans stream to files whose format follows the extension"""
+    store = PlanStore(tmp_path / "plans.db")
+    inputs = {'project_type': "Website", 'industry': "Retail"}
+    store.add_many([(PLAN, inputs)] * 7)
+    records = ((str(plan_id), plan) for plan_id, plan in store.iter_plans(page_size=3))
+    assert export_plans(records, tmp_path / "history.jsonl") == 7
+    lines = (tmp_path / "history.jsonl").read_text(encoding='utf-8').splitlines()
+    assert [json.loads(line)['plan_id'] for line in lines] == [str(i) for i in range(1, 8)]
+    store.close()
+
+    results = tmp_path / "batch_results.jsonl"
+    results.write_text(
+        json.dumps({'request_id': "a", 'status': "ok", 'plan': PLAN.model_dump()}) + "\n"
+        + json.dumps({'request_id': "b", 'status': "error", 'error': "boom"}) + "\n",
+        encoding='utf-8'
+    )
+    count = export_plans(iter_batch_plans(results), tmp_path / "resources.csv", table='resources')
+    assert count == 3
+    with open(tmp_path / "resources.csv", newline='', encoding='utf-8') as file:
+        assert next(csv.reader(file)) == ['plan_id', 'resource', 'task_name', 'hours']
+
+    with pytest.raises(ValueError):
+        export_plans([], tmp_path / "plans.txt")
+
+
+def test_parquet_row_groups(tmp_path):
+    """Test Parquet exports are written in bounded row groups"""
+    pq = pytest.importorskip("pyarrow.parquet")
+
+    records = ((str(i), PLAN) for i in range(25))
+    assert export_plans(records, tmp_path / "tasks.parquet", batch_rows=10) == 50
+
+    parquet = pq.ParquetFile(tmp_path / "tasks.parquet")
+    assert parquet.metadata.num_rows == 50
+    assert parquet.metadata.num_row_groups == 5
+    table = parquet.read()
+    assert table.column_names[:3] == ['plan_id', 'task_name', 'estimated_time_hours']
+    assert table.column('estimated_time_hours').to_pylist()[:2] == [20.0, 4.0]
@@ -0,0 +1,49 @@
+"""
+Tests for the columnar plan representation
+"""
+
+from src.frame import PlanFrame
+from src.models import ProjectPlan
+
+
+PLAN = ProjectPlan(
+    tasks=[
+        {"task_name": "Design", "estimated_time_hours": 8, "required_resources": ["Designer", "Figma"]},
+        {"task_name": "Build", "estimated_time_hours": 20, "required_resources": ["Developer"]},
+        {"task_name": "Test", "estimated_time_hours": 4, "required_resources": ["Developer"]},
+    ],
+    milestones=[
+        {"milestone_name": "MVP", "tasks": ["Design", "Build", "Unknown"]},
+        {"milestone_name": "Launch", "tasks": ["Test"]},
+        {"milestone_name": "Launch", "tasks": []},
+    ]
+)
+
+
+def test_totals_and_resource_metrics():
+    """Test vectorized totals match the plan"""
+    frame = PlanFrame(PLAN)
+
+    assert frame.total_hours == 32
+    assert frame.resource_counts().to_dict() == {"Developer": 2, "Designer": 1, "Figma": 1}
+    assert frame.resource_load().to_dict() == {"Developer": 24, "Designer": 8, "Figma": 8}
+    assert frame.percentiles((50,)) == {50: 8.0}
+    assert list(frame.tasks["required_resources"]) == ["Designer, Figma", "Developer", "Developer"]
+
+
+def test_milestone_hours_follow_milestone_order():
+    """Test milestone membership ignores unknown names and keeps duplicates apart"""
+    frame = PlanFrame(PLAN)
+
+    assert frame.milestone_hours().tolist() == [28.0, 4.0, 0.0]
+    assert frame.milestones["task_index"].tolist() == [0, 1, -1, 2]
+
+
+def test_empty_plan():
+    """Test an empty plan produces empty, well-typed columns"""
+    frame = PlanFrame(ProjectPlan(tasks=[], milestones=[]))
+
+    assert len(frame) == 0
+    assert frame.total_hours == 0.0
+    assert frame.resource_counts().empty
+    assert frame.milestone_hours().empty
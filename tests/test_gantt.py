@@ -0,0 +1,69 @@
+"""
+Tests for Gantt chart data
+"""
+
+from datetime import datetime
+
+from src.frame import PlanFrame
+from src.gantt import downsample_rows, milestone_rows, milestone_task_rows, task_rows
+from src.models import ProjectPlan
+from src.scheduler import schedule_plan
+
+
+START = datetime(2025, 1, 6, 9)
+
+PLAN = ProjectPlan(
+    tasks=[
+        {"task_name": "Design", "estimated_time_hours": 8, "required_resources": ["Designer"]},
+        {"task_name": "Build", "estimated_time_hours": 20, "required_resources": ["Developer"],
+         "dependencies": ["Design"]},
+        {"task_name": "Docs", "estimated_time_hours": 2, "required_resources": ["Writer"]},
+        {"task_name": "Test", "estimated_time_hours": 4, "required_resources": ["QA"],
+         "dependencies": ["Build"]},
+    ],
+    milestones=[
+        {"milestone_name": "MVP", "tasks": ["Design", "Build", "Unknown"]},
+        {"milestone_name": "Launch", "tasks": ["Test"]},
+    ]
+)
+
+
+def test_task_and_milestone_rows():
+    """Test task rows follow the schedule and milestone bars span their tasks"""
+    schedule = schedule_plan(PLAN)
+    frame = PlanFrame(PLAN)
+
+    tasks = task_rows(schedule, START)
+    assert tasks['Task'].tolist() == ["Design", "Build", "Docs", "Test"]
+    assert tasks['Finish'].iloc[1] == datetime(2025, 1, 7, 13)
+
+    bars = milestone_rows(schedule, frame, START)
+    assert bars['Milestone'].tolist() == ["MVP", "Launch", "(No milestone)"]
+    assert bars['Tasks'].tolist() == [2, 1, 1]
+    assert bars['Hours'].tolist() == [28.0, 4.0, 2.0]
+    assert bars['Start'].iloc[0] == START and bars['Finish'].iloc[0] == datetime(2025, 1, 7, 13)
+
+    assert milestone_task_rows(schedule, frame, 0, START)['Task'].tolist() == ["Design", "Build"]
+    assert milestone_task_rows(schedule, frame, 2, START)['Task'].tolist() == ["Docs"]
+
+
+def test_downsampling_keeps_critical_tasks_in_order():
+    """Test large charts are capped with critical tasks kept and plan order preserved"""
+    plan = ProjectPlan(
+        tasks=[
+            {"task_name": f"T{i}", "estimated_time_hours": 1, "required_resources": [f"R{i}"],
+             "dependencies": [f"T{i - 1}"] if i % 100 else []}
+            for i in range(1000)
+        ],
+        milestones=[]
+    )
+    rows = task_rows(schedule_plan(plan), START)
+
+    kept, hidden = downsample_rows(rows, max_rows=50)
+
+    assert len(kept) == 50 and hidden == 950
+    assert (kept['Critical'] == '🔴 Critical').any()
+    positions = [int(name[1:]) for name in kept['Task']]
+    assert positions == sorted(positions)
+    small, hidden = downsample_rows(rows.head(10), max_rows=50)
+    assert len(small) == 10 and hidden == 0
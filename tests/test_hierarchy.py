@@ -0,0 +1,90 @@
+"""
+Tests for hierarchical planning of long requirement lists
+"""
+
+from benchmarks.stub_server import StubLLMServer, canned_plan
+from helper import load_env
+from src.crew import ProjectPlannerCrew
+from src.events import STAGE_STEP
+from src.hierarchy import cluster_requirements, merge_cluster_breakdowns
+
+
+load_env()
+
+
+def test_requirements_cluster_by_heading_and_keyword():
+    """Test sections stay together and loose bullets group by shared words"""
+    sectioned = "## Payments\n- Checkout\n- Refunds\n- Invoices\n## Catalog\n- Listing\n- Search"
+
+    clusters = cluster_requirements(sectioned, cluster_size=3)
+
+    assert [(c.label, c.requirements) for c in clusters] == [
+        ("Payments", ['Checkout', 'Refunds', 'Invoices']),
+        ("Catalog", ['Listing', 'Search']),
+    ]
+
+    loose = """
+- Blog post editor
+- User login with email
+- Blog comments moderation
+- Password reset via email
+- Login with Google
+- Blog RSS feed
+"""
+    clusters = cluster_requirements(loose, cluster_size=3)
+
+    assert [c.requirements for c in clusters] == [
+        ['Blog post editor', 'Blog comments moderation', 'Blog RSS feed'],
+        ['User login with email', 'Password reset via email', 'Login with Google'],
+    ]
+
+
+def test_merge_drops_duplicates_and_namespaces_ids():
+    """Test tasks repeated across clusters are kept once with unique IDs"""
+    payments = """1. **Task ID:** T1 - Set up repository
+   - Category: deployment
+2. **Task ID:** T2 - Build checkout
+   - Dependencies: T1
+"""
+    catalog = """1. **Task ID:** T1 - Repository setup
+   - Category: deployment
+2. **Task ID:** T2 - Product listing
+   - Dependencies: T1
+"""
+
+    merged = merge_cluster_breakdowns([payments, catalog], ["Payments", "Catalog"])
+
+    assert merged.task_count == 3
+    assert merged.duplicates == 1
+    assert "C2-T1" not in merged.text
+    assert "**Task ID:** C2-T2 - Product listing\n   - Dependencies: C1-T1" in merged.text
+
+
+def test_crew_plans_requirement_groups_in_parallel(monkeypatch):
+    """Test each requirement group gets one planning call and the merge dedupes"""
+    inputs = {
+        'project_type': "Store",
+        'project_objectives': "Sell online",
+        'industry': "Retail",
+        'team_members': "Alice (Developer)",
+        'project_requirements': "## Payments\n- Checkout\n- Refunds\n## Catalog\n- Listing\n- Search",
+    }
+    with StubLLMServer() as server:
+        monkeypatch.setenv('OPENAI_API_BASE', server.base_url)
+        monkeypatch.setenv('OPENAI_API_KEY', 'stub')
+        monkeypatch.setenv('OPENAI_MODEL_NAME', 'stub-model')
+
+        crew = ProjectPlannerCrew(verbose=False, requirement_cluster_size=2)
+        events = []
+        plan = crew.plan_project(inputs, use_cache=False, on_event=events.append)
+
+    assert plan == canned_plan()
+    # Two planning groups, estimation, allocation
+    assert server.requests == 4
+    breakdown = crew.tasks[0].output.raw
+    # Both groups returned the same tasks, so only the first group is kept
+    assert "Requirement group 1 - Payments" in breakdown
+    assert "Requirement group 2" not in breakdown
+    assert [e.message for e in events if e.kind == STAGE_STEP and e.message] == [
+        "Planned requirement group 1/2", "Planned requirement group 2/2"
+    ]
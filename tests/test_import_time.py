@@ -0,0 +1,53 @@
+"""
+Import-time benchmark for the src package
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+
+# Budget for "from src.models import ProjectPlan" in a fresh interpreter
+IMPORT_BUDGET_SECONDS = float(os.getenv("PLANNER_IMPORT_BUDGET", "1.0"))
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from src.models import ProjectPlan
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "elapsed": elapsed,
+    "crewai_loaded": "crewai" in sys.modules,
+}))
+"""
+
+
+def run_probe(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_models_import_is_fast_and_skips_crewai():
+    """Test importing the models does not load CrewAI and stays within budget"""
+    samples = [json.loads(run_probe(PROBE).stdout) for _ in range(3)]
+
+    assert not any(sample["crewai_loaded"] for sample in samples)
+    best = min(sample["elapsed"] for sample in samples)
+    assert best < IMPORT_BUDGET_SECONDS, f"src.models import took {best:.3f}s"
+
+
+def test_package_import_has_no_side_effects():
+    """Test importing src prints nothing and loads heavy symbols on demand"""
+    result = run_probe(
+        "import sys, src\n"
+        "assert 'crewai' not in sys.modules\n"
+        "assert src.ProjectPlannerCrew.__name__ == 'ProjectPlannerCrew'\n"
+        "assert 'crewai' in sys.modules\n"
+    )
+
+    assert result.stdout == ""
@@ -0,0 +1,119 @@
+"""
+Tests for incremental re-planning with the stage cache
+"""
+
+from crewai import Crew, TaskOutput
+
+from helper import load_env
+from src.cache import StageCache
+from src.crew import ProjectPlannerCrew
+from src.events import STAGE_FINISHED
+from src.models import ProjectPlan
+from src.retrieval import SimilarPlanIndex
+
+
+load_env()
+
+
+INPUTS = {
+    'project_type': "Website",
+    'project_objectives': "Launch a store",
+    'industry': "Retail",
+    'team_members': "Alice (Developer)",
+    'project_requirements': "Checkout and catalog",
+}
+
+
+PLAN = ProjectPlan(
+    tasks=[{"task_name": "Checkout", "estimated_time_hours": 8, "required_resources": ["Developer"]}],
+    milestones=[{"milestone_name": "Launch", "tasks": ["Checkout"]}]
+)
+
+
+def make_crew(tmp_path, monkeypatch, plan=None, **options):
+    """Build a crew whose kickoff records the stages it runs"""
+    crew = ProjectPlannerCrew(verbose=False, stage_cache=StageCache(str(tmp_path)), **options)
+    ran = []
+
+    def fake_kickoff(self, inputs):
+        for task in self.tasks:
+            stage = crew.tasks.index(task)
+            ran.append(stage)
+            context = "+".join(t.output.raw for t in crew.tasks[:stage])
+            task.output = TaskOutput(
+                description=task.description,
+                raw=f"stage{stage}[{inputs['team_members']}|{inputs['project_requirements']}]({context})",
+                agent=task.agent.role
+            )
+            crew._on_task_complete(task.output)
+        return type("Result", (), {"pydantic": plan})()
+
+    monkeypatch.setattr(Crew, "kickoff", fake_kickoff)
+    return crew, ran
+
+
+def test_team_only_change_reruns_later_stages(tmp_path, monkeypatch):
+    """Test editing team members reuses the task breakdown"""
+    crew, ran = make_crew(tmp_path, monkeypatch)
+    crew.plan_project(INPUTS)
+    breakdown = crew.tasks[0].output.raw
+    assert ran == [0, 1, 2]
+
+    ran.clear()
+    events = []
+    crew.plan_project({**INPUTS, 'team_members': "Bob (Designer)"}, on_event=events.append)
+
+    assert ran == [1, 2]
+    assert crew.reused_stages == 1
+    assert crew.tasks[0].output.raw == breakdown
+    # Later stages saw the restored breakdown as context
+    assert breakdown in crew.tasks[1].output.raw
+    assert [e.stage for e in events if e.kind == STAGE_FINISHED] == [
+        'task_breakdown', 'time_resource_estimation', 'resource_allocation'
+    ]
+
+
+def test_requirement_change_reruns_everything(tmp_path, monkeypatch):
+    """Test a change read by the first stage invalidates every stage"""
+    crew, ran = make_crew(tmp_path, monkeypatch)
+    crew.plan_project(INPUTS)
+
+    ran.clear()
+    crew.plan_project({**INPUTS, 'project_requirements': "Checkout only"})
+    assert ran == [0, 1, 2]
+
+    ran.clear()
+    crew.plan_project(INPUTS, use_cache=False)
+    assert ran == [0, 1, 2]
+
+
+def test_unchanged_inputs_only_rerun_final_stage(tmp_path, monkeypatch):
+    """Test the final, plan-producing stage always runs"""
+    crew, ran = make_crew(tmp_path, monkeypatch)
+    crew.plan_project(INPUTS)
+
+    ran.clear()
+    crew.plan_project(INPUTS)
+    assert ran == [2]
+
+
+def test_team_only_change_with_reference_plan_skips_breakdown(tmp_path, monkeypatch):
+    """Test a similar-plan example does not invalidate the cached breakdown"""
+    similar_plans = SimilarPlanIndex()
+    earlier = ProjectPlan(
+        tasks=[{"task_name": "Catalog", "estimated_time_hours": 5, "required_resources": ["Developer"]}],
+        milestones=[{"milestone_name": "Beta", "tasks": ["Catalog"]}]
+    )
+    similar_plans.add({**INPUTS, 'project_objectives': "Launch a shop", 'team_members': "Zoe"}, earlier)
+    crew, ran = make_crew(tmp_path, monkeypatch, plan=PLAN, similar_plans=similar_plans)
+    crew.plan_project(INPUTS)
+    assert crew.last_similar_plan is not None
+    # The new plan is indexed too and is the closer example next time
+    assert len(similar_plans) == 2
+
+    ran.clear()
+    crew.plan_project({**INPUTS, 'team_members': "Bob (Designer)"})
+
+    assert crew.last_similar_plan.plan == PLAN
+    assert ran == [1, 2]
+    assert crew.reused_stages == 1
@@ -0,0 +1,69 @@
+"""
+Tests for the indexed plan model
+"""
+
+import time
+
+from src.indexed import IndexedPlan
+from src.models import ProjectPlan
+
+
+def make_plan() -> ProjectPlan:
+    return ProjectPlan(
+        tasks=[
+            {"task_name": "Design", "estimated_time_hours": 8, "required_resources": ["Designer", "Figma"]},
+            {"task_name": "Build", "estimated_time_hours": 20, "required_resources": ["Developer"]},
+            {"task_name": "Test", "estimated_time_hours": 4, "required_resources": ["Developer", "QA"]},
+            {"task_name": "Build", "estimated_time_hours": 2, "required_resources": []},
+            {"task_name": "Docs", "estimated_time_hours": 3, "required_resources": ["Writer"]},
+        ],
+        milestones=[
+            {"milestone_name": "MVP", "tasks": ["Design", "Build", "Unknown"]},
+            {"milestone_name": "Launch", "tasks": ["Test", "Design"]},
+        ]
+    )
+
+
+def test_ids_and_maps():
+    """Test tasks, resources and milestones resolve to integer IDs"""
+    indexed = IndexedPlan(make_plan())
+
+    assert len(indexed) == 5 and "Docs" in indexed and "Unknown" not in indexed
+    assert indexed.task_id("Build") == 1 and indexed.duplicate_task_ids == [3]
+    assert indexed.task("Test").estimated_time_hours == 4
+    assert indexed.task("Missing") is None
+
+    assert indexed.resource_names == ["Designer", "Figma", "Developer", "QA", "Writer"]
+    assert indexed.resource_task_ids_for("Developer").tolist() == [1, 2]
+    assert indexed.resource_task_ids_for("Figma").tolist() == [0]
+    assert indexed.resource_task_ids_for("Nobody").tolist() == []
+
+    assert [ids.tolist() for ids in indexed.milestone_task_ids] == [[0, 1], [2, 0]]
+    assert indexed.unknown_milestone_tasks == {0: ["Unknown"]}
+    assert indexed.milestone_of.tolist() == [0, 0, 1, -1, -1]
+    assert indexed.unassigned_task_ids().tolist() == [3, 4]
+    assert [task.task_name for task in indexed.milestone_tasks(1)] == ["Test", "Design"]
+
+
+def test_resource_strings_are_shared():
+    """Test equal resource strings end up as one object, and indexing stays linear"""
+    role = "".join(["Back", "end Developer"])
+    plan = ProjectPlan(
+        tasks=[
+            {"task_name": f"T{i}", "estimated_time_hours": 1,
+             "required_resources": ["".join(["Back", "end Developer"]), f"R{i % 50}"]}
+            for i in range(20_000)
+        ],
+        milestones=[{"milestone_name": "All", "tasks": [f"T{i}" for i in range(20_000)]}]
+    )
+    assert plan.tasks[0].required_resources[0] is not plan.tasks[1].required_resources[0]
+
+    started = time.perf_counter()
+    indexed = IndexedPlan(plan)
+    elapsed = time.perf_counter() - started
+
+    first = plan.tasks[0].required_resources[0]
+    assert all(task.required_resources[0] is first for task in plan.tasks)
+    assert first == role and len(indexed.resource_names) == 51
+    assert len(indexed.resource_task_ids_for(role)) == 20_000
+    assert elapsed < 2.0
@@ -0,0 +1,111 @@
+"""
+Tests for the background planning job queue
+"""
+
+import threading
+
+import pytest
+
+from benchmarks.stub_server import StubLLMServer, canned_plan
+from helper import load_env
+from src.jobs import FAILED, QUEUED, SUCCEEDED, JobQueue
+from src.pool import CrewPool
+
+
+load_env()
+
+
+INPUTS = {
+    key: "x" for key in ['project_type', 'project_objectives', 'industry',
+                         'team_members', 'project_requirements']
+}
+
+
+@pytest.fixture
+def stub_env(monkeypatch):
+    with StubLLMServer() as server:
+        monkeypatch.setenv('OPENAI_API_BASE', server.base_url)
+        monkeypatch.setenv('OPENAI_API_KEY', 'stub')
+        monkeypatch.setenv('OPENAI_MODEL_NAME', 'stub-model')
+        yield server
+
+
+def test_job_runs_in_background_and_persists(stub_env, tmp_path):
+    """Test a submitted job plans on a worker and its result survives a restart"""
+    queue = JobQueue(CrewPool(size=1, verbose=False), directory=str(tmp_path))
+    updates = []
+
+    job_id = queue.submit(INPUTS, use_cache=False, compact_context=True)
+    queue.subscribe(job_id, lambda job: updates.append(job.status))
+    job = queue.wait(job_id, timeout=60)
+    queue.shutdown()
+
+    assert job.status == SUCCEEDED
+    assert job.plan == canned_plan()
+    assert job.usage['successful_requests'] == 3
+    assert updates[-1] == SUCCEEDED
+    # The pooled crew gets its own settings back after the job
+    with queue.pool.checkout() as crew:
+        assert crew.compact_context is False
+
+    reloaded = JobQueue(CrewPool(size=1, verbose=False), directory=str(tmp_path))
+    assert reloaded.result(job_id) == canned_plan()
+    reloaded.shutdown()
+
+
+def test_failed_job_records_error(tmp_path, monkeypatch):
+    """Test an exception in planning marks the job failed instead of killing the worker"""
+    pool = CrewPool(size=1, verbose=False)
+    with pool.checkout() as crew:
+        def fail(*args, **kwargs):
+            raise RuntimeError("model unavailable")
+        monkeypatch.setattr(crew, 'plan_project', fail)
+    queue = JobQueue(pool, directory=str(tmp_path))
+
+    first = queue.wait(queue.submit(INPUTS), timeout=10)
+    second = queue.wait(queue.submit(INPUTS), timeout=10)
+    queue.shutdown()
+
+    assert first.status == second.status == FAILED
+    assert first.error == "model unavailable"
+
+
+def test_job_without_plan_fails(tmp_path, monkeypatch):
+    """Test a run that produced no structured plan is not reported as a success"""
+    pool = CrewPool(size=1, verbose=False)
+    with pool.checkout() as crew:
+        monkeypatch.setattr(crew, 'plan_project', lambda *args, **kwargs: None)
+    queue = JobQueue(pool, directory=str(tmp_path))
+
+    job = queue.wait(queue.submit(INPUTS), timeout=10)
+    queue.shutdown()
+
+    assert job.status == FAILED and job.plan is None
+    assert job.error == "Planner returned no structured plan"
+
+
+def test_submit_validates_and_resumes_unfinished_jobs(tmp_path, monkeypatch):
+    """Test bad submissions are rejected and queued jobs are picked up after a restart"""
+    pool = CrewPool(size=1, verbose=False)
+    release = threading.Event()
+    with pool.checkout() as crew:
+        def blocked(*args, **kwargs):
+            release.wait(10)
+            return canned_plan()
+        monkeypatch.setattr(crew, 'plan_project', blocked)
+    queue = JobQueue(pool, directory=str(tmp_path))
+
+    with pytest.raises(ValueError):
+        queue.submit({'project_type': "x"})
+    with pytest.raises(ValueError):
+        queue.submit(INPUTS, temperature=0.1)
+
+    queue.submit(INPUTS)
+    waiting = queue.submit(INPUTS)
+    assert queue.get(waiting).status == QUEUED
+    queue.shutdown(wait=False)
+    release.set()
+
+    resumed = JobQueue(pool, directory=str(tmp_path))
+    assert resumed.wait(waiting, timeout=10).plan == canned_plan()
+    resumed.shutdown()
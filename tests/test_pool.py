@@ -0,0 +1,44 @@
+"""
+Tests for the warm crew pool
+"""
+
+import pytest
+
+from helper import load_env
+from src.pool import CrewPool
+
+
+load_env()
+
+
+def test_pool_checkout_and_release():
+    """Test that crews are reused and the pool caps concurrent checkouts"""
+    pool = CrewPool(size=1)
+    assert pool.available == 1
+
+    with pool.checkout() as crew:
+        assert pool.available == 0
+        with pytest.raises(TimeoutError):
+            pool.acquire(timeout=0.01)
+
+    assert pool.available == 1
+    with pool.checkout() as same_crew:
+        assert same_crew is crew
+
+
+def test_pool_rejects_foreign_crew():
+    """Test that only pooled crews can be released"""
+    pool = CrewPool(size=1)
+    other = CrewPool(size=1)
+    crew = other.acquire()
+
+    with pytest.raises(ValueError):
+        pool.release(crew)
+
+
+def test_pool_passes_plan_retries():
+    """Test pooled crews use the pool's final-stage retry limit"""
+    pool = CrewPool(size=1, plan_retries=3)
+
+    with pool.checkout() as crew:
+        assert crew.plan_retries == 3
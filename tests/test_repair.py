@@ -0,0 +1,112 @@
+"""
+Tests for local repair of structured plan output
+"""
+
+import json
+
+import pytest
+
+from benchmarks.stub_server import StubLLMServer, canned_plan
+from helper import load_env
+from src.crew import ProjectPlannerCrew
+from src.models import ProjectPlan
+from src.repair import RepairStats, parse_structured_output
+
+
+load_env()
+
+
+INPUTS = {
+    key: "x" for key in ['project_type', 'project_objectives', 'industry',
+                         'team_members', 'project_requirements']
+}
+
+
+def test_valid_json_needs_no_repair():
+    """Test schema-valid output is parsed without repairs"""
+    stats = RepairStats()
+    plan_json = canned_plan().model_dump_json()
+
+    plan, repairs = parse_structured_output(plan_json, stats=stats)
+
+    assert plan == canned_plan()
+    assert repairs == []
+    assert stats.snapshot() == {'parsed': 1}
+
+
+def test_broken_output_is_repaired_and_counted():
+    """Test common small-model mistakes are repaired into a ProjectPlan"""
+    stats = RepairStats()
+    text = (
+        "Here is the plan:\n```json\n"
+        "{'tasks': [{'name': 'Design', 'hours': '1.5 days', "
+        "'required_resources': 'Figma, Designer', 'assignees': None},]}\n```"
+    )
+
+    plan, repairs = parse_structured_output(text, stats=stats)
+
+    task = plan.tasks[0]
+    assert task.task_name == 'Design'
+    assert task.estimated_time_hours == 12.0
+    assert task.required_resources == ['Figma', 'Designer']
+    assert plan.milestones == []
+    assert {'extracted_json', 'single_quotes', 'trailing_commas',
+            'renamed_keys', 'hours_coerced', 'missing_milestones'} <= set(repairs)
+    counts = stats.snapshot()
+    assert counts['repaired'] == 1
+    assert counts['repair.hours_coerced'] == 1
+
+
+def test_compact_and_long_duration_units():
+    """Test compact and long units, compound durations, ranges and thousands separators"""
+    durations = {
+        "2d": 16.0, "1w": 40.0, "30m": 0.5, "1.5 days": 12.0, "3 months": 480.0, "8-12h": 12.0,
+        "1,000 hours": 1000.0, "2 weeks 3 days": 104.0, "30 min - 2 h": 2.0,
+    }
+    tasks = [
+        {"task_name": text, "estimated_time_hours": text, "required_resources": []}
+        for text in durations
+    ]
+
+    plan, repairs = parse_structured_output(json.dumps({"tasks": tasks, "milestones": []}), stats=RepairStats())
+
+    assert [task.estimated_time_hours for task in plan.tasks] == list(durations.values())
+    assert 'hours_coerced' in repairs
+
+
+def test_truncated_output_is_closed():
+    """Test output cut off mid-object still yields the complete tasks"""
+    plan_json = json.dumps(canned_plan(task_count=2).model_dump())
+    truncated = plan_json[:plan_json.index('"milestones"')] + '"milestones": [{"milestone_name": "M1", "tasks": ["Task 1"'
+
+    plan, repairs = parse_structured_output(truncated, stats=RepairStats())
+
+    assert len(plan.tasks) == 2
+    assert plan.milestones[0].tasks == ['Task 1']
+    assert 'closed_brackets' in repairs
+
+
+def test_unrepairable_output_raises_and_counts_failure():
+    """Test output with no plan in it is reported as a failure"""
+    stats = RepairStats()
+
+    with pytest.raises(ValueError):
+        parse_structured_output("I could not produce a plan.", stats=stats)
+
+    assert stats.snapshot() == {'parsed': 1, 'failed': 1}
+
+
+def test_final_stage_repairs_broken_constrained_output(monkeypatch):
+    """Test the crew repairs malformed final JSON without an extra LLM call"""
+    broken = canned_plan().model_dump_json()[:-1] + ',}'
+    with StubLLMServer(structured_response=broken) as server:
+        monkeypatch.setenv('OPENAI_API_BASE', server.base_url)
+        monkeypatch.setenv('OPENAI_API_KEY', 'stub')
+        monkeypatch.setenv('OPENAI_MODEL_NAME', 'stub-model')
+
+        crew = ProjectPlannerCrew(verbose=False)
+        plan = crew.plan_project(INPUTS, use_cache=False)
+
+    assert isinstance(plan, ProjectPlan)
+    assert plan == canned_plan()
+    assert server.requests == 3
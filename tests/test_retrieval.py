@@ -0,0 +1,142 @@
+"""
+Tests for similar-plan retrieval
+"""
+
+import random
+import time
+
+from benchmarks.stub_server import StubLLMServer, canned_plan
+from helper import load_env
+from src.crew import ProjectPlannerCrew
+from src.models import ProjectPlan
+from src.cache import StageCache
+from src.retrieval import SimilarPlanIndex, format_reference
+from src.store import PlanStore
+
+
+load_env()
+
+
+SHOP = {
+    'project_type': "E-commerce Platform",
+    'project_objectives': "Launch an online store with secure payments",
+    'industry': "Retail",
+    'team_members': "- Alice (Developer)",
+    'project_requirements': "- Product catalog\n- Shopping cart\n- Payment gateway\n- Order management",
+}
+
+BLOG = {
+    'project_type': "Business Website",
+    'project_objectives': "Company website with a blog",
+    'industry': "Consulting",
+    'team_members': "- Bob (Designer)",
+    'project_requirements': "- About page\n- Blog\n- Contact form",
+}
+
+
+def small_plan(name: str) -> ProjectPlan:
+    return ProjectPlan(
+        tasks=[{"task_name": name, "estimated_time_hours": 12.0, "required_resources": ["Developer"]}],
+        milestones=[{"milestone_name": "Launch", "tasks": [name]}]
+    )
+
+
+def test_search_ranks_close_variants_first(tmp_path):
+    """Test a reworded request matches its template and loads the plan from the store"""
+    store = PlanStore(str(tmp_path / "plans.db"))
+    store.add(small_plan("Build checkout"), SHOP)
+    store.add(small_plan("Write blog"), BLOG)
+    index = SimilarPlanIndex.from_store(store)
+
+    variant = {**SHOP, 'team_members': "- Carol", 'project_requirements': SHOP['project_requirements'] + "\n- Wishlist"}
+    matches = index.search(variant, k=2)
+
+    assert [match.inputs['project_type'] for match in matches] == ["E-commerce Platform", "Business Website"]
+    assert matches[0].score > 0.8 > matches[1].score
+    assert matches[0].plan == small_plan("Build checkout")
+    assert "- Build checkout (12h)" in format_reference(matches[0])
+    store.close()
+
+
+def test_plans_in_memory_are_bounded(tmp_path):
+    """Test an index with a store loads plans from it and one without keeps only recent plans"""
+    store = PlanStore(str(tmp_path / "plans.db"))
+    checkout = small_plan("Build checkout")
+    store.add(checkout, SHOP)
+    backed = SimilarPlanIndex(store=store)
+    backed.add(SHOP, checkout)
+
+    loaded = backed.best(SHOP).plan
+    assert loaded == checkout and loaded is not checkout
+    store.close()
+
+    index = SimilarPlanIndex(max_plans=2)
+    index.add(SHOP, small_plan("Build checkout"))
+    index.add(BLOG, small_plan("Write blog"))
+    assert index.best(SHOP).plan == small_plan("Build checkout")
+
+    shop_ops = {**SHOP, 'project_type': "Inventory System", 'industry': "Logistics"}
+    index.add(shop_ops, small_plan("Track stock"))
+    # The blog plan was used least recently, so it was dropped; its entry still matches
+    assert len(index) == 3
+    assert index.best(BLOG).plan is None
+    assert index.best(SHOP).plan == small_plan("Build checkout")
+    assert index.best(shop_ops).plan == small_plan("Track stock")
+
+
+def test_search_is_fast_on_large_index():
+    """Test top-k lookups over tens of thousands of indexed plans take milliseconds"""
+    rng = random.Random(7)
+    vocabulary = [f"feature{i}" for i in range(2000)]
+    index = SimilarPlanIndex()
+    index.add_many(
+        ({**SHOP, 'project_requirements': "\n".join(f"- {word}" for word in rng.sample(vocabulary, 12))}, None)
+        for _ in range(20000)
+    )
+    query = {**SHOP, 'project_requirements': "\n".join(f"- {word}" for word in rng.sample(vocabulary, 12))}
+
+    started = time.perf_counter()
+    matches = index.search(query, k=5)
+    elapsed = time.perf_counter() - started
+
+    assert len(matches) == 5
+    assert elapsed < 0.2, f"search took {elapsed * 1000:.1f} ms"
+
+
+def test_crew_reuses_or_references_similar_plans(monkeypatch, tmp_path):
+    """Test near-identical requests for the same team are reused and others are re-planned"""
+    with StubLLMServer() as server:
+        monkeypatch.setenv('OPENAI_API_BASE', server.base_url)
+        monkeypatch.setenv('OPENAI_API_KEY', 'stub')
+        monkeypatch.setenv('OPENAI_MODEL_NAME', 'stub-model')
+
+        index = SimilarPlanIndex()
+        index.add(SHOP, small_plan("Build checkout"))
+        crew = ProjectPlannerCrew(
+            verbose=False,
+            similar_plans=index,
+            reuse_threshold=0.9,
+            stage_cache=StageCache(str(tmp_path))
+        )
+
+        reworded = {**SHOP, 'project_objectives': SHOP['project_objectives'] + "!"}
+        reused = crew.plan_project(reworded)
+        assert reused == small_plan("Build checkout")
+        assert crew.last_result_cached and server.requests == 0
+
+        related = {**SHOP, 'project_requirements': "- Product catalog\n- Shopping cart\n- Gift cards"}
+        plan = crew.plan_project(related)
+        assert plan == canned_plan() and server.requests == 3
+        assert 0.35 <= crew.last_similar_plan.score < 0.9
+        assert "- Build checkout (12h)" in crew.tasks[0].description
+
+        # Another team gets the breakdown from the stage cache and a fresh
+        # estimation and allocation instead of the other team's plan
+        other_team = {**related, 'team_members': "- Carol"}
+        plan = crew.plan_project(other_team)
+        assert plan == canned_plan() and not crew.last_result_cached
+        assert crew.last_similar_plan.score >= 0.9
+        assert crew.reused_stages == 1 and server.requests == 5
+
+    # New plans are indexed for later requests
+    assert len(index) == 3 and index.best(related).plan == canned_plan()
@@ -0,0 +1,82 @@
+"""
+Tests for multi-endpoint LLM routing
+"""
+
+import os
+
+from benchmarks.stub_server import StubLLMServer, canned_plan
+from helper import load_env
+from src.crew import ProjectPlannerCrew
+from src.routing import EndpointRouter, parse_endpoints
+
+
+load_env()
+
+
+INPUTS = {
+    key: "x" for key in ['project_type', 'project_objectives', 'industry',
+                         'team_members', 'project_requirements']
+}
+
+# Nothing listens on the discard port
+DEAD_ENDPOINT = "http://127.0.0.1:9/v1"
+
+
+def test_parse_endpoints():
+    """Test comma/space separated URLs are normalized and deduplicated"""
+    assert parse_endpoints(" http://a/v1/, http://b/v1 http://a/v1 ") == ["http://a/v1", "http://b/v1"]
+    assert parse_endpoints(None) == []
+
+
+def test_load_env_uses_first_parsed_endpoint(monkeypatch):
+    """Test the default base URL is the router's first endpoint"""
+    monkeypatch.delenv('OPENAI_API_BASE', raising=False)
+    monkeypatch.setenv('OPENAI_API_BASES', "http://a/v1/, http://b/v1, http://a/v1")
+
+    load_env()
+
+    assert os.environ['OPENAI_API_BASE'] == "http://a/v1"
+    assert [endpoint.base_url for endpoint in EndpointRouter.from_env().endpoints] == ["http://a/v1", "http://b/v1"]
+
+
+def test_acquire_picks_least_outstanding_healthy_endpoint():
+    """Test dispatch prefers healthy endpoints with the fewest requests in flight"""
+    router = EndpointRouter(["http://a/v1", "http://b/v1", "http://c/v1"], model="m", api_key="k")
+    a, b, c = router.endpoints
+    c.healthy = False
+
+    assert router.acquire() is a
+    assert router.acquire() is b
+    assert router.acquire() is a
+    router.release(b, 0.1)
+    assert router.acquire() is b
+    # Unhealthy endpoints are only used once every other one has failed
+    assert router.acquire(exclude=[a, b]) is c
+
+
+def test_failover_when_endpoint_is_down(monkeypatch):
+    """Test requests move to a live endpoint and stats record the failure"""
+    monkeypatch.setenv('OPENAI_API_KEY', 'stub')
+    monkeypatch.setenv('OPENAI_MODEL_NAME', 'stub-model')
+    with StubLLMServer() as server:
+        monkeypatch.setenv('OPENAI_API_BASE', server.base_url)
+        # No health check has run, so the dead endpoint is tried first
+        router = EndpointRouter([DEAD_ENDPOINT, server.base_url])
+        crew = ProjectPlannerCrew(verbose=False, llm_factory=router.llm_factory())
+        plan = crew.plan_project(INPUTS, use_cache=False)
+
+    assert plan == canned_plan()
+    dead, live = router.stats()
+    assert not dead['healthy'] and dead['failures'] == 1
+    assert live['healthy'] and live['requests'] == server.requests == 3
+    assert live['latency']['p50'] > 0
+    assert crew.get_usage_metrics()['successful_requests'] == 3
+
+
+def test_health_check_marks_dead_endpoints():
+    """Test the health check probes each endpoint's /models route"""
+    with StubLLMServer() as server:
+        router = EndpointRouter([server.base_url, DEAD_ENDPOINT], model="m", api_key="k")
+        router.check_health()
+
+    assert [stats['healthy'] for stats in router.stats()] == [True, False]
@@ -0,0 +1,81 @@
+"""
+Tests for the dependency- and resource-aware scheduler
+"""
+
+from src.models import ProjectPlan
+from src.scheduler import schedule_plan
+
+
+def make_plan(*tasks) -> ProjectPlan:
+    return ProjectPlan(
+        tasks=[
+            {
+                "task_name": name,
+                "estimated_time_hours": hours,
+                "required_resources": ["Developer"],
+                "dependencies": deps,
+                "assignees": assignees,
+            }
+            for name, hours, deps, assignees in tasks
+        ],
+        milestones=[]
+    )
+
+
+def test_independent_tasks_run_in_parallel():
+    """Test tasks without shared people or dependencies overlap"""
+    plan = make_plan(
+        ("Design", 8, [], ["Bob"]),
+        ("Backend", 16, [], ["Jane"]),
+        ("Integrate", 4, ["Design", "Backend"], ["Jane"]),
+    )
+
+    schedule = schedule_plan(plan)
+    by_name = {task.task_name: task for task in schedule.tasks}
+
+    assert schedule.makespan_hours == 20
+    assert by_name["Integrate"].start == 16
+    assert by_name["Design"].slack == 8
+    assert schedule.critical_path == ["Backend", "Integrate"]
+
+
+def test_shared_assignee_serializes_work():
+    """Test one person cannot work on two tasks at the same time"""
+    plan = make_plan(
+        ("A", 5, [], ["Bob"]),
+        ("B", 5, [], ["Bob"]),
+    )
+
+    assert schedule_plan(plan).makespan_hours == 10
+    assert schedule_plan(plan, resource_constrained=False).makespan_hours == 5
+
+
+def test_unknown_dependencies_and_cycles_are_reported():
+    """Test bad dependency data degrades gracefully"""
+    plan = make_plan(
+        ("A", 1, ["Missing"], ["Bob"]),
+        ("B", 1, ["C"], ["Jane"]),
+        ("C", 1, ["B"], ["Alice"]),
+    )
+
+    schedule = schedule_plan(plan)
+
+    assert schedule.unresolved_dependencies == {"A": ["Missing"]}
+    assert schedule.cyclic_tasks == ["B", "C"]
+    assert len(schedule.tasks) == 3
+
+
+def test_invalid_estimates_count_as_zero_hours():
+    """Test NaN, infinite and negative estimates don't poison the timeline"""
+    plan = make_plan(
+        ("A", float('nan'), [], ["Bob"]),
+        ("B", float('inf'), ["A"], ["Bob"]),
+        ("C", -2, ["B"], ["Jane"]),
+        ("D", 3, ["C"], ["Jane"]),
+    )
+
+    schedule = schedule_plan(plan)
+
+    assert [task.duration for task in schedule.tasks] == [0.0, 0.0, 0.0, 3.0]
+    assert schedule.makespan_hours == 3
+    assert schedule.critical_path == ["A", "B", "C", "D"]
@@ -0,0 +1,86 @@
+"""
+Tests for the SQLite plan store
+"""
+
+import time
+
+from src.models import ProjectPlan
+from src.store import PlanStore, hash_inputs
+
+
+def make_plan(hours: float, resource: str = "Developer") -> ProjectPlan:
+    return ProjectPlan(
+        tasks=[
+            {"task_name": "Build", "estimated_time_hours": hours, "required_resources": [resource]},
+            {"task_name": "Test", "estimated_time_hours": 10.0, "required_resources": ["QA"],
+             "dependencies": ["Build"]},
+        ],
+        milestones=[{"milestone_name": "Launch", "tasks": ["Build", "Test"]}]
+    )
+
+
+def make_inputs(project_type: str = "Website", industry: str = "Retail") -> dict:
+    return {
+        'project_type': project_type,
+        'project_objectives': "Sell online",
+        'industry': industry,
+        'team_members': "- Dev",
+        'project_requirements': "- Cart",
+    }
+
+
+def test_round_trip_and_history(tmp_path):
+    """Test plans are kept (not overwritten) and reload unchanged"""
+    with PlanStore(str(tmp_path / "plans.db")) as store:
+        first = store.add(make_plan(40), make_inputs(), created_at=1.0)
+        second = store.add(make_plan(80), make_inputs(), created_at=2.0)
+
+    with PlanStore(str(tmp_path / "plans.db")) as store:
+        assert store.get(first) == make_plan(40)
+        assert store.latest(make_inputs()) == make_plan(80)
+        assert store.inputs(second) == make_inputs()
+        assert [row.plan_id for row in store.query()] == [second, first]
+        assert store.get(999) is None
+
+        assert store.delete(first)
+        assert store.count() == 1
+
+
+def test_query_filters(tmp_path):
+    """Test filtering by type, industry, hours, time, resource and input hash"""
+    store = PlanStore(str(tmp_path / "plans.db"))
+    store.add_many([
+        (make_plan(600), make_inputs(industry="Retail")),
+        (make_plan(100), make_inputs(industry="retail")),
+        (make_plan(900, resource="Designer"), make_inputs("Mobile App", "Finance")),
+    ], created_at=100.0)
+
+    big_retail = store.query(industry="Retail", min_hours=500)
+    assert [(row.industry, row.total_hours, row.task_count) for row in big_retail] == [("Retail", 610.0, 2)]
+    assert store.count(industry="RETAIL") == 2
+    assert store.count(project_type="Mobile App", max_hours=1000) == 1
+    assert store.count(resource="designer") == 1
+    assert store.count(since=100.0) == 3 and store.count(until=100.0) == 0
+    assert store.count(input_hash=hash_inputs(make_inputs("Mobile App", "Finance"))) == 1
+    store.close()
+
+
+def test_queries_stay_fast_on_large_history(tmp_path):
+    """Test indexed queries over tens of thousands of plans answer in milliseconds"""
+    store = PlanStore(str(tmp_path / "plans.db"))
+    industries = ["Retail", "Finance", "Health", "Education", "Media"]
+    store.add_many(
+        (make_plan(float(i % 1000)), make_inputs(f"Type {i % 20}", industries[i % 5]))
+        for i in range(20000)
+    )
+
+    started = time.perf_counter()
+    rows = store.query(industry="Retail", min_hours=500, limit=50)
+    count = store.count(industry="Retail", min_hours=500)
+    elapsed = time.perf_counter() - started
+
+    assert len(rows) == 50
+    # Total hours are (i % 1000) + 10, so Retail plans from i % 1000 == 490 up
+    assert count == 2040
+    assert elapsed < 0.1, f"queries took {elapsed * 1000:.1f} ms"
+    store.close()
@@ -0,0 +1,119 @@
+"""
+Tests for referential validation and local repair of generated plans
+"""
+
+from crewai import Crew
+
+from helper import load_env
+from src.crew import ProjectPlannerCrew
+from src.models import ProjectPlan
+from src.repair import RepairStats
+from src.validation import (
+    CATCH_ALL_MILESTONE,
+    DUPLICATE_TASK,
+    INVALID_HOURS,
+    NO_RESOURCES,
+    NO_TASKS,
+    UNASSIGNED_RESOURCE,
+    UNASSIGNED_TASK,
+    UNKNOWN_MILESTONE_TASK,
+    repair_plan,
+    validate_plan,
+)
+
+
+load_env()
+
+
+BROKEN = ProjectPlan(
+    tasks=[
+        {"task_name": "Design homepage", "estimated_time_hours": 8, "required_resources": ["Designer"]},
+        {"task_name": "Build API", "estimated_time_hours": 0, "required_resources": ["Developer"]},
+        {"task_name": "Write docs", "estimated_time_hours": -3, "required_resources": [],
+         "assignees": ["Ann"]},
+        {"task_name": "Deploy", "estimated_time_hours": 2, "required_resources": ["DevOps"]},
+    ],
+    milestones=[
+        {"milestone_name": "MVP", "tasks": ["design Homepage", "Build APIs", "Launch party"]},
+    ]
+)
+
+
+def test_validate_reports_every_issue():
+    """Test one pass finds unknown references, orphans, bad hours and missing resources"""
+    report = validate_plan(BROKEN)
+
+    assert not report.ok
+    assert report.counts() == {
+        UNKNOWN_MILESTONE_TASK: 3,
+        UNASSIGNED_TASK: 4,
+        INVALID_HOURS: 2,
+        NO_RESOURCES: 1,
+    }
+    assert report.issues[0].milestone_name == "MVP"
+    assert validate_plan(BROKEN, max_hours=5).counts()[INVALID_HOURS] == 3
+
+
+def test_repair_fixes_plan_deterministically():
+    """Test fuzzy matching, the catch-all milestone and clamped hours"""
+    stats = RepairStats()
+    result = repair_plan(BROKEN, stats=stats)
+    plan = result.plan
+
+    assert not result.needs_rerun
+    assert plan.milestones[0].tasks == ["Design homepage", "Build API"]
+    assert plan.milestones[1].milestone_name == CATCH_ALL_MILESTONE
+    assert plan.milestones[1].tasks == ["Write docs", "Deploy"]
+    assert [task.estimated_time_hours for task in plan.tasks] == [8, 0.5, 0.5, 2]
+    assert plan.tasks[2].required_resources == ["Ann"]
+    assert result.repairs == [
+        'matched_milestone_tasks', 'dropped_unknown_tasks', 'catch_all_milestone',
+        'clamped_hours', 'resources_from_assignees',
+    ]
+    assert repair_plan(plan, stats=stats).plan is plan
+    assert BROKEN.tasks[1].estimated_time_hours == 0
+    assert stats.snapshot()['repaired'] == 1
+
+    duplicated = ProjectPlan(
+        tasks=[
+            {"task_name": "Test", "estimated_time_hours": 1, "required_resources": ["QA"]},
+            {"task_name": "Test", "estimated_time_hours": float('inf'), "required_resources": []},
+        ],
+        milestones=[{"milestone_name": "Release", "tasks": ["Test"]}]
+    )
+    assert validate_plan(duplicated).counts() == {DUPLICATE_TASK: 1, INVALID_HOURS: 1, NO_RESOURCES: 1}
+    fixed = repair_plan(duplicated, stats=stats)
+    assert not fixed.needs_rerun
+    assert [task.task_name for task in fixed.plan.tasks] == ["Test", "Test (2)"]
+    assert fixed.plan.tasks[1].estimated_time_hours == 0.5
+    assert fixed.plan.tasks[1].required_resources == [UNASSIGNED_RESOURCE]
+
+    unfixable = repair_plan(ProjectPlan(tasks=[], milestones=[]), stats=stats)
+    assert unfixable.needs_rerun
+    assert unfixable.report.counts() == {NO_TASKS: 1}
+    assert stats.snapshot()['failed'] == 1
+
+
+def test_crew_reruns_final_stage_only_when_repair_fails(monkeypatch):
+    """Test the crew re-runs just the final stage for plans repair cannot fix"""
+    crew = ProjectPlannerCrew(verbose=False)
+    unfixable = ProjectPlan(tasks=[], milestones=[])
+    plans = [unfixable, BROKEN]
+    runs = []
+
+    def fake_kickoff(self, inputs):
+        runs.append(len(self.tasks))
+        return type("Result", (), {"pydantic": plans.pop(0)})()
+
+    monkeypatch.setattr(Crew, "kickoff", fake_kickoff)
+    plan = crew.plan_project({
+        'project_type': "Website",
+        'project_objectives': "Launch a store",
+        'industry': "Retail",
+        'team_members': "Alice (Developer)",
+        'project_requirements': "Checkout and catalog",
+    })
+
+    assert runs == [3, 1]
+    assert validate_plan(plan).ok
+    assert 'catch_all_milestone' in crew.last_plan_repairs
@@ -0,0 +1,61 @@
+"""
+Tests for memoized plan views
+"""
+
+import json
+
+from src.gantt import milestone_rows, milestone_task_rows
+from src.models import ProjectPlan
+from src.views import ViewCache, plan_hash
+
+
+def make_plan(hours: float = 8.0) -> ProjectPlan:
+    return ProjectPlan(
+        tasks=[{"task_name": "Design", "estimated_time_hours": hours, "required_resources": ["Designer"]}],
+        milestones=[{"milestone_name": "MVP", "tasks": ["Design"]}]
+    )
+
+
+def test_views_are_built_once_per_plan():
+    """Test reruns with an unchanged plan reuse its derived artifacts"""
+    cache = ViewCache()
+    views = cache.views(make_plan())
+    built = []
+
+    assert views.get('chart', lambda: built.append(1) or "figure") == "figure"
+    assert cache.views(make_plan()).get('chart', lambda: built.append(1) or "other") == "figure"
+    assert built == [1]
+    assert json.loads(views.json_bytes)['tasks'][0]['task_name'] == "Design"
+    assert views.csv_bytes.startswith(b"task_name,estimated_time_hours")
+    assert views.schedule is cache.views(make_plan()).schedule
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_timelines_share_one_start_date():
+    """Test milestone bars and drill-down rows built on later reruns line up"""
+    cache = ViewCache()
+    views = cache.views(make_plan())
+    bars = milestone_rows(views.schedule, views.frame, views.start_date)
+
+    rerun = cache.views(make_plan())
+    rows = milestone_task_rows(rerun.schedule, rerun.frame, 0, rerun.start_date)
+
+    assert rerun.start_date == views.start_date
+    assert rows['Start'].iloc[0] == bars['Start'].iloc[0]
+    assert rows['Finish'].iloc[0] == bars['Finish'].iloc[0]
+
+
+def test_cache_is_bounded_and_invalidated():
+    """Test least recently viewed plans are dropped and discard forgets a plan"""
+    cache = ViewCache(max_entries=2)
+    first = cache.views(make_plan(1))
+    cache.views(make_plan(2))
+    cache.views(make_plan(1))
+    cache.views(make_plan(3))
+
+    assert len(cache) == 2
+    assert cache.views(make_plan(1)) is first
+    assert plan_hash(make_plan(1)) != plan_hash(make_plan(2))
+
+    cache.discard(first.key)
+    assert cache.views(make_plan(1)) is not first